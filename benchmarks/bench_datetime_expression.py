@@ -0,0 +1,49 @@
+"""
+Benchmark for resolving a date phrase against many anchor dates
+
+Compares calling extract_datetime() once per anchor with parsing the phrase
+once through extract_datetime_expression() and resolving the expression
+against all of the anchors.
+
+Usage:
+    python -m benchmarks.bench_datetime_expression [-a ANCHORS]
+"""
+import argparse
+from datetime import datetime, timedelta
+from timeit import repeat
+
+import lingua_franca
+from lingua_franca.parse import extract_datetime, extract_datetime_expression
+from lingua_franca.time import default_timezone
+
+PHRASES = ["next friday at 5pm",
+           "remind me to call mom in 3 days",
+           "what is the weather tomorrow morning",
+           "set an alarm for 7:30",
+           "schedule a meeting on june 5 2019 at 3 in the afternoon"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-a", "--anchors", type=int, default=1000,
+                        help="number of anchor dates, 37 minutes apart")
+    args = parser.parse_args()
+
+    lingua_franca.load_language("en")
+    start = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+    anchors = [start + timedelta(minutes=37 * i) for i in range(args.anchors)]
+
+    print("{:<58}{:>12}{:>12}".format("phrase", "parse (ms)", "ir (ms)"))
+    for text in PHRASES:
+        t_parse = min(repeat(
+            lambda: [extract_datetime(text, anchor) for anchor in anchors],
+            number=1, repeat=3))
+        t_ir = min(repeat(
+            lambda: extract_datetime_expression(text).resolve_many(anchors),
+            number=1, repeat=3))
+        print("{:<58}{:>12.1f}{:>12.1f}".format(text, t_parse * 1000,
+                                                t_ir * 1000))
+
+
+if __name__ == "__main__":
+    main()
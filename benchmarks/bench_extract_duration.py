@@ -0,0 +1,61 @@
+"""
+Throughput of extract_duration across languages
+
+Times the phrases a timer skill hears in each of the languages whose
+extract_duration looks for all of the time units with one regex.
+
+Usage:
+    python -m benchmarks.bench_extract_duration [-n NUMBER] [-l LANG ...]
+"""
+import argparse
+from timeit import repeat
+
+import lingua_franca
+from lingua_franca.parse import extract_duration
+
+CASES = {
+    "en": ["set a timer for 5 minutes",
+           "remind me in 2 hours and 30 minutes",
+           "wait for 1 day 3 hours 10 minutes and 5 seconds",
+           "what is the weather like"],
+    "ru": ["поставь таймер на 5 минут",
+           "напомни через 2 часа 30 минут",
+           "какая сегодня погода"],
+    "uk": ["постав таймер на 5 хвилин",
+           "нагадай через 2 години 30 хвилин",
+           "яка сьогодні погода"],
+    "cs": ["nastav časovač na 5 minut",
+           "připomeň mi to za 2 hodiny a 30 minut",
+           "jaké je počasí"],
+    "pl": ["ustaw minutnik na 5 minut",
+           "przypomnij mi za 2 godziny i 30 minut",
+           "jaka jest pogoda"],
+    "az": ["5 dəqiqəlik taymer qur",
+           "2 saat 30 dəqiqə sonra xatırlat",
+           "hava necədir"],
+}
+
+
+def best_per_call(func, number, repeats=5):
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=2000,
+                        help="calls per timing run")
+    parser.add_argument("-l", "--lang", nargs="+", default=list(CASES),
+                        choices=list(CASES), help="languages to time")
+    args = parser.parse_args()
+
+    lingua_franca.load_languages(args.lang)
+    print("{:<6}{:<52}{:>14}".format("lang", "phrase", "per call (us)"))
+    for lang in args.lang:
+        for text in CASES[lang]:
+            per_call = best_per_call(lambda: extract_duration(text, lang),
+                                     args.number)
+            print("{:<6}{:<52}{:>14.1f}".format(lang, text, per_call * 1e6))
+
+
+if __name__ == "__main__":
+    main()
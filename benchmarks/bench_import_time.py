@@ -0,0 +1,73 @@
+"""
+Import time report for lingua_franca
+
+Imports lingua_franca.parse and lingua_franca.format in a fresh interpreter
+under `python -X importtime`, with the given languages loaded eagerly and
+with config.lazy_load_langs, and prints the totals and the slowest imports.
+
+Usage:
+    python -m benchmarks.bench_import_time [-l LANG ...] [-t TOP]
+"""
+import argparse
+import subprocess
+import sys
+
+from lingua_franca.internal import get_supported_langs
+
+_SCRIPT = """
+from time import perf_counter
+from lingua_franca import config
+config.ovos_defaults = False
+config.lazy_load_langs = {lazy}
+import lingua_franca, lingua_franca.parse, lingua_franca.format
+start = perf_counter()
+lingua_franca.load_languages({langs!r})
+print((perf_counter() - start) * 1000)
+"""
+
+
+def import_report(langs, lazy):
+    """ Returns the time spent in load_languages() (ms), and a list of
+        (self_us, cumulative_us, module) as reported by -X importtime
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         _SCRIPT.format(lazy=lazy, langs=list(langs))],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        imports.append((int(self_us), int(cumulative_us), module.strip()))
+    return float(proc.stdout), imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-l", "--lang", nargs="+",
+                        default=list(get_supported_langs()),
+                        help="languages to load")
+    parser.add_argument("-t", "--top", type=int, default=10,
+                        help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    print("{:<8}{:>14}{:>14}{:>10}".format(
+        "mode", "imports (ms)", "loading (ms)", "modules"))
+    reports = {}
+    for lazy in (False, True):
+        load_ms, imports = import_report(args.lang, lazy)
+        mode = "lazy" if lazy else "eager"
+        reports[mode] = imports
+        print("{:<8}{:>14.1f}{:>14.1f}{:>10}".format(
+            mode, sum(i[0] for i in imports) / 1000, load_ms, len(imports)))
+
+    for mode, imports in reports.items():
+        print("\nslowest imports, {} (self ms):".format(mode))
+        for self_us, _, module in sorted(imports, reverse=True)[:args.top]:
+            print("{:>10.1f}  {}".format(self_us / 1000, module))
+
+
+if __name__ == "__main__":
+    main()
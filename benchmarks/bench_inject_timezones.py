@@ -0,0 +1,58 @@
+"""
+Cost of config.inject_timezones on calls to localized functions
+
+Times calls that take no datetime, such as extract_number or normalize,
+and calls that take a naive datetime, such as nice_time, with
+config.inject_timezones on and off.
+
+Usage:
+    python -m benchmarks.bench_inject_timezones [-n NUMBER]
+"""
+import argparse
+from datetime import datetime
+from timeit import repeat
+
+import lingua_franca
+from lingua_franca import config, parse, format
+
+NAIVE = datetime(2017, 6, 27, 13, 4)
+
+CASES = [
+    # (label, call)
+    ("extract_number", lambda: parse.extract_number("seven")),
+    ("is_fractional", lambda: parse.is_fractional("half")),
+    ("normalize", lambda: parse.normalize("it's two o'clock")),
+    ("nice_number", lambda: format.nice_number(5.5, speech=False)),
+    ("pronounce_number", lambda: format.pronounce_number(7)),
+    ("nice_time(naive)", lambda: format.nice_time(NAIVE)),
+    ("nice_date(naive)", lambda: format.nice_date(NAIVE, now=NAIVE)),
+]
+
+
+def best_per_call(func, number, repeats=5):
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=20000,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    lingua_franca.load_language("en")
+
+    print("{:<20}{:>12}{:>12}{:>14}".format("function", "off (us)",
+                                            "on (us)", "overhead (us)"))
+    for label, call in CASES:
+        timings = [float("inf"), float("inf")]
+        for inject in (False, True, False, True):
+            config.inject_timezones = inject
+            timings[inject] = min(timings[inject],
+                                  best_per_call(call, args.number) * 1e6)
+        config.inject_timezones = True
+        print("{:<20}{:>12.2f}{:>12.2f}{:>14.2f}".format(
+            label, timings[0], timings[1], timings[1] - timings[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Microbenchmark for the @localized_function dispatcher
+
+Compares calling a top-level function, such as
+lingua_franca.parse.is_ordinal, with calling its localized implementation,
+lingua_franca.lang.parse_en.is_ordinal_en, directly. The difference is the
+per-call overhead added by the dispatcher. The last column is the wrapped
+call again, with config.instrument_localized_functions set.
+
+Usage:
+    python -m benchmarks.bench_localized_function [-n NUMBER]
+"""
+import argparse
+from timeit import repeat
+
+import lingua_franca
+from lingua_franca import config, parse, format
+from lingua_franca.lang import parse_en, parse_de, format_en
+
+CASES = [
+    # (label, dispatched call, direct call)
+    ("is_ordinal",
+     lambda: parse.is_ordinal("dritte", lang="de"),
+     lambda: parse_de.is_ordinal_de("dritte")),
+    ("is_fractional",
+     lambda: parse.is_fractional("half"),
+     lambda: parse_en.is_fractional_en("half")),
+    ("extract_number",
+     lambda: parse.extract_number("seven"),
+     lambda: parse_en.extract_number_en("seven")),
+    ("pronounce_number",
+     lambda: format.pronounce_number(7, lang="en-us"),
+     lambda: format_en.pronounce_number_en(7)),
+    ("nice_number",
+     lambda: format.nice_number(5.5, lang="en", speech=False),
+     lambda: format_en.nice_number_en(5.5, speech=False)),
+]
+
+
+def best_per_call(func, number, repeats=5):
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=20000,
+                        help="calls per timing run")
+    args = parser.parse_args()
+
+    lingua_franca.load_languages(["en", "de"])
+
+    print("{:<20}{:>14}{:>14}{:>14}{:>18}".format(
+        "function", "direct (us)", "wrapped (us)", "overhead (us)",
+        "instrumented (us)"))
+    for label, wrapped, direct in CASES:
+        t_direct = best_per_call(direct, args.number) * 1e6
+        t_wrapped = best_per_call(wrapped, args.number) * 1e6
+        config.instrument_localized_functions = True
+        t_instrumented = best_per_call(wrapped, args.number) * 1e6
+        config.instrument_localized_functions = False
+        print("{:<20}{:>14.2f}{:>14.2f}{:>14.2f}{:>18.2f}".format(
+            label, t_direct, t_wrapped, t_wrapped - t_direct,
+            t_instrumented))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for spelling out years with the date_time.json rules
+
+For every locale in lingua_franca/res/text with a date_time.json, times
+rendering a year from the compiled rules, as the first call for that year
+does, and the calls after it, which are served from the table of rendered
+years. nice_year(), nice_date() and nice_date_time() fall back to these rules
+in the languages without their own nice_year.
+
+Usage:
+    python -m benchmarks.bench_nice_year [-y FIRST LAST]
+"""
+import argparse
+import glob
+import os
+from datetime import datetime
+from timeit import repeat
+
+from lingua_franca.format import date_time_format
+
+
+def locales():
+    pattern = os.path.join(date_time_format.config_path, "*",
+                           "date_time.json")
+    return sorted(os.path.basename(os.path.dirname(path))
+                  for path in glob.glob(pattern))
+
+
+def best(func, repeats=3):
+    return min(repeat(func, number=1, repeat=repeats))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-y", "--years", type=int, nargs=2,
+                        default=(1, 3000), metavar=("FIRST", "LAST"),
+                        help="range of years to spell out")
+    args = parser.parse_args()
+
+    years = [datetime(year, 1, 1) for year in range(args.years[0],
+                                                    args.years[1] + 1)]
+    print("{:<8}{:>14}{:>14}".format("locale", "render (us)", "cached (us)"))
+    for locale in locales():
+        date_time_format.cache(locale)
+
+        def render():
+            for dt in years:
+                date_time_format._render_year(dt.year, locale, False)
+
+        def cached():
+            for dt in years:
+                date_time_format.year_format(dt, locale, False)
+
+        cached()  # fill the table
+        print("{:<8}{:>14.2f}{:>14.2f}".format(
+            locale, best(render) / len(years) * 1e6,
+            best(cached) / len(years) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for pronounce_number_xx
+
+Sweeps the integers 0..1e6 through a localized pronounce_number, once
+without its LRU cache and once through it, and then times a TTS-like
+workload that keeps hitting small numbers.
+
+Usage:
+    python -m benchmarks.bench_pronounce_number [-l LANG ...] [-s STEP]
+"""
+import argparse
+from importlib import import_module
+from time import perf_counter
+from timeit import repeat
+
+
+def sweep(func, numbers):
+    start = perf_counter()
+    for n in numbers:
+        func(n)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-l", "--lang", nargs="+", default=["en"],
+                        help="languages to benchmark")
+    parser.add_argument("-s", "--step", type=int, default=1,
+                        help="step of the 0..1e6 sweep")
+    parser.add_argument("-n", "--number", type=int, default=20,
+                        help="repetitions of the small number workload")
+    args = parser.parse_args()
+
+    numbers = range(0, 1000001, args.step)
+    small = list(range(0, 101)) * 10
+
+    print("{:<6}{:>16}{:>16}{:>16}{:>16}".format(
+        "lang", "uncached (s)", "cold LRU (s)", "small (us)",
+        "small LRU (us)"))
+    for lang in args.lang:
+        module = import_module("lingua_franca.lang.format_" + lang)
+        cached = getattr(module, "pronounce_number_" + lang)
+        uncached = cached.__wrapped__
+
+        cached.cache_clear()
+        t_uncached = sweep(uncached, numbers)
+        cached.cache_clear()
+        t_cold = sweep(cached, numbers)
+
+        t_small = min(repeat(lambda: sweep(uncached, small),
+                             number=args.number, repeat=3))
+        t_small_lru = min(repeat(lambda: sweep(cached, small),
+                                 number=args.number, repeat=3))
+        per_call = 1e6 / (args.number * len(small))
+        print("{:<6}{:>16.2f}{:>16.2f}{:>16.2f}{:>16.2f}".format(
+            lang, t_uncached, t_cold, t_small * per_call,
+            t_small_lru * per_call))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Throughput of the timezone helpers of lingua_franca.time
+
+to_local() runs on every naive datetime passed to a localized function,
+while config.inject_timezones is set, and now_local() wherever an anchor
+date defaults to the current time.
+
+Usage:
+    python -m benchmarks.bench_timezones [-n NUMBER] [-z TIMEZONE]
+"""
+import argparse
+from datetime import datetime
+from timeit import repeat
+
+from dateutil.tz import gettz
+
+from lingua_franca.time import to_local, now_local, to_utc, now_utc, \
+    default_timezone, set_default_tz
+
+
+def cases():
+    naive = datetime(2017, 6, 27, 13, 4)
+    local = now_local()
+    utc = now_utc()
+    return [
+        # (label, call)
+        ("to_local(naive)", lambda: to_local(naive)),
+        ("to_local(local)", lambda: to_local(local)),
+        ("to_local(utc)", lambda: to_local(utc)),
+        ("now_local()", now_local),
+        ("to_utc(naive)", lambda: to_utc(naive)),
+        ("now_utc()", now_utc),
+        ("default_timezone()", default_timezone),
+    ]
+
+
+def best_per_call(func, number, repeats=5):
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-n", "--number", type=int, default=20000,
+                        help="calls per timing run")
+    parser.add_argument("-z", "--timezone", default=None,
+                        help="default timezone, e.g. Europe/Lisbon; the "
+                             "system timezone if omitted")
+    args = parser.parse_args()
+
+    if args.timezone:
+        if gettz(args.timezone) is None:
+            parser.error("unknown timezone " + args.timezone)
+        set_default_tz(args.timezone)
+
+    print("default timezone: {}".format(default_timezone()))
+    print("{:<22}{:>14}{:>16}".format("function", "per call (us)",
+                                      "calls per sec"))
+    for label, call in cases():
+        per_call = best_per_call(call, args.number)
+        print("{:<22}{:>14.2f}{:>16,.0f}".format(label, per_call * 1e6,
+                                                 1 / per_call))
+
+
+if __name__ == "__main__":
+    main()
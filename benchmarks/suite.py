@@ -0,0 +1,433 @@
+"""
+Benchmark suite for every registered function in every supported language
+
+The inputs are mined from the calls in test/unittests/test_parse*.py and
+test_format*.py whose arguments can be evaluated outside of the test: literals,
+datetime and timedelta constructors and the local variables assigned from
+them. The date_time_test.json fixtures add the inputs of nice_date,
+nice_date_time and nice_year. Format inputs without any text, such as a
+number or a date, are also used for the languages that have none of their
+own. Every parse and format function in _REGISTERED_FUNCTIONS is timed, in
+every language of _SUPPORTED_LANGUAGES, over the inputs found for it.
+
+For each function and language, `run` reports:
+    ops/s     calls per second over all of the timed calls
+    p50, p99  latency percentiles of a single call, in microseconds
+    blocks, B memory blocks and bytes allocated per call and still held
+              after it, from a tracemalloc snapshot diff over the timed calls
+    peak KiB  the most memory a call had allocated at once (tracemalloc),
+              the average over the inputs
+
+`run -o FILE` saves the results as a JSON baseline. `compare` lists the
+functions whose p50, bytes per call or peak memory grew by more than a
+threshold between two baselines, and exits with status 1 if any did.
+
+Usage:
+    python -m benchmarks.suite run [-l LANG ...] [-f FUNCTION ...]
+                                   [-n NUMBER] [-o BASELINE]
+    python -m benchmarks.suite compare BASELINE CANDIDATE [-t THRESHOLD]
+"""
+import argparse
+import ast
+import datetime as _datetime
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from collections import defaultdict
+from time import perf_counter
+
+import lingua_franca
+from lingua_franca import format as lf_format, parse as lf_parse
+from lingua_franca.internal import _SUPPORTED_LANGUAGES
+from lingua_franca.version import VERSION_MAJOR, VERSION_MINOR, \
+    VERSION_BUILD, VERSION_ALPHA
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DIR = os.path.join(ROOT_DIR, "test", "unittests")
+FIXTURES = os.path.join(ROOT_DIR, "lingua_franca", "res", "text", "*",
+                        "date_time_test.json")
+
+MODULES = {"parse": lf_parse, "format": lf_format}
+
+# modules test files import the values of their inputs from
+_INPUT_MODULES = ("datetime", "dateutil", "dateutil.tz",
+                  "dateutil.relativedelta", "lingua_franca.time")
+_INPUT_BUILTINS = {builtin.__name__: builtin for builtin in
+                   (int, float, str, bool, list, tuple, dict, set, range)}
+
+
+def registered_functions():
+    """ "module.function" for every registered function """
+    return ["{}.{}".format(module_name, name)
+            for module_name, module in MODULES.items()
+            for name in module._REGISTERED_FUNCTIONS]
+
+
+def _file_lang(path):
+    code = os.path.splitext(os.path.basename(path))[0].split("_")[-1]
+    return code if code in _SUPPORTED_LANGUAGES else "en"
+
+
+def _input_namespace(tree):
+    """ The names a test module imports from _INPUT_MODULES """
+    namespace = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names = [node.module]
+        else:
+            continue
+        if all(name in _INPUT_MODULES for name in names):
+            exec(compile(ast.Module(body=[node], type_ignores=[]),
+                         "<inputs>", "exec"), namespace)
+    namespace["__builtins__"] = _INPUT_BUILTINS
+    return namespace
+
+
+def _evaluate(node, namespace):
+    try:
+        expression = ast.fix_missing_locations(ast.Expression(body=node))
+        return True, eval(compile(expression, "<input>", "eval"), namespace)
+    except Exception:
+        return False, None
+
+
+def _assign(statement, namespace):
+    if isinstance(statement, ast.Assign) and \
+            len(statement.targets) == 1 and \
+            isinstance(statement.targets[0], ast.Name):
+        ok, value = _evaluate(statement.value, namespace)
+        if ok:
+            namespace[statement.targets[0].id] = value
+        else:
+            namespace.pop(statement.targets[0].id, None)
+
+
+def _calls(path, names):
+    """
+    Find the calls to the functions in `names` in a test module
+
+    Yields:
+        (str, str, tuple, dict): function name, language, positional and
+                                 keyword arguments but lang
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    module_namespace = _input_namespace(tree)
+    for statement in tree.body:
+        _assign(statement, module_namespace)
+    default_lang = _file_lang(path)
+
+    for scope in ast.walk(tree):
+        if not isinstance(scope, ast.FunctionDef):
+            continue
+        namespace = dict(module_namespace)
+        for node in sorted((node for node in ast.walk(scope)
+                            if isinstance(node, (ast.Assign, ast.Call))),
+                           key=lambda node: (node.lineno, node.col_offset)):
+            if isinstance(node, ast.Assign):
+                _assign(node, namespace)
+                continue
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else \
+                func.attr if isinstance(func, ast.Attribute) else None
+            lang = default_lang
+            if name and name not in names:
+                # a localized function called directly, e.g. is_ordinal_de
+                name, _, lang = name.rpartition("_")
+            if name not in names or lang not in _SUPPORTED_LANGUAGES:
+                continue
+            ok, args = _evaluate(ast.Tuple(elts=node.args, ctx=ast.Load()),
+                                 namespace)
+            if not ok or any(k.arg is None for k in node.keywords):
+                continue
+            kwargs = {}
+            for keyword in node.keywords:
+                ok, kwargs[keyword.arg] = _evaluate(keyword.value, namespace)
+                if not ok:
+                    break
+            else:
+                lang = kwargs.pop("lang", None) or lang
+                if isinstance(lang, str):
+                    yield name, lang.split("-")[0].lower(), args, kwargs
+
+
+def _fixture_calls():
+    """ The nice_date, nice_date_time and nice_year calls of test_format """
+    for path in sorted(glob.glob(FIXTURES)):
+        lang = os.path.basename(os.path.dirname(path)).split("-")[0]
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        for name, tests in sorted(fixture.items()):
+            for test in tests.values():
+                dt = _datetime.datetime(
+                    *ast.literal_eval(test["datetime_param"]))
+                kwargs = {key: ast.literal_eval(value)
+                          for key, value in test.items()
+                          if key not in ("datetime_param", "assertEqual")}
+                if kwargs.get("now"):
+                    kwargs["now"] = _datetime.datetime(*kwargs["now"])
+                yield name[len("test_"):], lang, (dt,), kwargs
+
+
+def _has_text(args, kwargs):
+    return any(isinstance(value, str)
+               for value in list(args) + list(kwargs.values()))
+
+
+def mine_cases(functions, langs, max_cases):
+    """
+    Collect the inputs of every function and language from the unit tests
+
+    Only the inputs the function can be called with are kept, so the
+    languages must be loaded.
+
+    Returns:
+        dict: {"module.function": {lang: [(args, kwargs)]}}
+    """
+    by_name = {qualified.split(".")[1]: qualified for qualified in functions}
+    found = defaultdict(lambda: defaultdict(list))
+    neutral = defaultdict(list)
+    seen = set()
+
+    def add(qualified, lang, args, kwargs):
+        key = (qualified, lang, repr(args), repr(sorted(kwargs.items())))
+        if key in seen or len(found[qualified][lang]) >= max_cases:
+            return
+        seen.add(key)
+        func = getattr(MODULES[qualified.split(".")[0]], qualified[
+            qualified.index(".") + 1:])
+        try:
+            func(*args, lang=lang, **kwargs)
+        except Exception:
+            return
+        found[qualified][lang].append((args, kwargs))
+
+    paths = sorted(glob.glob(os.path.join(TEST_DIR, "test_parse*.py")) +
+                   glob.glob(os.path.join(TEST_DIR, "test_format*.py")))
+    calls = [call for path in paths for call in _calls(path, by_name)]
+    calls += [call for call in _fixture_calls() if call[0] in by_name]
+    for name, lang, args, kwargs in calls:
+        qualified = by_name[name]
+        if qualified.startswith("format.") and not _has_text(args, kwargs):
+            neutral[qualified].append((args, kwargs))
+        if lang in langs:
+            add(qualified, lang, args, kwargs)
+
+    for qualified, cases in neutral.items():
+        for lang in langs:
+            if not found[qualified][lang]:
+                for args, kwargs in cases:
+                    add(qualified, lang, args, kwargs)
+    return found
+
+
+def measure(func, lang, cases, number):
+    """
+    Time `number` calls to `func`, going round the inputs in `cases`
+
+    Returns:
+        dict: ops/s, p50 and p99 in microseconds, blocks and bytes
+            allocated per call and peak memory in KiB
+    """
+    calls = [(args, kwargs) for _, (args, kwargs) in
+             zip(range(number), _cycle(cases))]
+    for args, kwargs in cases:  # warm up the caches of the first call
+        func(*args, lang=lang, **kwargs)
+
+    latencies = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # as timeit does, collections would land on random calls
+    try:
+        for args, kwargs in calls:
+            start = perf_counter()
+            func(*args, lang=lang, **kwargs)
+            latencies.append(perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for args, kwargs in cases:
+            tracemalloc.clear_traces()
+            func(*args, lang=lang, **kwargs)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+
+        # only what the calls allocate, not the snapshots themselves
+        own_traces = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        before = tracemalloc.take_snapshot().filter_traces(own_traces)
+        for args, kwargs in calls:
+            func(*args, lang=lang, **kwargs)
+        after = tracemalloc.take_snapshot().filter_traces(own_traces)
+    finally:
+        tracemalloc.stop()
+    allocated = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in allocated)
+    size = sum(stat.size_diff for stat in allocated)
+
+    latencies.sort()
+    return {"cases": len(cases),
+            "ops": len(latencies) / sum(latencies),
+            "p50_us": _percentile(latencies, 50) * 1e6,
+            "p99_us": _percentile(latencies, 99) * 1e6,
+            "blocks_call": blocks / len(calls),
+            "bytes_call": size / len(calls),
+            "peak_kib": sum(peaks) / len(peaks) / 1024}
+
+
+def _cycle(cases):
+    while True:
+        yield from cases
+
+
+def _percentile(ordered, percent):
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+def run(args):
+    functions = args.function or registered_functions()
+    unknown = set(functions) - set(registered_functions())
+    if unknown:
+        sys.exit("unknown function(s): " + ", ".join(sorted(unknown)))
+    langs = args.lang or list(_SUPPORTED_LANGUAGES)
+
+    lingua_franca.load_languages(langs)
+    cases = mine_cases(functions, langs, args.max_cases)
+
+    results = {}
+    print("{:<38}{:<6}{:>7}{:>12}{:>12}{:>12}{:>10}{:>10}{:>10}".format(
+        "function", "lang", "inputs", "ops/s", "p50 (us)", "p99 (us)",
+        "blocks", "B", "peak KiB"))
+    for qualified in functions:
+        module_name, name = qualified.split(".")
+        func = getattr(MODULES[module_name], name)
+        for lang in langs:
+            if not cases[qualified][lang]:
+                continue
+            result = measure(func, lang, cases[qualified][lang], args.number)
+            results.setdefault(qualified, {})[lang] = result
+            print("{:<38}{:<6}{:>7}{:>12,.0f}{:>12.1f}{:>12.1f}{:>10.1f}"
+                  "{:>10.0f}{:>10.1f}"
+                  .format(qualified, lang, result["cases"], result["ops"],
+                          result["p50_us"], result["p99_us"],
+                          result["blocks_call"], result["bytes_call"],
+                          result["peak_kib"]))
+
+    _print_language_summary(results, langs)
+    missing = ["{} {}".format(qualified, lang) for qualified in functions
+               for lang in langs if lang not in results.get(qualified, {})]
+    if missing:
+        print("\nno inputs for {} of {} functions and languages (not "
+              "localized, or untested)".format(len(missing),
+                                               len(functions) * len(langs)))
+
+    if args.output:
+        version = "{}.{}.{}a{}".format(VERSION_MAJOR, VERSION_MINOR,
+                                       VERSION_BUILD, VERSION_ALPHA)
+        baseline = {"meta": {"lingua_franca": version,
+                             "python": platform.python_version(),
+                             "machine": platform.machine(),
+                             "created": _datetime.datetime.now().isoformat(
+                                 timespec="seconds"),
+                             "number": args.number},
+                    "results": results}
+        with open(args.output, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print("\nbaseline saved to " + args.output)
+
+
+def _print_language_summary(results, langs):
+    print("\n{:<6}{:>10}{:>16}  {}".format("lang", "functions",
+                                           "worst p99 (us)", "in"))
+    for lang in langs:
+        timed = [(by_lang[lang]["p99_us"], qualified)
+                 for qualified, by_lang in results.items()
+                 if lang in by_lang]
+        if timed:
+            worst, qualified = max(timed)
+            print("{:<6}{:>10}{:>16.1f}  {}".format(lang, len(timed), worst,
+                                                    qualified))
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.candidate) as f:
+        candidate = json.load(f)["results"]
+
+    regressions = unmatched = 0
+    print("{:<38}{:<6}{:<12}{:>12}{:>12}{:>9}".format(
+        "function", "lang", "metric", "baseline", "candidate", "change"))
+    for qualified in sorted(set(baseline) | set(candidate)):
+        langs = set(baseline.get(qualified, {})) | \
+            set(candidate.get(qualified, {}))
+        for lang in sorted(langs):
+            old = baseline.get(qualified, {}).get(lang)
+            new = candidate.get(qualified, {}).get(lang)
+            if old is None or new is None:
+                unmatched += 1
+                continue
+            for metric in ("p50_us", "bytes_call", "peak_kib"):
+                # baselines saved before a metric was added lack it, and
+                # calls that free more than they allocate have no ratio
+                if old.get(metric, 0) <= 0 or metric not in new:
+                    continue
+                change = new[metric] / old[metric] - 1
+                if abs(change) <= args.threshold:
+                    continue
+                if change > 0:
+                    regressions += 1
+                print("{:<38}{:<6}{:<12}{:>12.1f}{:>12.1f}{:>+8.0%}{}".format(
+                    qualified, lang, metric, old[metric], new[metric], change,
+                    " !" if change > 0 else ""))
+    if unmatched:
+        print("\n{} functions and languages are only in one of the "
+              "files".format(unmatched))
+    print("\n{} regression(s) over {:.0%}".format(regressions,
+                                                  args.threshold))
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run_parser = commands.add_parser("run", help="time the functions")
+    run_parser.add_argument("-l", "--lang", nargs="+",
+                            choices=_SUPPORTED_LANGUAGES,
+                            help="languages to time, all if omitted")
+    run_parser.add_argument("-f", "--function", nargs="+",
+                            help="functions to time as module.function, "
+                                 "e.g. parse.extract_number; all if omitted")
+    run_parser.add_argument("-n", "--number", type=int, default=200,
+                            help="timed calls per function and language")
+    run_parser.add_argument("-m", "--max-cases", type=int, default=20,
+                            help="most inputs per function and language")
+    run_parser.add_argument("-o", "--output",
+                            help="save the results as a JSON baseline")
+
+    compare_parser = commands.add_parser(
+        "compare", help="diff two baselines saved by run")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                                help="relative change to report, "
+                                     "0.2 is 20%%")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from itertools import islice
+
+# Sub-sentences with at most this many expansions are expanded once per
+# combination walk, rather than again for each combination
+_MAX_LISTED_EXPANSIONS = 256
 
 
 class Fragment(object):
@@ -32,11 +37,31 @@ class Fragment(object):
 
     def expand(self):
         """
-        Expanded version of the fragment. In this case an empty sentence.
+        Expanded version of the fragment, see iter_expand()
+        Returns:
+            List<List<str>>: A list of sentences (= token/string lists)
+        """
+        return list(self.iter_expand())
+
+    def iter_expand(self, reverse=False):
+        """
+        Generate the expanded version of the fragment, one sentence at a
+        time. In this case an empty sentence.
+        Args:
+            reverse (bool): generate the sentences in the opposite order
+        Returns:
+            Iterator<List<str>>: An empty sentence (= token/string list)
+        """
+        yield []
+
+    def count(self):
+        """
+        Number of sentences in the expanded version of the fragment, without
+        expanding it.
         Returns:
-            List<List<str>>: A list with an empty sentence (= token/string list)
+            int: 1, for the empty sentence
         """
-        return [[]]
+        return 1
 
     def __str__(self):
         return self._tree.__str__()
@@ -51,14 +76,16 @@ class Word(Fragment):
     Construct with a string as argument.
     """
 
-    def expand(self):
+    def iter_expand(self, reverse=False):
         """
         Creates one sentence that contains exactly that word.
+        Args:
+            reverse (bool): generate the sentences in the opposite order
         Returns:
-            List<List<str>>: A list with the given string as sentence
-                                (= token/string list)
+            Iterator<List<str>>: The given string as sentence
+                                    (= token/string list)
         """
-        return [[self._tree]]
+        yield [self._tree]
 
 
 class Sentence(Fragment):
@@ -67,23 +94,60 @@ class Sentence(Fragment):
     Construct with a List<Fragment> as argument.
     """
 
-    def expand(self):
+    def iter_expand(self, reverse=False):
         """
         Creates a combination of all sub-sentences.
+
+        Only the current choice of each sub-sentence is kept in memory, the
+        sub-sentences with many expansions are expanded again for each
+        combination instead. The direction in which the sub-sentences are
+        walked alternates from the last one to the first, which keeps the
+        order expand() has always returned.
+        Args:
+            reverse (bool): generate the sentences in the opposite order
         Returns:
-            List<List<str>>: A list with all subsentence expansions combined in
-                                every possible way
+            Iterator<List<str>>: All subsentence expansions combined in
+                                    every possible way
+        """
+        subs = self._tree
+        if not subs:
+            yield []
+            return
+        last = len(subs) - 1
+        choices = []
+        for i, sub in enumerate(subs):
+            # the backwards sub-sentences are every other one from the last
+            backwards = ((last - i) % 2 == 1) != reverse
+            if sub.count() <= _MAX_LISTED_EXPANSIONS:
+                expanded = list(sub.iter_expand(backwards))
+                choices.append(expanded.__iter__)
+            else:
+                choices.append(lambda sub=sub, backwards=backwards:
+                               sub.iter_expand(backwards))
+        iterators = [choices[0]()]
+        # prefixes[i] is the sentence made by the current choices before i
+        prefixes = [[]]
+        while iterators:
+            part = next(iterators[-1], None)
+            if part is None:
+                iterators.pop()
+                prefixes.pop()
+            elif len(iterators) <= last:
+                prefixes.append(prefixes[-1] + part)
+                iterators.append(choices[len(iterators)]())
+            else:
+                yield prefixes[-1] + part
+
+    def count(self):
         """
-        old_expanded = [[]]
+        Number of combinations of all sub-sentences.
+        Returns:
+            int: The product of the counts of the sub-sentences
+        """
+        total = 1
         for sub in self._tree:
-            sub_expanded = sub.expand()
-            new_expanded = []
-            while len(old_expanded) > 0:
-                sentence = old_expanded.pop()
-                for new in sub_expanded:
-                    new_expanded.append(sentence + new)
-            old_expanded = new_expanded
-        return old_expanded
+            total *= sub.count()
+        return total
 
 
 class Options(Fragment):
@@ -92,17 +156,25 @@ class Options(Fragment):
     Construct with List<Fragment> as argument.
     """
 
-    def expand(self):
+    def iter_expand(self, reverse=False):
         """
         Returns all of its options as seperated sub-sentences.
+        Args:
+            reverse (bool): generate the sentences in the opposite order
         Returns:
-            List<List<str>>: A list containing the sentences created by all
-                                expansions of its sub-sentences
+            Iterator<List<str>>: The sentences created by all expansions of
+                                    its sub-sentences
         """
-        options = []
-        for option in self._tree:
-            options.extend(option.expand())
-        return options
+        for option in (reversed(self._tree) if reverse else self._tree):
+            yield from option.iter_expand(reverse)
+
+    def count(self):
+        """
+        Number of sentences created by all of its options.
+        Returns:
+            int: The sum of the counts of the sub-sentences
+        """
+        return sum(option.count() for option in self._tree)
 
 
 class SentenceTreeParser(object):
@@ -170,6 +242,29 @@ class SentenceTreeParser(object):
         """
         return tree.expand()
 
-    def expand_parentheses(self):
-        tree = self._parse()
-        return self._expand_tree(tree)
\ No newline at end of file
+    def expand_parentheses(self, limit=None):
+        """
+        Expand the tokens to all combinated sentences.
+        ['1', '(', '2', '|', '3, ')'] -> [['1', '2'], ['1', '3']]
+        Args:
+            limit (int, optional): the maximum number of sentences
+        """
+        if limit is None:
+            return self._expand_tree(self._parse())
+        return list(self.iter_expand_parentheses(limit))
+
+    def iter_expand_parentheses(self, limit=None):
+        """
+        Generate the combinated sentences one at a time, in the same order
+        as expand_parentheses()
+        Args:
+            limit (int, optional): the maximum number of sentences
+        """
+        return islice(self._parse().iter_expand(), limit)
+
+    def count(self):
+        """
+        Number of sentences expand_parentheses() returns, without expanding
+        them
+        """
+        return self._parse().count()
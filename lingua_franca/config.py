@@ -1,3 +1,12 @@
 load_langs_on_demand = False
+on_demand_langs_cache_size = 4  # languages kept around by load_langs_on_demand
 inject_timezones = True
 ovos_defaults = True  # use mycroft.conf for default values
+# reload cached resources when changed on disk
+resource_cache_check_mtime = False
+lazy_load_langs = False  # import language modules on first use, not on load
+extract_datetime_cache = False  # reuse parse.extract_datetime() results
+extract_datetime_cache_size = 512  # max phrases kept by that cache
+date_strings_cache = False  # reuse format.get_date_strings() within a minute
+date_strings_cache_size = 256  # max entries kept by that cache
+instrument_localized_functions = False  # see internal.get_call_stats()
@@ -17,11 +17,12 @@ import datetime
 import json
 import os
 import re
-from collections import namedtuple
-from typing import List, Optional
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Iterator, List, Optional
 from warnings import warn
-from os.path import join
 
+from lingua_franca import config
 from lingua_franca.util import match_one, fuzzy_match
 from lingua_franca.bracket_expansion import SentenceTreeParser
 from lingua_franca.internal import localized_function, \
@@ -29,7 +30,8 @@ from lingua_franca.internal import localized_function, \
     get_full_lang_code, get_default_lang, get_default_loc, \
     is_supported_full_lang, _raise_unsupported_language, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError, resolve_resource_file
+    FunctionNotLocalizedError, get_cached_resource, get_word_table, \
+    get_localized_function
 from lingua_franca.time import now_local
 
 
@@ -58,7 +60,6 @@ def _translate_word(name, lang=''):
     Returns:
         str: translated version of resource name
     """
-    from lingua_franca.internal import resolve_resource_file
     if not lang:
         if lang is None:
             warn(NoneLangWarning)
@@ -67,19 +68,8 @@ def _translate_word(name, lang=''):
     lang_code = lang if is_supported_full_lang(lang) else \
         get_full_lang_code(lang)
 
-    filename = resolve_resource_file(join("text", lang_code, name + ".word"))
-    if filename:
-        # open the file
-        try:
-            with open(filename, 'r', encoding='utf8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word.startswith("#"):
-                        continue  # skip comment lines
-                    return word
-        except Exception:
-            pass
-    return name  # use resource name as the word
+    word = get_word_table(lang_code).get(name)
+    return name if word is None else word  # use resource name as the word
 
 
 NUMBER_TUPLE = namedtuple(
@@ -88,10 +78,27 @@ NUMBER_TUPLE = namedtuple(
      'x_in_x000, x0_in_x000, x_in_0x00'))
 
 
+_MULTIPLE_SPACES = re.compile(' +')
+_WHITESPACE = re.compile(r'\s+')
+_PARENTHESES = re.compile(r'([(|)])')
+
+
 class DateTimeFormat:
-    def __init__(self, config_path):
+    def __init__(self, config_path, cached_years=range(1, 3001)):
+        """
+        Args:
+            config_path (str): the directory of the <lang>/date_time.json
+                               files
+            cached_years (range): the years whose rendering by
+                                  year_format() is kept, per language
+        """
         self.lang_config = {}
         self.config_path = config_path
+        self.cached_years = cached_years
+        # {lang: {format section: ((compiled match, format), ...), default)}}
+        self._rules = {}
+        # {lang: {(year, bc): formatted year}}
+        self._years = {}
 
     def cache(self, lang):
         if lang not in self.lang_config:
@@ -108,66 +115,58 @@ class DateTimeFormat:
                     self.lang_config[lang] = json.loads(
                         lang_config_file.read())
 
+            # the numbered rules of each section, compiled, in the order
+            # they are tried
+            self._rules[lang] = {}
             for x in ['decade_format', 'hundreds_format', 'thousand_format',
                       'year_format']:
+                section = self.lang_config[lang][x]
+                rules = []
                 i = 1
-                while self.lang_config[lang][x].get(str(i)):
-                    self.lang_config[lang][x][str(i)]['re'] = (
-                        re.compile(self.lang_config[lang][x][str(i)]['match']
-                                   ))
+                while section.get(str(i)):
+                    section[str(i)]['re'] = re.compile(
+                        section[str(i)]['match'])
+                    rules.append((section[str(i)]['re'],
+                                  section[str(i)]['format']))
                     i = i + 1
+                self._rules[lang][x] = (tuple(rules), section['default'])
+            self._years[lang] = {}
 
     def _number_strings(self, number, lang):
-        x = (self.lang_config[lang]['number'].get(str(number % 10)) or
-             str(number % 10))
-        xx = (self.lang_config[lang]['number'].get(str(number % 100)) or
-              str(number % 100))
-        x_in_x0 = self.lang_config[lang]['number'].get(
-            str(int(number % 100 / 10))) or str(int(number % 100 / 10))
-        x0 = (self.lang_config[lang]['number'].get(
-            str(int(number % 100 / 10) * 10)) or
-            str(int(number % 100 / 10) * 10))
-        xxx = (self.lang_config[lang]['number'].get(str(number % 1000)) or
-               str(number % 1000))
-        x00 = (self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100) * 100)) or
-            str(int(number % 1000 / 100) * 100))
-        x_in_x00 = self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100))) or str(int(number % 1000 / 100))
-        xx00 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 100) * 100)) or str(int(number % 10000 / 100) *
-                                                 100)
-        xx_in_xx00 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 100))) or str(int(number % 10000 / 100))
-        x000 = (self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000) * 1000)) or
-            str(int(number % 10000 / 1000) * 1000))
-        x_in_x000 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000))) or str(int(number % 10000 / 1000))
-        x0_in_x000 = self.lang_config[lang]['number'].get(str(int(
-            number % 10000 / 1000) * 10)) or str(int(number % 10000 / 1000) * 10)
-        x_in_0x00 = self.lang_config[lang]['number'].get(str(int(
-            number % 1000 / 100)) or str(int(number % 1000 / 100)))
+        numbers = self.lang_config[lang]['number']
+
+        def word(n):
+            return numbers.get(str(n)) or str(n)
+
+        x = word(number % 10)
+        xx = word(number % 100)
+        x_in_x0 = word(number % 100 // 10)
+        x0 = word(number % 100 // 10 * 10)
+        xxx = word(number % 1000)
+        x00 = word(number % 1000 // 100 * 100)
+        x_in_x00 = word(number % 1000 // 100)
+        xx00 = word(number % 10000 // 100 * 100)
+        xx_in_xx00 = word(number % 10000 // 100)
+        x000 = word(number % 10000 // 1000 * 1000)
+        x_in_x000 = word(number % 10000 // 1000)
+        x0_in_x000 = word(number % 10000 // 1000 * 10)
+        # no fallback to the digits, unlike the others
+        x_in_0x00 = numbers.get(str(number % 1000 // 100))
 
         return NUMBER_TUPLE(
             x, xx, x0, x_in_x0, xxx, x00, x_in_x00, xx00, xx_in_xx00, x000,
             x_in_x000, x0_in_x000, x_in_0x00)
 
     def _format_string(self, number, format_section, lang):
-        s = self.lang_config[lang][format_section]['default']
-        i = 1
-        while self.lang_config[lang][format_section].get(str(i)):
-            e = self.lang_config[lang][format_section][str(i)]
-            if e['re'].match(str(number)):
-                return e['format']
-            i = i + 1
-        return s
+        rules, default = self._rules[lang][format_section]
+        number = str(number)
+        for regex, format_str in rules:
+            if regex.match(number):
+                return format_str
+        return default
 
     def _decade_format(self, number, number_tuple, lang):
         s = self._format_string(number % 100, 'decade_format', lang)
-        decade = s.format(x=number_tuple.x, xx=number_tuple.xx,
-                        x0=number_tuple.x0, x_in_x0=number_tuple.x_in_x0,
-                        number=str(number % 100))
         return s.format(x=number_tuple.x, xx=number_tuple.xx,
                         x0=number_tuple.x0, x_in_x0=number_tuple.x_in_x0,
                         number=str(number % 100))
@@ -175,10 +174,6 @@ class DateTimeFormat:
     def _number_format_hundreds(self, number, number_tuple, lang,
                                 formatted_decade):
         s = self._format_string(number % 1000, 'hundreds_format', lang)
-        hundreds = s.format(xxx=number_tuple.xxx, x00=number_tuple.x00,
-                          x_in_x00=number_tuple.x_in_x00,
-                          formatted_decade=formatted_decade,
-                          number=str(number % 1000))
         return s.format(xxx=number_tuple.xxx, x00=number_tuple.x00,
                         x_in_x00=number_tuple.x_in_x00,
                         formatted_decade=formatted_decade,
@@ -229,26 +224,38 @@ class DateTimeFormat:
             formatted_date=date_str, formatted_time=time_str)
 
     def year_format(self, dt, lang, bc):
-        number_tuple = self._number_strings(dt.year, lang)
+        """ The year of `dt`, spelled out; the years in self.cached_years
+            are only rendered once per language """
+        key = (dt.year, bool(bc))
+        years = self._years[lang]
+        formatted = years.get(key)
+        if formatted is None:
+            formatted = self._render_year(dt.year, lang, bc)
+            if dt.year in self.cached_years:
+                years[key] = formatted
+        return formatted
+
+    def _render_year(self, year, lang, bc):
+        number_tuple = self._number_strings(year, lang)
         formatted_bc = (
             self.lang_config[lang]['year_format']['bc'] if bc else '')
         formatted_decade = self._decade_format(
-            dt.year, number_tuple, lang)
+            year, number_tuple, lang)
         formatted_hundreds = self._number_format_hundreds(
-            dt.year, number_tuple, lang, formatted_decade)
+            year, number_tuple, lang, formatted_decade)
         formatted_thousand = self._number_format_thousand(
-            dt.year, number_tuple, lang, formatted_decade, formatted_hundreds)
+            year, number_tuple, lang, formatted_decade, formatted_hundreds)
 
-        s = self._format_string(dt.year, 'year_format', lang)
-        return re.sub(' +', ' ',
-                      s.format(
-                          year=str(dt.year),
-                          century=str(int(dt.year / 100)),
-                          decade=str(dt.year % 100),
-                          formatted_hundreds=formatted_hundreds,
-                          formatted_decade=formatted_decade,
-                          formatted_thousand=formatted_thousand,
-                          bc=formatted_bc)).strip()
+        s = self._format_string(year, 'year_format', lang)
+        return _MULTIPLE_SPACES.sub(' ',
+                                    s.format(
+                                        year=str(year),
+                                        century=str(year // 100),
+                                        decade=str(year % 100),
+                                        formatted_hundreds=formatted_hundreds,
+                                        formatted_decade=formatted_decade,
+                                        formatted_thousand=formatted_thousand,
+                                        bc=formatted_bc)).strip()
 
 
 date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__),
@@ -258,10 +265,8 @@ date_time_format = DateTimeFormat(os.path.join(os.path.dirname(__file__),
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
 def pronounce_lang(lang_code, lang=""):
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    with open(resource_file) as f:
-        LANGUAGES = json.load(f)
+    LANGUAGES = get_cached_resource("langs.json", lang,
+                                    fallback="text/en-us/langs.json")
     lang_code = lang_code.lower()
     lang2 = lang_code.split("-")[0]
     spoken_lang = LANGUAGES.get(lang_code) or LANGUAGES.get(lang2) or lang_code
@@ -288,7 +293,7 @@ def nice_number(number, lang='', speech=True, denominators=None):
     return str(number)
 
 
-@localized_function()
+@localized_function(datetime_params=["dt"])
 def nice_time(dt, lang='', speech=True, use_24hour=False,
               use_ampm=False, variant=None):
     """
@@ -333,7 +338,9 @@ def pronounce_number(number, lang='', places=2, short_scale=True,
     """
 
 
-@localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[UnsupportedLanguageError,
+                                     FunctionNotLocalizedError],
+                    datetime_params=["dt", "now"])
 def nice_date(dt, lang='', now=None):
     """
     Format a datetime to a pronounceable date
@@ -358,7 +365,9 @@ def nice_date(dt, lang='', now=None):
     return date_time_format.date_format(dt, full_code, now)
 
 
-@localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[UnsupportedLanguageError,
+                                     FunctionNotLocalizedError],
+                    datetime_params=["dt", "now"])
 def nice_date_time(dt, lang='', now=None, use_24hour=False,
                    use_ampm=False):
     """
@@ -388,7 +397,8 @@ def nice_date_time(dt, lang='', now=None, use_24hour=False,
                                              use_ampm)
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    datetime_params=["dt"])
 def nice_day(dt, date_format='MDY', include_month=True, lang=""):
     if include_month:
         month = nice_month(dt, date_format, lang)
@@ -399,7 +409,8 @@ def nice_day(dt, date_format='MDY', include_month=True, lang=""):
     return dt.strftime("%d")
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    datetime_params=["dt"])
 def nice_weekday(dt, lang=""):
     full_code = get_full_lang_code(lang)
     date_time_format.cache(full_code)
@@ -413,7 +424,8 @@ def nice_weekday(dt, lang=""):
     return weekday.capitalize()
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    datetime_params=["dt"])
 def nice_month(dt, date_format='MDY', lang=""):
     full_code = get_full_lang_code(lang)
     date_time_format.cache(full_code)
@@ -426,7 +438,9 @@ def nice_month(dt, date_format='MDY', lang=""):
     return month.capitalize()
 
 
-@localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
+@localized_function(run_own_code_on=[UnsupportedLanguageError,
+                                     FunctionNotLocalizedError],
+                    datetime_params=["dt"])
 def nice_year(dt, lang='', bc=False):
     """
         Format a datetime to a pronounceable year
@@ -449,16 +463,58 @@ def nice_year(dt, lang='', bc=False):
     return date_time_format.year_format(dt, full_code, bc)
 
 
-@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+# {(year, month, day, hour, minute, date_format, time_format, lang): strings}
+_date_strings_cache = OrderedDict()
+_date_strings_lock = Lock()
+
+
+@localized_function(run_own_code_on=[FunctionNotLocalizedError],
+                    datetime_params=["dt"])
 def get_date_strings(dt=None, date_format='MDY', time_format="full", lang=""):
+    """
+    Format the parts of a datetime for display, e.g. on a clock face
+
+    The same as calling nice_time(), nice_month(), nice_weekday() and
+    nice_day() for display, but the language is only looked up once.
+    While config.date_strings_cache is set, the strings are kept per minute,
+    so refreshing a display within the same minute is a dictionary lookup.
+
+    Args:
+        dt (datetime): date to format, defaults to now
+        date_format (str): order of the date_string, 'MDY', 'DMY' or 'YMD'
+        time_format (str): "full" for a 24-hour time_string, else 12-hour
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        (dict): the date_string, time_string, month_string, day_string,
+                year_string and weekday_string
+    """
     lang = get_full_lang_code(lang)
     dt = dt or now_local()
-    timestr = nice_time(dt, lang, speech=False,
-                         use_24hour=time_format == "full")
-    monthstr = nice_month(dt, date_format, lang)
-    weekdaystr = nice_weekday(dt, lang)
-    yearstr = dt.strftime("%Y")
-    daystr = nice_day(dt, date_format, include_month=False, lang=lang)
+    if not config.date_strings_cache:
+        return _date_strings(dt, date_format, time_format, lang)
+
+    key = (dt.year, dt.month, dt.day, dt.hour, dt.minute,
+           date_format, time_format, lang)
+    with _date_strings_lock:
+        strings = _date_strings_cache.get(key)
+        if strings is not None:
+            _date_strings_cache.move_to_end(key)
+            return dict(strings)
+    strings = _date_strings(dt, date_format, time_format, lang)
+    with _date_strings_lock:
+        _date_strings_cache[key] = strings
+        while len(_date_strings_cache) > max(config.date_strings_cache_size,
+                                             0):
+            _date_strings_cache.popitem(last=False)
+    return dict(strings)
+
+
+def _date_strings(dt, date_format, time_format, lang):
+    """ get_date_strings() for a full language code, without the cache """
+    nice_time_xx, _ = get_localized_function("format", "nice_time", lang)
+    timestr = nice_time_xx(dt, speech=False,
+                           use_24hour=time_format == "full")
     if date_format == 'MDY':
         dtstr = dt.strftime("%-m/%-d/%Y")
     elif date_format == 'DMY':
@@ -467,13 +523,22 @@ def get_date_strings(dt=None, date_format='MDY', time_format="full", lang=""):
         dtstr = dt.strftime("%Y/%-m/%-d")
     else:
         raise ValueError("invalid date_format")
+
+    date_time_format.cache(lang)
+    if lang in date_time_format.lang_config:
+        names = date_time_format.lang_config[lang]
+        monthstr = names['month'][str(dt.month)]
+        weekdaystr = list(names['weekday'].values())[dt.weekday()]
+    else:
+        monthstr = dt.strftime("%B")
+        weekdaystr = dt.strftime("%A")
     return {
         "date_string": dtstr,
         "time_string": timestr,
-        "month_string": monthstr,
-        "day_string": daystr,
-        'year_string': yearstr,
-        "weekday_string": weekdaystr
+        "month_string": monthstr.capitalize(),
+        "day_string": dt.strftime("%d"),
+        'year_string': dt.strftime("%Y"),
+        "weekday_string": weekdaystr.capitalize()
     }
 
 
@@ -602,7 +667,7 @@ def join_list(items: List[str], connector: str, sep: Optional[str] = None,
             " " + items[-1])
 
 
-def expand_parentheses(sent):
+def expand_parentheses(sent, limit=None):
     """
     ['1', '(', '2', '|', '3, ')'] -> [['1', '2'], ['1', '3']]
     For example:
@@ -617,26 +682,60 @@ def expand_parentheses(sent):
 
     Args:
         sent (list<str>): List of tokens in sentence
+        limit (int, optional): maximum number of sentences to return
 
     Returns:
         list<list<str>>: Multiple possible sentences from original
     """
-    return SentenceTreeParser(sent).expand_parentheses()
+    return SentenceTreeParser(sent).expand_parentheses(limit)
 
 
-def expand_options(parentheses_line: str) -> list:
+def expand_options(parentheses_line: str, limit: Optional[int] = None) -> list:
     """
     Convert 'test (a|b)' -> ['test a', 'test b']
 
     Args:
         parentheses_line: Input line to expand
+        limit: maximum number of possibilities to return
 
     Returns:
         List of expanded possibilities
     """
+    return list(iter_expand_options(parentheses_line, limit))
+
+
+def iter_expand_options(parentheses_line: str,
+                        limit: Optional[int] = None) -> Iterator[str]:
+    """
+    Generate the possibilities of expand_options() one at a time
+
+    Templates with several (a|b|c) groups have thousands of possibilities,
+    this only keeps the one being generated in memory.
+
+    Args:
+        parentheses_line: Input line to expand
+        limit: maximum number of possibilities to generate
+
+    Returns:
+        Iterator over the expanded possibilities
+    """
     # 'a(this|that)b' -> [['a', 'this', 'b'], ['a', 'that', 'b']]
-    options = expand_parentheses(re.split(r'([(|)])', parentheses_line))
-    return [re.sub(r'\s+', ' ', ' '.join(i)).strip() for i in options]
+    parser = SentenceTreeParser(_PARENTHESES.split(parentheses_line))
+    for tokens in parser.iter_expand_parentheses(limit):
+        yield _WHITESPACE.sub(' ', ' '.join(tokens)).strip()
+
+
+def count_options(parentheses_line: str) -> int:
+    """
+    Count the possibilities of expand_options() without expanding them
+
+    Args:
+        parentheses_line: Input line to expand
+
+    Returns:
+        Number of expanded possibilities
+    """
+    return SentenceTreeParser(_PARENTHESES.split(parentheses_line)).count()
 
 
 @localized_function()
@@ -678,10 +777,8 @@ def describe_color(color, lang=""):
         str: localized color description
     """
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = get_cached_resource("colors.json", lang,
+                                 fallback="text/webcolors.json")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
@@ -1,7 +1,12 @@
+import json
 import os.path
+from bisect import bisect_left
+from collections import namedtuple, OrderedDict
 from functools import wraps
 from importlib import import_module
 from inspect import signature
+from threading import Lock, RLock
+from time import perf_counter
 
 from warnings import warn
 from datetime import datetime
@@ -40,11 +45,25 @@ _DEFAULT_FULL_LANG_CODES = {'az': 'az-az',
                             'tr': 'tr-tr',
                             'uk': 'uk-ua'}
 
+# The language state below is copy-on-write: the functions which change it
+# build new values, holding _registry_lock, and swap them in with a single
+# assignment. The tables they replace are never modified, so readers, such
+# as @localized_function, never lock.
+_registry_lock = RLock()
+
 __default_lang = None
 __active_lang_code = None
-__loaded_langs = []
+__loaded_langs = ()
 
 _localized_functions = {}
+# {module: {language_code: {function_name: (function, parameter names)}}}
+# built alongside _localized_functions, used by @localized_function to
+# dispatch calls without inspecting or importing anything
+_localized_dispatch_table = {}
+# {(module, language_code): dispatch table} of the languages which aren't
+# loaded but were called with config.load_langs_on_demand, most recently
+# used last. See _on_demand_table()
+_on_demand_tables = OrderedDict()
 
 # TODO the deprecation of 'lang=None' and 'lang=<invalid>' can refer to
 # commit 35efd0661a178e82f6745ad17e10e607c0d83472 for the "proper" state
@@ -103,7 +122,7 @@ def get_active_langs():
     Returns:
         list(str)
     """
-    return __loaded_langs
+    return list(__loaded_langs)
 
 
 def _set_active_langs(langs=None, override_default=True):
@@ -123,24 +142,26 @@ def _set_active_langs(langs=None, override_default=True):
     """
     if isinstance(langs, str):
         langs = [langs]
-    if not isinstance(langs, list):
+    if not isinstance(langs, (list, tuple)):
         raise(TypeError("lingua_franca.internal._set_active_langs expects"
                         " 'str' or 'list'"))
     global __loaded_langs, __default_lang
-    __loaded_langs = list(dict.fromkeys(langs))
-    if __default_lang:
-        if override_default or get_primary_lang_code(__default_lang) \
-                not in __loaded_langs:
-            if len(__loaded_langs):
-                set_default_lang(get_full_lang_code(__loaded_langs[0]))
-            else:
-                __default_lang = None
-    _refresh_function_dict()
+    with _registry_lock:
+        __loaded_langs = tuple(dict.fromkeys(langs))
+        if __default_lang:
+            if override_default or get_primary_lang_code(__default_lang) \
+                    not in __loaded_langs:
+                if len(__loaded_langs):
+                    set_default_lang(get_full_lang_code(__loaded_langs[0]))
+                else:
+                    __default_lang = None
+        _refresh_function_dict()
 
 
 def _refresh_function_dict():
-    for mod in _localized_functions.keys():
-        populate_localized_function_dict(mod, langs=__loaded_langs)
+    with _registry_lock:
+        for mod in list(_localized_functions):
+            populate_localized_function_dict(mod, langs=__loaded_langs)
 
 
 def is_supported_lang(lang):
@@ -186,11 +207,13 @@ def load_language(lang):
     if lang not in _SUPPORTED_LANGUAGES:
         if lang in _SUPPORTED_FULL_LOCALIZATIONS:
             lang = get_primary_lang_code(lang)
-    if lang not in __loaded_langs:
-        __loaded_langs.append(lang)
-    if not __default_lang:
-        set_default_lang(lang)
-    _set_active_langs(__loaded_langs)
+    with _registry_lock:
+        if lang not in __loaded_langs:
+            # only the languages which weren't loaded yet are imported, see
+            # populate_localized_function_dict()
+            _set_active_langs(__loaded_langs + (lang,))
+        if not __default_lang:
+            set_default_lang(lang)
 
 
 def load_languages(langs):
@@ -215,9 +238,10 @@ def unload_language(lang):
     Args:
         lang (str): language code to unload
     """
-    if lang in __loaded_langs:
-        __loaded_langs.remove(lang)
-        _set_active_langs(__loaded_langs)
+    with _registry_lock:
+        if lang in __loaded_langs:
+            _set_active_langs([loaded for loaded in __loaded_langs
+                               if loaded != lang])
 
 
 def unload_languages(langs):
@@ -227,9 +251,11 @@ def unload_languages(langs):
     Args:
         langs (list[str])
     """
-    for lang in langs:
-        __loaded_langs.remove(lang)
-    _set_active_langs(__loaded_langs)
+    with _registry_lock:
+        remaining = list(__loaded_langs)
+        for lang in langs:
+            remaining.remove(lang)
+        _set_active_langs(remaining)
 
 
 def get_default_lang():
@@ -271,27 +297,27 @@ def set_default_lang(lang_code):
     Args:
         lang(str): BCP-47 language code, e.g. "en-us" or "es-mx"
     """
-    global __default_lang, __active_lang_code
+    global __default_lang, __active_lang_code, __loaded_langs
 
     lang_code = lang_code.lower()
     primary_lang_code = get_primary_lang_code(lang_code)
     if primary_lang_code not in _SUPPORTED_LANGUAGES:
         _raise_unsupported_language(lang_code)
-    else:
-        __default_lang = primary_lang_code
 
-    # make sure the default language is loaded.
-    # also make sure the default language is at the front.
-    # position doesn't matter here, but it clarifies things while debugging.
-    if __default_lang in __loaded_langs:
-        __loaded_langs.remove(__default_lang)
-    __loaded_langs.insert(0, __default_lang)
-    _refresh_function_dict()
-
-    if is_supported_full_lang(lang_code):
-        __active_lang_code = lang_code
-    else:
-        __active_lang_code = get_full_lang_code(__default_lang)
+    with _registry_lock:
+        __default_lang = primary_lang_code
+        # make sure the default language is loaded.
+        # also make sure the default language is at the front.
+        # position doesn't matter here, but it clarifies things while
+        # debugging.
+        __loaded_langs = (__default_lang,) + tuple(
+            lang for lang in __loaded_langs if lang != __default_lang)
+        _refresh_function_dict()
+
+        if is_supported_full_lang(lang_code):
+            __active_lang_code = lang_code
+        else:
+            __active_lang_code = get_full_lang_code(__default_lang)
 
 # TODO remove this when invalid lang codes are removed (currently deprecated)
 
@@ -387,7 +413,105 @@ def __get_full_lang_code_deprecation_warning(lang=''):
         raise UnsupportedLanguageError(lang)
 
 
-def localized_function(run_own_code_on=[type(None)]):
+# upper bounds, in seconds, of the latency histogram of get_call_stats()
+LATENCY_BUCKETS = (1e-5, 3e-5, 1e-4, 3e-4, 1e-3, 3e-3, 1e-2, 3e-2, 0.1, 0.3,
+                   1.0, float("inf"))
+
+CallStats = namedtuple("CallStats", ["calls", "fallbacks", "errors",
+                                     "total_time", "histogram"])
+CallStats.__doc__ = """Calls to a localized function in one language
+
+    calls (int): all of the calls, including the two below
+    fallbacks (int): calls which ran the wrapped function's own code, see
+                     localized_function(run_own_code_on=<>)
+    errors (int): calls which raised an exception
+    total_time (float): cumulative time spent in the calls, in seconds
+    histogram (tuple): number of calls per latency bucket, one count per
+                       upper bound in LATENCY_BUCKETS
+"""
+
+# {(module, function name, language code): [calls, fallbacks, errors,
+#                                            total time, histogram]}
+_call_stats = {}
+_call_stats_lock = Lock()
+_slow_call_hook = None
+_slow_call_threshold = 0.1
+
+
+def get_call_stats():
+    """Snapshot the statistics of the calls to localized functions
+
+    They are only collected while config.instrument_localized_functions
+    is set.
+
+    Example:
+        config.instrument_localized_functions = True
+        extract_number("seven", lang="en-us")
+        get_call_stats()
+        {("parse", "extract_number", "en"): CallStats(calls=1, ...)}
+
+    Returns:
+        dict: {(module, function name, language code): CallStats}, where
+              module is "parse" or "format"
+    """
+    with _call_stats_lock:
+        return {key: CallStats(calls, fallbacks, errors, total_time,
+                               tuple(histogram))
+                for key, (calls, fallbacks, errors, total_time, histogram)
+                in _call_stats.items()}
+
+
+def reset_call_stats():
+    """Forget the statistics collected so far, see get_call_stats()"""
+    with _call_stats_lock:
+        _call_stats.clear()
+
+
+def set_slow_call_hook(hook, threshold=0.1):
+    """Have slow calls to localized functions reported to `hook`
+
+    Like the statistics of get_call_stats(), slow calls are only
+    looked for while config.instrument_localized_functions is set.
+
+    Example:
+        def log_slow_call(key, elapsed, args, kwargs):
+            LOG.warning("%s took %.3fs on %r", key, elapsed, args)
+
+        set_slow_call_hook(log_slow_call, threshold=0.05)
+
+    Arguments:
+        hook (callable): called after each call which took longer than
+                         `threshold`, with the (module, function name,
+                         language code) key, the time the call took in
+                         seconds and its positional and keyword arguments.
+                         None removes the hook.
+        threshold (float, optional): in seconds
+    """
+    global _slow_call_hook, _slow_call_threshold
+    _slow_call_hook = hook
+    _slow_call_threshold = threshold
+
+
+def _record_call(key, elapsed, fallback, failed, args, kwargs):
+    with _call_stats_lock:
+        stats = _call_stats.get(key)
+        if stats is None:
+            stats = _call_stats[key] = [0, 0, 0, 0.0,
+                                        [0] * len(LATENCY_BUCKETS)]
+        stats[0] += 1
+        stats[1] += fallback
+        stats[2] += failed
+        stats[3] += elapsed
+        stats[4][bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+    hook = _slow_call_hook
+    if hook is not None and elapsed > _slow_call_threshold:
+        try:
+            hook(key, elapsed, args, kwargs)
+        except Exception as e:
+            warn("slow call hook raised {}: {}".format(type(e).__name__, e))
+
+
+def localized_function(run_own_code_on=[type(None)], datetime_params=()):
     """
     Decorator which finds localized functions, and calls them, from signatures
     defined in the top-level modules. See lingua_franca.format or .parse for
@@ -427,6 +551,16 @@ def localized_function(run_own_code_on=[type(None)]):
             be run. Calls to the wrapped function will be passed to the
             appropriate, localized function.
 
+        datetime_params(list(str), optional)
+            The parameters of the wrapped function which take a datetime,
+            such as 'anchorDate'. While config.inject_timezones is set,
+            naive datetimes passed to them are converted with
+            lingua_franca.time.to_local(). Other arguments are passed on
+            untouched.
+
+    While config.instrument_localized_functions is set, every call is
+    timed and counted per language, see get_call_stats() and
+    set_slow_call_hook().
 
     """
     # Make sure everything in run_own_code_on is an Error or None
@@ -454,28 +588,45 @@ def localized_function(run_own_code_on=[type(None)]):
 
     # Begin wrapper
     def localized_function_decorator(func):
+        # Everything that only depends on the wrapped function is resolved
+        # once, here, rather than on every call
+        func_params = list(signature(func).parameters)
+        lang_param_index = func_params.index('lang')
+        unknown_params = set(datetime_params).difference(func_params)
+        if unknown_params:
+            raise ValueError("@localized_function(datetime_params=<>): " +
+                             func.__name__ + "() has no parameter " +
+                             ", ".join(sorted(unknown_params)))
+        # (name, position) of the parameters to make timezone aware
+        datetime_slots = tuple((param, func_params.index(param))
+                               for param in datetime_params)
+        _module_name = func.__module__.split('.')[-1]
+        func_name = func.__name__.split('.')[-1]
+
         # Wrapper's logic
         def _call_localized_function(func, *args, **kwargs):
             lang_code = None
             load_langs_on_demand = config.load_langs_on_demand
-            unload_language_afterward = False
-            func_signature = signature(func)
-            func_params = list(func_signature.parameters)
-            lang_param_index = func_params.index('lang')
             full_lang_code = None
 
             # Check if we need to add timezone awareness to any datetime object
-            if config.inject_timezones:
-                for key, value in kwargs.items():
-                    if isinstance(value, datetime) and value.tzinfo is None:
-                        kwargs[key] = to_local(value)
-                for idx, value in enumerate(args):
-                    if isinstance(value, datetime) and value.tzinfo is None:
-                        args = (*args[:idx], to_local(value), *args[idx + 1:])
+            if datetime_slots and config.inject_timezones:
+                for key, idx in datetime_slots:
+                    if idx < len(args):
+                        value = args[idx]
+                        if isinstance(value, datetime) and \
+                                value.tzinfo is None:
+                            args = (*args[:idx], to_local(value),
+                                    *args[idx + 1:])
+                    else:
+                        value = kwargs.get(key)
+                        if isinstance(value, datetime) and \
+                                value.tzinfo is None:
+                            kwargs[key] = to_local(value)
 
             # Check if we're passing a lang as a kwarg
-            if 'lang' in kwargs.keys():
-                lang_param = kwargs['lang']
+            if 'lang' in kwargs:
+                lang_param = kwargs.pop('lang')
                 if lang_param is None:
                     warn(NoneLangWarning)
                     lang_code = get_default_lang()
@@ -533,82 +684,88 @@ def localized_function(run_own_code_on=[type(None)]):
             else:
                 full_lang_code = get_full_lang_code(lang_code)
 
-            # Here comes the ugly business.
-            _module_name = func.__module__.split('.')[-1]
-            _module = import_module(".lang." + _module_name +
-                                    "_" + lang_code, "lingua_franca")
-            # The nonsense above gets you from lingua_franca.parse
-            # to lingua_franca.lang.parse_xx
-            if _module_name not in _localized_functions.keys():
-                raise ModuleNotFoundError("Module lingua_franca." +
-                                          _module_name + " not recognized")
-            if lang_code not in _localized_functions[_module_name].keys():
-                if load_langs_on_demand:
-                    load_language(lang_code)
-                    unload_language_afterward = True
-                else:
-                    raise ModuleNotFoundError(_module_name +
-                                              " module of language '" +
-                                              lang_code +
-                                              "' is not currently loaded.")
-            func_name = func.__name__.split('.')[-1]
             # At some point in the past, both the module and the language
             # were imported/loaded, respectively.
-            # When that happened, we cached the *signature* of each
-            # localized function.
-            #
-            # This is the crucial element that allows us to import funcs
-            # on the fly.
+            # When that happened, we resolved each localized function, such
+            # as lingua_franca.lang.parse_en.extract_datetime_en, and the
+            # names of the parameters it accepts. See
+            # populate_localized_function_dict()
             #
             # If we didn't find a localized function to correspond with
             # the wrapped function, we cached NotImplementedError in its
             # place.
+            module_table = _localized_dispatch_table.get(_module_name)
+            if module_table is None:
+                raise ModuleNotFoundError("Module lingua_franca." +
+                                          _module_name + " not recognized")
+            lang_table = module_table.get(lang_code)
+            if lang_table is None:
+                if not load_langs_on_demand:
+                    raise ModuleNotFoundError(_module_name +
+                                              " module of language '" +
+                                              lang_code +
+                                              "' is not currently loaded.")
+                lang_table = _on_demand_table(_module_name, lang_code)
 
             # first account for the function not being present in any
             # module, meaning all modules are falling back to a catch all
             # parser, this usually means the function will need localization
             # only in future languages not currently supported
-            if func_name not in _localized_functions[_module_name][lang_code]:
-                raise FunctionNotLocalizedError(func_name, lang_code)
-
-            loc_signature = _localized_functions[_module_name][lang_code][func_name]
-            if isinstance(loc_signature, type(NotImplementedError())):
-                raise loc_signature
-
-            # Now we have the appropriate localized module. Let's get
-            # the localized function.
-            try:
-                localized_func = getattr(
-                    _module, func_name + "_" + lang_code)
-            except AttributeError:
+            entry = lang_table.get(func_name)
+            if entry is None and _resolve_lazy_table(lang_table):
+                entry = lang_table.get(func_name)
+            if entry is None:
                 raise FunctionNotLocalizedError(func_name, lang_code)
+            if isinstance(entry, NotImplementedError):
+                raise entry
+            localized_func, loc_params = entry
 
-            # We now have a localized function, such as
-            # lingua_franca.parse.extract_datetime_en
-            # Get 'lang' out of its parameters.
-            if 'lang' in kwargs:
-                del kwargs['lang']
-            args = tuple(arg for arg in list(args) if
-                         arg not in (lang_code, full_lang_code))
+            # Get 'lang' out of the positional arguments
+            if args and (lang_code in args or full_lang_code in args):
+                args = tuple(arg for arg in args if
+                             arg not in (lang_code, full_lang_code))
 
             # Now we call the function, ignoring any kwargs from the
             # wrapped function that aren't in the localized function.
-            r_val = localized_func(*args,
-                                   **{arg: val for arg, val
-                                      in kwargs.items()
-                                      if arg in loc_signature.parameters})
-
-            # Unload all the stuff we just assembled and imported
-            del localized_func
-            del _module
-            if unload_language_afterward:
-                unload_language(lang_code)
-            return r_val
+            if not loc_params.issuperset(kwargs):
+                kwargs = {arg: val for arg, val in kwargs.items()
+                          if arg in loc_params}
+            return localized_func(*args, **kwargs)
 
-        # Actual wrapper
-        @wraps(func)
-        def call_localized_function(*args, **kwargs):
-            if run_own_code_on != [type(None)]:
+        def _instrumented_call(args, kwargs):
+            if 'lang' in kwargs:
+                lang = kwargs['lang']
+            elif lang_param_index < len(args):
+                lang = args[lang_param_index]
+            else:
+                lang = None
+            lang = lang or get_default_lang()
+            lang = lang.split('-')[0].lower() if isinstance(lang, str) \
+                else str(lang)
+            fallback = failed = False
+            start = perf_counter()
+            try:
+                try:
+                    return _call_localized_function(func, *args, **kwargs)
+                except Exception as e:
+                    if not intercept or not any(
+                            (isinstance(e, error)
+                             for error in run_own_code_on)):
+                        raise
+                fallback = True
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                _record_call((_module_name, func_name, lang),
+                             perf_counter() - start, fallback, failed,
+                             args, kwargs)
+
+        intercept = run_own_code_on != [type(None)]
+
+        def _uninstrumented_call(*args, **kwargs):
+            if intercept:
                 try:
                     return _call_localized_function(func, *args, **kwargs)
                 except Exception as e:  # Intercept, check for run_own_code_on
@@ -618,6 +775,17 @@ def localized_function(run_own_code_on=[type(None)]):
                         raise e
             else:  # don't intercept any exceptions
                 return _call_localized_function(func, *args, **kwargs)
+
+        # Actual wrapper
+        @wraps(func)
+        def call_localized_function(*args, **kwargs):
+            if config.instrument_localized_functions:
+                return _instrumented_call(args, kwargs)
+            return _uninstrumented_call(*args, **kwargs)
+
+        # for wrappers which record their calls themselves, such as the
+        # cache of parse.extract_datetime()
+        call_localized_function.uninstrumented = _uninstrumented_call
         return call_localized_function
     try:
         return localized_function_decorator
@@ -626,13 +794,183 @@ def localized_function(run_own_code_on=[type(None)]):
         return
 
 
-def populate_localized_function_dict(lf_module, langs=get_active_langs()):
+def get_localized_function(lf_module, function_name, lang=''):
+    """Look up the localized implementation of a registered function.
+
+    This skips the @localized_function dispatcher, for callers which make
+    many calls in the same language, such as the batch parsers in
+    lingua_franca.parse
+
+    Example:
+        get_localized_function("parse", "extract_number", "en-us")
+        (<function extract_number_en>, frozenset({'text', ...}))
+
+    Arguments:
+        lf_module (str): the name of the top-level module, e.g. "parse"
+        function_name (str): a name in that module's _REGISTERED_FUNCTIONS
+        lang (str, optional): a BCP-47 language code, if omitted the default
+                              language will be used.
+
+    Returns:
+        (function, frozenset): the localized function, and the names of the
+                               parameters it accepts
+    """
+    lang_code = get_primary_lang_code(lang)
+    if not lang_code:
+        raise ModuleNotFoundError("No language module loaded.")
+    if lang_code not in _SUPPORTED_LANGUAGES:
+        _raise_unsupported_language(lang_code)
+    lang_table = _localized_dispatch_table.get(lf_module, {}).get(lang_code)
+    if lang_table is None:
+        if not config.load_langs_on_demand:
+            raise ModuleNotFoundError(lf_module + " module of language '" +
+                                      lang_code + "' is not currently "
+                                      "loaded.")
+        lang_table = _on_demand_table(lf_module, lang_code)
+    entry = lang_table.get(function_name)
+    if entry is None and _resolve_lazy_table(lang_table):
+        entry = lang_table.get(function_name)
+    if entry is None:
+        raise FunctionNotLocalizedError(function_name, lang_code)
+    if isinstance(entry, NotImplementedError):
+        raise entry
+    return entry
+
+
+class _LazyFunctionTable(dict):
+    """Dispatch table of a language whose module has not been imported yet
+
+    Used instead of a plain dict by populate_localized_function_dict() when
+    config.lazy_load_langs is set. It starts out empty, so lookups fall
+    through to _resolve_lazy_table(), which imports the language module
+    and fills the table in place the first time it is actually needed.
+    """
+    __slots__ = ("lf_module", "lang_code", "resolved")
+
+    def __init__(self, lf_module, lang_code):
+        super().__init__()
+        self.lf_module = lf_module
+        self.lang_code = lang_code
+        self.resolved = False
+
+
+def _resolve_lazy_table(lang_table):
+    """Import the module behind a _LazyFunctionTable, see above
+
+    Returns:
+        bool: whether the table was filled by this call
+    """
+    if type(lang_table) is not _LazyFunctionTable or lang_table.resolved:
+        return False
+    with _registry_lock:
+        if lang_table.resolved:  # by another thread, while we waited
+            return True
+        lf_module, lang_code = lang_table.lf_module, lang_table.lang_code
+        signatures, dispatch = _import_localized_functions(lf_module,
+                                                           lang_code)
+        # a single update() is atomic, readers see all or none of it
+        lang_table.update(dispatch)
+        lang_table.resolved = True
+        stubs = _localized_functions.get(lf_module, {}).get(lang_code)
+        if stubs is not None:
+            stubs.update(signatures)
+    return True
+
+
+def _on_demand_table(lf_module, lang_code):
+    """Dispatch table of a language which isn't loaded
+
+    Used while config.load_langs_on_demand is set. The tables are built
+    apart from the loaded languages, and the last
+    config.on_demand_langs_cache_size of them are kept for the next calls
+    rather than importing the language again every time.
+
+    Returns:
+        dict: {function_name: (function, frozenset(params))}
+    """
+    key = (lf_module, lang_code)
+    lang_table = _on_demand_tables.get(key)
+    if lang_table is not None:
+        try:
+            _on_demand_tables.move_to_end(key)
+        except KeyError:  # evicted by another thread in the meantime
+            pass
+        return lang_table
+    with _registry_lock:
+        lang_table = _on_demand_tables.get(key)
+        if lang_table is None:
+            lang_table = _import_localized_functions(lf_module,
+                                                     lang_code)[1]
+            _on_demand_tables[key] = lang_table
+            max_tables = max(config.on_demand_langs_cache_size, 1)
+            while len(_on_demand_tables) > max_tables:
+                _on_demand_tables.popitem(last=False)
+    return lang_table
+
+
+def _import_localized_functions(lf_module, primary_lang_code):
+    """Import lingua_franca.lang.<lf_module>_<primary_lang_code>
+
+    Returns:
+        (dict, dict): {function_name: signature} and the dispatch table,
+                      {function_name: (function, frozenset(params))}. Both
+                      map unimplemented functions to FunctionNotLocalizedError
+                      and are empty if the module does not exist.
+    """
+    signatures = {}
+    dispatch = {}
+    _FUNCTION_NOT_FOUND = ""
+    try:
+        lang_common_data = import_module(".lang.common_data_" + primary_lang_code,
+                                         "lingua_franca")
+        _FUNCTION_NOT_FOUND = getattr(lang_common_data,
+                                      "_FUNCTION_NOT_IMPLEMENTED_WARNING")
+        del lang_common_data
+    except Exception:
+        _FUNCTION_NOT_FOUND = "This function has not been implemented" \
+            " in the specified language."
+    _FUNCTION_NOT_FOUND = FunctionNotLocalizedError(_FUNCTION_NOT_FOUND)
+
+    try:
+        mod = import_module(".lang." + lf_module + "_" + primary_lang_code,
+                            "lingua_franca")
+    except ModuleNotFoundError:
+        warn(Warning("Language code '{}' is registered with Lingua Franca,"
+                     " but its {} module could not be found."
+                     .format(primary_lang_code, lf_module)))
+        return signatures, dispatch
+
+    function_names = getattr(import_module("." + lf_module, "lingua_franca"),
+                             "_REGISTERED_FUNCTIONS")
+    for function_name in function_names:
+        try:
+            function = getattr(mod, function_name
+                               + "_" + primary_lang_code)
+            function_signature = signature(function)
+            dispatch_entry = (function,
+                              frozenset(function_signature.parameters))
+            del function
+        except AttributeError:
+            function_signature = dispatch_entry = _FUNCTION_NOT_FOUND
+            # TODO log these occurrences: "function 'function_name' not
+            # implemented in language 'primary_lang_code'"
+            #
+            # Perhaps provide this info to autodocs, to help volunteers
+            # identify the functions in need of localization
+        signatures[function_name] = function_signature
+        dispatch[function_name] = dispatch_entry
+    return signatures, dispatch
+
+
+def populate_localized_function_dict(lf_module, langs=None):
     """Returns a dictionary of dictionaries, containing localized functions.
 
     Used by the top-level modules to locate, cache, and call localized funcs.
 
     Arguments:
         lf_module(str) - - the name of the top-level module
+        langs(list(str)) - - the languages to include, the loaded ones if
+                             omitted
 
     Returns:
         Dict - - {language_code: {function_name(str): function}}
@@ -644,56 +982,48 @@ def populate_localized_function_dict(lf_module, langs=get_active_langs()):
         `lingua_franca.internal._localized_functions`,
         and its members are invoked via the `@localized_function` decorator.
 
+        Languages which were already registered are kept as is, only the
+        new ones are imported. The dictionaries are replaced rather than
+        modified, see _registry_lock.
+
+        If `lingua_franca.config.lazy_load_langs` is set, language modules
+        are not imported here either. Each language gets a stub, mapping
+        function names to None, and the module is imported on the first call
+        in that language.
+
     Example:
         populate_localized_function_dict("format")["en"]["pronounce_number"](1)
         "one"
     """
-    bad_lang_code = "Language code '{}' is registered with" \
-        " Lingua Franca, but its " + lf_module + " module" \
-        " could not be found."
-    return_dict = {}
-    for lang_code in langs:
-        primary_lang_code = get_primary_lang_code(lang_code)
-        return_dict[primary_lang_code] = {}
-        _FUNCTION_NOT_FOUND = ""
-        try:
-            lang_common_data = import_module(".lang.common_data_" + primary_lang_code,
-                                             "lingua_franca")
-            _FUNCTION_NOT_FOUND = getattr(lang_common_data,
-                                          "_FUNCTION_NOT_IMPLEMENTED_WARNING")
-            del lang_common_data
-        except Exception:
-            _FUNCTION_NOT_FOUND = "This function has not been implemented" \
-                " in the specified language."
-        _FUNCTION_NOT_FOUND = FunctionNotLocalizedError(_FUNCTION_NOT_FOUND)
-
-        try:
-            mod = import_module(".lang." + lf_module + "_" + primary_lang_code,
-                                "lingua_franca")
-        except ModuleNotFoundError:
-            warn(Warning(bad_lang_code.format(primary_lang_code)))
-            continue
-
-        function_names = getattr(import_module("." + lf_module, "lingua_franca"),
-                                 "_REGISTERED_FUNCTIONS")
-        for function_name in function_names:
-            try:
-                function = getattr(mod, function_name
-                                   + "_" + primary_lang_code)
-                function_signature = signature(function)
-                del function
-            except AttributeError:
-                function_signature = _FUNCTION_NOT_FOUND
-                # TODO log these occurrences: "function 'function_name' not
-                # implemented in language 'primary_lang_code'"
-                #
-                # Perhaps provide this info to autodocs, to help volunteers
-                # identify the functions in need of localization
-            return_dict[primary_lang_code][function_name] = function_signature
-
-        del mod
-    _localized_functions[lf_module] = return_dict
-    return _localized_functions[lf_module]
+    with _registry_lock:
+        if langs is None:
+            langs = __loaded_langs
+        lazy = config.lazy_load_langs
+        previous = _localized_functions.get(lf_module, {})
+        previous_dispatch = _localized_dispatch_table.get(lf_module, {})
+        return_dict = {}
+        dispatch_dict = {}
+        for lang_code in langs:
+            primary_lang_code = get_primary_lang_code(lang_code)
+            if primary_lang_code in previous_dispatch:
+                return_dict[primary_lang_code] = previous[primary_lang_code]
+                dispatch_dict[primary_lang_code] = \
+                    previous_dispatch[primary_lang_code]
+            elif lazy:
+                function_names = getattr(
+                    import_module("." + lf_module, "lingua_franca"),
+                    "_REGISTERED_FUNCTIONS")
+                return_dict[primary_lang_code] = \
+                    dict.fromkeys(function_names)
+                dispatch_dict[primary_lang_code] = \
+                    _LazyFunctionTable(lf_module, primary_lang_code)
+            else:
+                return_dict[primary_lang_code], \
+                    dispatch_dict[primary_lang_code] = \
+                    _import_localized_functions(lf_module, primary_lang_code)
+        _localized_functions[lf_module] = return_dict
+        _localized_dispatch_table[lf_module] = dispatch_dict
+    return return_dict
 
 
 def resolve_resource_file(res_name, data_dir=None):
@@ -744,6 +1074,191 @@ def resolve_resource_file(res_name, data_dir=None):
     return None  # Resource cannot be resolved
 
 
+class _CachedResource:
+    __slots__ = ("path", "mtime", "data", "derived")
+
+    def __init__(self, path, mtime, data):
+        self.path = path
+        self.mtime = mtime
+        self.data = data
+        self.derived = {}
+
+
+# {(resource name, full language code): _CachedResource}
+_resource_cache = {}
+# {full language code: (overrides stamp, {word name: word})}
+_word_tables = {}
+
+
+def _load_cached_resource(res_name, lang, fallback):
+    path = resolve_resource_file("text/{}/{}".format(lang, res_name))
+    if not path and fallback:
+        path = resolve_resource_file(fallback)
+    if not path:
+        return None
+    with open(path, encoding="utf8") as f:
+        data = json.load(f)
+    return _CachedResource(path, os.path.getmtime(path), data)
+
+
+def get_cached_resource(res_name, lang, fallback=None, derive=None):
+    """Load a json resource from `res/text/<lang>/` once per process.
+
+    The file is located with resolve_resource_file(), parsed, and kept in
+    a cache keyed by (res_name, lang). Structures derived from the parsed
+    data, such as inverted lookup tables, are cached alongside it.
+
+    If `lingua_franca.config.resource_cache_check_mtime` is True, the
+    cached file is re-read whenever its modification time changes. Call
+    clear_resource_cache() to drop the cache explicitly, for instance after
+    installing a user override under ~/.mycroft
+
+    Example:
+        get_cached_resource("colors.json", "en-us",
+                            fallback="text/webcolors.json")
+
+    Args:
+        res_name (str): resource file name, e.g. "colors.json"
+        lang (str): full language code, e.g. "en-us"
+        fallback (str, optional): resource path used when the language has
+                                  no such file, e.g. "text/webcolors.json"
+        derive (callable, optional): builds a derived structure from the
+                                     parsed data. Its return value is cached
+                                     per callable, so pass a module level
+                                     function rather than a lambda
+
+    Returns:
+        the parsed data, or derive(data) if `derive` was passed.
+        None if the resource could not be found.
+        Callers must not modify the returned object.
+    """
+    key = (res_name, lang)
+    entry = _resource_cache.get(key)
+    if entry is not None and config.resource_cache_check_mtime:
+        try:
+            if os.path.getmtime(entry.path) != entry.mtime:
+                entry = None
+        except OSError:
+            entry = None
+    if entry is None:
+        entry = _load_cached_resource(res_name, lang, fallback)
+        if entry is None:
+            return None
+        _resource_cache[key] = entry
+    if derive is None:
+        return entry.data
+    try:
+        return entry.derived[derive]
+    except KeyError:
+        value = entry.derived[derive] = derive(entry.data)
+        return value
+
+
+def clear_resource_cache(res_name=None, lang=None):
+    """Drop cached resources, see get_cached_resource()
+
+    Args:
+        res_name (str, optional): only drop this resource
+        lang (str, optional): only drop resources of this full language code
+    """
+    if res_name is None or res_name.endswith(".word"):
+        if lang is None:
+            _word_tables.clear()
+        else:
+            _word_tables.pop(lang, None)
+    if res_name is None and lang is None:
+        _resource_cache.clear()
+        return
+    for key in list(_resource_cache):
+        if res_name not in (None, key[0]) or lang not in (None, key[1]):
+            continue
+        _resource_cache.pop(key, None)
+
+
+def _resource_dirs(res_dir):
+    """ The directories resolve_resource_file() looks in for the files of
+        `res_dir`, from the first to the last one it tries """
+    return [res_dir,
+            os.path.expanduser("~/.mycroft/" + res_dir),
+            os.path.expanduser(os.path.join("/opt/mycroft/res/", res_dir)),
+            os.path.abspath(os.path.normpath(os.path.join(
+                os.path.dirname(__file__), 'res', res_dir)))]
+
+
+def _read_word(path):
+    """ The first line of a .word file which isn't a comment, stripped """
+    try:
+        with open(path, 'r', encoding='utf8') as f:
+            for line in f:
+                word = line.strip()
+                if not word.startswith("#"):
+                    return word
+    except Exception:
+        pass
+    return None
+
+
+def _overrides_stamp(dirs):
+    """ Modification times of the user overrides of a word table """
+    stamp = []
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as entries:
+                stamp.append((directory, os.path.getmtime(directory)))
+                stamp.extend((entry.name, entry.stat().st_mtime)
+                             for entry in entries
+                             if entry.name.endswith(".word"))
+        except OSError:
+            continue
+    return tuple(sorted(stamp))
+
+
+def get_word_table(lang):
+    """Read every res/text/<lang>/*.word resource once per process.
+
+    The words are looked up the way resolve_resource_file() would find
+    each file, so user overrides under ~/.mycroft/text/<lang>/ and
+    /opt/mycroft/res/text/<lang>/ take precedence over the package's.
+
+    If `lingua_franca.config.resource_cache_check_mtime` is True, the
+    table is read again whenever an override is added, removed or changed.
+    Otherwise clear_resource_cache() drops it.
+
+    Example:
+        get_word_table("en-us")["hours"]
+        "hours"
+
+    Args:
+        lang (str): full language code, e.g. "en-us"
+
+    Returns:
+        dict: {word name: word}, the name of a .word file without its
+              extension, mapped to its first line which isn't a comment,
+              or to None if there is no such line.
+              Callers must not modify the returned dict.
+    """
+    entry = _word_tables.get(lang)
+    check_mtime = config.resource_cache_check_mtime
+    if entry is not None and not check_mtime:
+        return entry[1]
+    dirs = _resource_dirs(os.path.join("text", lang))
+    stamp = _overrides_stamp(dirs[:-1]) if check_mtime else None
+    if entry is not None and entry[0] == stamp:
+        return entry[1]
+    words = {}
+    for directory in reversed(dirs):
+        try:
+            file_names = os.listdir(directory)
+        except OSError:
+            continue
+        for file_name in file_names:
+            path = os.path.join(directory, file_name)
+            if file_name.endswith(".word") and os.path.isfile(path):
+                words[file_name[:-len(".word")]] = _read_word(path)
+    _word_tables[lang] = (stamp, words)
+    return words
+
+
 def lookup_variant(mappings, key="variant"):
     """function decorator
     maps strings to Enums expected by language specific functions
@@ -16,7 +16,8 @@
 #
 import datetime
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_az import _NUM_STRING_AZ, _get_ordinal_ak, _get_daytime, \
     _FRACTION_STRING_AZ, _LONG_SCALE_AZ, _SHORT_SCALE_AZ, _SHORT_ORDINAL_AZ, _LONG_ORDINAL_AZ, \
     _get_full_time_ak, _get_half_time_ak
@@ -61,6 +62,15 @@ def nice_number_az(number, speech=True, denominators=range(1, 21)):
         return '{} yarım'.format(whole)
     return '{} və {} {}'.format(whole, den_str, num)
 
+
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_AZ = {
+    True: number_tables(_NUM_STRING_AZ, _SHORT_SCALE_AZ),
+    False: number_tables(_NUM_STRING_AZ, _LONG_SCALE_AZ)
+}
+
+
+@memoize_integers()
 def pronounce_number_az(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -108,21 +118,8 @@ def pronounce_number_az(number, places=2, short_scale=True, scientific=False,
                     'mənfi ' if power < 0 else '',
                     pronounce_number_az(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_AZ.copy()
-        number_names.update(_SHORT_SCALE_AZ)
-    else:
-        number_names = _NUM_STRING_AZ.copy()
-        number_names.update(_LONG_SCALE_AZ)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_AZ[n] for n in _SHORT_SCALE_AZ.keys()]
-    else:
-        hundreds = [_LONG_SCALE_AZ[n] for n in _LONG_SCALE_AZ.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_AZ[bool(short_scale)]
 
     # deal with negatives
     result = ""
@@ -266,6 +263,8 @@ def pronounce_number_az(number, places=2, short_scale=True, scientific=False,
             result += " " + number_names[int(char)]
     return result
 
+
+@memoize_times()
 def nice_time_az(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -337,6 +336,7 @@ def nice_time_az(dt, speech=True, use_24hour=False, use_ampm=False):
 
         return speak
 
+
 def nice_duration_az(duration, speech=True):
     """ Convert duration in seconds to a nice spoken timespan
 
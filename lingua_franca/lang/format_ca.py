@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_ca import _FRACTION_STRING_CA, \
     _NUM_STRING_CA
 from lingua_franca.internal import lookup_variant
@@ -82,6 +83,7 @@ def nice_number_ca(number, speech, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_ca(number, places=2):
     """
     Convert a number to it's spoken equivalent
@@ -134,6 +136,7 @@ def pronounce_number_ca(number, places=2):
     "full_bell": TimeVariantCA.FULL_BELL,
     "spanish": TimeVariantCA.SPANISH_LIKE
 })
+@memoize_times()
 def nice_time_ca(dt, speech=True, use_24hour=False, use_ampm=False,
                  variant=None):
     """
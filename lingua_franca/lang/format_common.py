@@ -13,6 +13,94 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from datetime import datetime
+from functools import lru_cache, wraps
+
+
+def memoize_integers(maxsize=1024):
+    """
+    Decorator adding a bounded LRU cache to a pronounce_number_xx function
+
+    Only calls whose first argument is a plain ``int`` are cached, keyed on
+    that number and the remaining arguments; floats (and bools) always run
+    the wrapped function, as their spoken form depends on ``places`` and
+    rounding. The wrapper keeps the wrapped signature, so the localizer
+    still sees the real parameters.
+
+    Args:
+        maxsize (int): maximum number of cached pronunciations
+    Returns:
+        decorator
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if args and type(args[0]) is int:
+                return cached(*args, **kwargs)
+            return func(*args, **kwargs)
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+
+def memoize_times(maxsize=2048):
+    """
+    Decorator adding a bounded LRU cache to a nice_time_xx function
+
+    The spoken and written forms of a time only depend on its hour and
+    minute, so calls are cached on those and the remaining arguments, and
+    the seconds, date and timezone of ``dt`` are ignored. Calls where ``dt``
+    is not a ``datetime`` passed positionally, or with unhashable arguments,
+    always run the wrapped function. Apply it below ``lookup_variant``, so
+    variant names are mapped before they are cached.
+
+    Args:
+        maxsize (int): maximum number of cached times
+    Returns:
+        decorator
+    """
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(hour, minute, *args, **kwargs):
+            return func(datetime(1900, 1, 1, hour, minute), *args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if args and isinstance(args[0], datetime):
+                try:
+                    hash((args[1:], tuple(kwargs.items())))
+                except TypeError:  # unhashable arguments
+                    return func(*args, **kwargs)
+                return cached(args[0].hour, args[0].minute, *args[1:],
+                              **kwargs)
+            return func(*args, **kwargs)
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+
+def number_tables(num_string, scale):
+    """
+    Build the lookup tables used by the table-driven pronounce_number_xx
+
+    Args:
+        num_string (dict): number names of the language, e.g. _NUM_STRING_EN
+        scale (dict): short or long scale names, e.g. _SHORT_SCALE_EN
+    Returns:
+        (dict, list, list, list): number names merged with the scale names,
+                                  names of 0..19, names of the tens and
+                                  names of the scale, in order
+    """
+    number_names = num_string.copy()
+    number_names.update(scale)
+    digits = [number_names[n] for n in range(0, 20)]
+    tens = [number_names[n] for n in range(10, 100, 10)]
+    hundreds = [scale[n] for n in scale.keys()]
+    return number_names, digits, tens, hundreds
 
 
 def convert_to_mixed_fraction(number, denominators=range(1, 21)):
@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _FRACTION_STRING_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, _LONG_ORDINAL_CS
 
@@ -68,6 +69,14 @@ def nice_number_cs(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_CS = {
+    True: number_tables(_NUM_STRING_CS, _SHORT_SCALE_CS),
+    False: number_tables(_NUM_STRING_CS, _LONG_SCALE_CS)
+}
+
+
+@memoize_integers()
 def pronounce_number_cs(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -115,21 +124,8 @@ def pronounce_number_cs(number, places=2, short_scale=True, scientific=False,
                     'záporné ' if power < 0 else '',
                     pronounce_number_cs(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_CS.copy()
-        number_names.update(_SHORT_SCALE_CS)
-    else:
-        number_names = _NUM_STRING_CS.copy()
-        number_names.update(_LONG_SCALE_CS)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_CS[n] for n in _SHORT_SCALE_CS.keys()]
-    else:
-        hundreds = [_LONG_SCALE_CS[n] for n in _LONG_SCALE_CS.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_CS[bool(short_scale)]
 
     # deal with zápornés
     result = ""
@@ -305,6 +301,7 @@ def pronounce_number_cs(number, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_cs(dt, speech=True, use_24hour=True, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_da import _EXTRA_SPACE_DA, \
     _FRACTION_STRING_DA, _MONTHS_DA, _NUM_POWERS_OF_TEN, _NUM_STRING_DA
 from math import floor
@@ -59,6 +60,7 @@ def nice_number_da(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_da(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -214,6 +216,7 @@ def pronounce_ordinal_da(number):
             return pronounce_number_da(number) + "ende"
 
 
+@memoize_times()
 def nice_time_da(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -16,7 +16,8 @@
 
 from math import floor
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_de import (
     _EXTRA_SPACE,
     _FRACTION_STRING,
@@ -64,6 +65,7 @@ def nice_number_de(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_de(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -216,6 +218,7 @@ def pronounce_ordinal_de(number):
         return pronounce_number_de(number) + "ste"
 
 
+@memoize_times()
 def nice_time_de(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -14,11 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_en import _NUM_STRING_EN, \
     _FRACTION_STRING_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, _LONG_ORDINAL_EN
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.internal import get_cached_resource
 
 
 def nice_number_en(number, speech=True, denominators=range(1, 21)):
@@ -66,6 +66,130 @@ def nice_number_en(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# number names for the short (True) and long (False) scale, built once
+_NUMBER_NAMES_EN = {True: _NUM_STRING_EN.copy(), False: _NUM_STRING_EN.copy()}
+_NUMBER_NAMES_EN[True].update(_SHORT_SCALE_EN)
+_NUMBER_NAMES_EN[False].update(_LONG_SCALE_EN)
+_DIGITS_EN = [_NUM_STRING_EN[n] for n in range(0, 20)]
+_TENS_EN = [_NUM_STRING_EN[n] for n in range(10, 100, 10)]
+_SHORT_HUNDREDS_EN = list(_SHORT_SCALE_EN.values())
+_LONG_HUNDREDS_EN = list(_LONG_SCALE_EN.values())
+_MAX_SHORT_SCALE_EN = max(_SHORT_SCALE_EN.keys())
+_MAX_LONG_SCALE_EN = max(_LONG_SCALE_EN.keys())
+
+
+def _split_by(n, split=1000):
+    assert 0 <= n
+    res = []
+    while n:
+        n, r = divmod(n, split)
+        res.append(r)
+    return res
+
+
+def _sub_thousand_en(n, ordinals=False):
+    assert 0 <= n <= 999
+    if n in _SHORT_ORDINAL_EN and ordinals:
+        return _SHORT_ORDINAL_EN[n]
+    if n <= 19:
+        return _DIGITS_EN[n]
+    elif n <= 99:
+        q, r = divmod(n, 10)
+        return _TENS_EN[q - 1] + (" " + _sub_thousand_en(r, ordinals) if r
+                                  else "")
+    else:
+        q, r = divmod(n, 100)
+        return _DIGITS_EN[q] + " hundred" + (
+            " and " + _sub_thousand_en(r, ordinals) if r else "")
+
+
+def _short_scale_en(n, ordinals=False):
+    if n >= _MAX_SHORT_SCALE_EN:
+        return "infinity"
+    ordi = ordinals
+
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000)):
+        if not z:
+            continue
+        number = _sub_thousand_en(z, not i and ordi)
+
+        if i:
+            if i >= len(_SHORT_HUNDREDS_EN):
+                return ""
+            number += " "
+            if ordi:
+
+                if i * 1000 in _SHORT_ORDINAL_EN:
+                    if z == 1:
+                        number = _SHORT_ORDINAL_EN[i * 1000]
+                    else:
+                        number += _SHORT_ORDINAL_EN[i * 1000]
+                else:
+                    if n not in _SHORT_SCALE_EN:
+                        num = int("1" + "0" * (len(str(n)) - 2))
+
+                        number += _SHORT_SCALE_EN[num] + "th"
+                    else:
+                        number = _SHORT_SCALE_EN[n] + "th"
+            else:
+                number += _SHORT_HUNDREDS_EN[i]
+        res.append(number)
+        ordi = False
+
+    return ", ".join(reversed(res))
+
+
+def _long_scale_en(n, places=2, scientific=False, ordinals=False):
+    if n >= _MAX_LONG_SCALE_EN:
+        return "infinity"
+    ordi = ordinals
+    if int(n) != n:
+        ordi = False
+    n = int(n)
+    assert 0 <= n
+    res = []
+    for i, z in enumerate(_split_by(n, 1000000)):
+        if not z:
+            continue
+        number = pronounce_number_en(z, places, True, scientific,
+                                     ordinals=ordi and not i)
+        # strip off the comma after the thousand
+        if i:
+            if i >= len(_LONG_HUNDREDS_EN):
+                return ""
+            # plus one as we skip 'thousand'
+            # (and 'hundred', but this is excluded by index value)
+            number = number.replace(',', '')
+
+            if ordi:
+                if i * 1000000 in _LONG_ORDINAL_EN:
+                    if z == 1:
+                        number = _LONG_ORDINAL_EN[
+                            (i + 1) * 1000000]
+                    else:
+                        number += _LONG_ORDINAL_EN[
+                            (i + 1) * 1000000]
+                else:
+                    if n not in _LONG_SCALE_EN:
+                        num = int("1" + "0" * (len(str(n)) - 2))
+
+                        number += " " + _LONG_SCALE_EN[
+                            num] + "th"
+                    else:
+                        number = " " + _LONG_SCALE_EN[n] + "th"
+            else:
+
+                number += " " + _LONG_HUNDREDS_EN[i + 1]
+        res.append(number)
+    return ", ".join(reversed(res))
+
+
+@memoize_integers()
 def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -113,21 +237,7 @@ def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
                     'negative ' if power < 0 else '',
                     pronounce_number_en(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_EN.copy()
-        number_names.update(_SHORT_SCALE_EN)
-    else:
-        number_names = _NUM_STRING_EN.copy()
-        number_names.update(_LONG_SCALE_EN)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_EN[n] for n in _SHORT_SCALE_EN.keys()]
-    else:
-        hundreds = [_LONG_SCALE_EN[n] for n in _LONG_SCALE_EN.keys()]
+    number_names = _NUMBER_NAMES_EN[bool(short_scale)]
 
     # deal with negatives
     result = ""
@@ -175,118 +285,10 @@ def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
         if num > 90:
             result += "one "
         result += number_names[num]
+    elif short_scale:
+        result += _short_scale_en(num, ordinals)
     else:
-        def _sub_thousand(n, ordinals=False):
-            assert 0 <= n <= 999
-            if n in _SHORT_ORDINAL_EN and ordinals:
-                return _SHORT_ORDINAL_EN[n]
-            if n <= 19:
-                return digits[n]
-            elif n <= 99:
-                q, r = divmod(n, 10)
-                return tens[q - 1] + (" " + _sub_thousand(r, ordinals) if r
-                                      else "")
-            else:
-                q, r = divmod(n, 100)
-                return digits[q] + " hundred" + (
-                    " and " + _sub_thousand(r, ordinals) if r else "")
-
-        def _short_scale(n):
-            if n >= max(_SHORT_SCALE_EN.keys()):
-                return "infinity"
-            ordi = ordinals
-
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000)):
-                if not z:
-                    continue
-                number = _sub_thousand(z, not i and ordi)
-
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    number += " "
-                    if ordi:
-
-                        if i * 1000 in _SHORT_ORDINAL_EN:
-                            if z == 1:
-                                number = _SHORT_ORDINAL_EN[i * 1000]
-                            else:
-                                number += _SHORT_ORDINAL_EN[i * 1000]
-                        else:
-                            if n not in _SHORT_SCALE_EN:
-                                num = int("1" + "0" * (len(str(n)) - 2))
-
-                                number += _SHORT_SCALE_EN[num] + "th"
-                            else:
-                                number = _SHORT_SCALE_EN[n] + "th"
-                    else:
-                        number += hundreds[i]
-                res.append(number)
-                ordi = False
-
-            return ", ".join(reversed(res))
-
-        def _split_by(n, split=1000):
-            assert 0 <= n
-            res = []
-            while n:
-                n, r = divmod(n, split)
-                res.append(r)
-            return res
-
-        def _long_scale(n):
-            if n >= max(_LONG_SCALE_EN.keys()):
-                return "infinity"
-            ordi = ordinals
-            if int(n) != n:
-                ordi = False
-            n = int(n)
-            assert 0 <= n
-            res = []
-            for i, z in enumerate(_split_by(n, 1000000)):
-                if not z:
-                    continue
-                number = pronounce_number_en(z, places, True, scientific,
-                                             ordinals=ordi and not i)
-                # strip off the comma after the thousand
-                if i:
-                    if i >= len(hundreds):
-                        return ""
-                    # plus one as we skip 'thousand'
-                    # (and 'hundred', but this is excluded by index value)
-                    number = number.replace(',', '')
-
-                    if ordi:
-                        if i * 1000000 in _LONG_ORDINAL_EN:
-                            if z == 1:
-                                number = _LONG_ORDINAL_EN[
-                                    (i + 1) * 1000000]
-                            else:
-                                number += _LONG_ORDINAL_EN[
-                                    (i + 1) * 1000000]
-                        else:
-                            if n not in _LONG_SCALE_EN:
-                                num = int("1" + "0" * (len(str(n)) - 2))
-
-                                number += " " + _LONG_SCALE_EN[
-                                    num] + "th"
-                            else:
-                                number = " " + _LONG_SCALE_EN[n] + "th"
-                    else:
-
-                        number += " " + hundreds[i + 1]
-                res.append(number)
-            return ", ".join(reversed(res))
-
-        if short_scale:
-            result += _short_scale(num)
-        else:
-            result += _long_scale(num)
+        result += _long_scale_en(num, places, scientific, ordinals)
 
     # deal with scientific notation unpronounceable as number
     if not result and "e" in str(num):
@@ -303,6 +305,7 @@ def pronounce_number_en(number, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_en(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -389,10 +392,8 @@ def nice_time_en(dt, speech=True, use_24hour=False, use_ampm=False):
 
 def describe_color_en(color):
 
-    resource_file = resolve_resource_file(f"text/en-us/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = get_cached_resource("colors.json", "en-us",
+                                 fallback="text/webcolors.json")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
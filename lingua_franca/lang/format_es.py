@@ -17,7 +17,8 @@
 Format functions for castillian (es-es)
 
 """
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_es import _NUM_STRING_ES, \
     _FRACTION_STRING_ES
 
@@ -91,6 +92,7 @@ def nice_number_es(number, speech=True, denominators=range(1, 21)):
     return strNumber
 
 
+@memoize_integers()
 def pronounce_number_es(number, places=2):
     """
     Convert a number to it's spoken equivalent
@@ -153,6 +155,7 @@ def pronounce_number_es(number, places=2):
     return result
 
 
+@memoize_times()
 def nice_time_es(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -17,7 +17,8 @@
 Format functions for Euskara (eu-eu)
 
 """
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.time import to_local, now_local
 
 HOUR_STRING_EU = {
@@ -164,6 +165,7 @@ def nice_number_eu(number, speech=True, denominators=range(1, 21)):
     return strNumber
 
 
+@memoize_integers()
 def pronounce_number_eu(num, places=2):
     """
     Convert a number to it's spoken equivalent
@@ -228,6 +230,7 @@ def pronounce_number_eu(num, places=2):
     return result
 
 
+@memoize_times()
 def nice_time_eu(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
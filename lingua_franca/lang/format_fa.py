@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_fa import \
     _FARSI_ONES, _FARSI_TENS, _FARSI_HUNDREDS, _FARSI_BIG, _FARSI_SEPERATOR, \
     _FARSI_FRAC, _FARSI_FRAC_BIG, _FRACTION_STRING_FA, _FORMAL_VARIANT
@@ -183,6 +184,8 @@ def _to_cardinal(number, places):
         return _fractional(y, l)
     return _cardinalPos(x) + _FARSI_SEPERATOR + _fractional(y, l)
 
+
+@memoize_integers()
 @_handle_number_variant
 def pronounce_number_fa(number, places=2, scientific=False,
                         ordinals=False, variant=None):
@@ -223,6 +226,7 @@ def pronounce_number_fa(number, places=2, scientific=False,
     return _to_cardinal(number, places)
     
 @_handle_number_variant
+@memoize_times()
 def nice_time_fa(dt, speech=True, use_24hour=False, use_ampm=False, variant=None):
     """
     Format a time to a comfortable human format
@@ -13,7 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_fr import _NUM_STRING_FR, \
     _FRACTION_STRING_FR
 
@@ -87,6 +88,7 @@ def nice_number_fr(number, speech=True, denominators=range(1, 21)):
     return strNumber
 
 
+@memoize_integers()
 def pronounce_number_fr(number, places=2):
     """
     Convert a number to it's spoken equivalent
@@ -150,6 +152,7 @@ def pronounce_number_fr(number, places=2):
     return result
 
 
+@memoize_times()
 def nice_time_fr(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
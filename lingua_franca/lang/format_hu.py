@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_hu import _NUM_POWERS_OF_TEN, \
     _EXTRA_SPACE_HU, _FRACTION_STRING_HU, _MONTHS_HU, _NUM_STRING_HU
 from math import floor
@@ -74,6 +75,7 @@ def nice_number_hu(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_hu(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -230,6 +232,7 @@ def pronounce_ordinal_hu(number):
         return root + "edik" if vtype == 1 else root + "adik"
 
 
+@memoize_times()
 def nice_time_hu(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
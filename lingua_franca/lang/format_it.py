@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_it import _NUM_STRING_IT, \
     _FRACTION_STRING_IT, _LONG_SCALE_IT, _SHORT_SCALE_IT
 
@@ -76,6 +77,14 @@ def nice_number_it(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_IT = {
+    True: number_tables(_NUM_STRING_IT, _SHORT_SCALE_IT),
+    False: number_tables(_NUM_STRING_IT, _LONG_SCALE_IT)
+}
+
+
+@memoize_integers()
 def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
     """
     Convert a number to it's spoken equivalent
@@ -110,21 +119,8 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
                 'meno ' if power < 0 else '',
                 pronounce_number_it(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_IT.copy()
-        number_names.update(_SHORT_SCALE_IT)
-    else:
-        number_names = _NUM_STRING_IT.copy()
-        number_names.update(_LONG_SCALE_IT)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_IT[n] for n in _SHORT_SCALE_IT.keys()]
-    else:
-        hundreds = [_LONG_SCALE_IT[n] for n in _LONG_SCALE_IT.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_IT[bool(short_scale)]
 
     # deal with negatives
     result = ""
@@ -237,6 +233,7 @@ def pronounce_number_it(number, places=2, short_scale=False, scientific=False):
     return result
 
 
+@memoize_times()
 def nice_time_it(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_nl import _NUM_POWERS_OF_TEN, \
     _NUM_STRING_NL, _FRACTION_STRING_NL, _EXTRA_SPACE_NL, _MONTHS_NL
 from math import floor
@@ -58,6 +59,7 @@ def nice_number_nl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_nl(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -202,6 +204,7 @@ def pronounce_ordinal_nl(number):
     return pronounce_number_nl(number) + "ste"
 
 
+@memoize_times()
 def nice_time_nl(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _FRACTION_STRING_PL, _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _ALT_ORDINALS_PL
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -61,6 +62,11 @@ def nice_number_pl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+_NUMBER_TABLES_PL = number_tables(_NUM_STRING_PL, _SHORT_SCALE_PL)
+_ORDINAL_TENS_PL = [_SHORT_ORDINAL_PL[n] for n in range(10, 100, 10)]
+
+
+@memoize_integers()
 def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
                         ordinals=False, scientific_run=False):
     """
@@ -107,15 +113,9 @@ def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
                     'minus ' if power < 0 else '',
                     pronounce_number_pl(abs(power), places, short_scale, False))
 
-    number_names = _NUM_STRING_PL.copy()
-    number_names.update(_SHORT_SCALE_PL)
-
-    digits = [number_names[n] for n in range(0, 20)]
+    number_names, digits, tens, hundreds = _NUMBER_TABLES_PL
     if ordinals:
-        tens = [_SHORT_ORDINAL_PL[n] for n in range(10, 100, 10)]
-    else:
-        tens = [number_names[n] for n in range(10, 100, 10)]
-    hundreds = [_SHORT_SCALE_PL[n] for n in _SHORT_SCALE_PL.keys()]
+        tens = _ORDINAL_TENS_PL
 
     # deal with negatives
     result = ""
@@ -232,6 +232,7 @@ def pronounce_number_pl(num, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_pl(dt, speech=True, use_24hour=True, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -13,11 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_pt import _FRACTION_STRING_PT, \
     _NUM_STRING_PT
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.internal import get_cached_resource
 
 
 def nice_number_pt(number, speech, denominators=range(1, 21)):
@@ -74,6 +74,7 @@ def nice_number_pt(number, speech, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_pt(number, places=2):
     """
     Convert a number to it's spoken equivalent
@@ -116,6 +117,7 @@ def pronounce_number_pt(number, places=2):
     return result
 
 
+@memoize_times()
 def nice_time_pt(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -225,9 +227,7 @@ def nice_time_pt(dt, speech=True, use_24hour=False, use_ampm=False):
 
 
 def describe_color_pt(color):
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = json.load(f)
+    COLORS = get_cached_resource("colors.json", "pt-pt")
 
     if color.hex in COLORS:
         return COLORS.get(color.hex)
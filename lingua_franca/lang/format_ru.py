@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _FRACTION_STRING_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, _LONG_ORDINAL_RU
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -75,6 +76,14 @@ def nice_number_ru(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_RU = {
+    True: number_tables(_NUM_STRING_RU, _SHORT_SCALE_RU),
+    False: number_tables(_NUM_STRING_RU, _LONG_SCALE_RU)
+}
+
+
+@memoize_integers()
 def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -122,21 +131,8 @@ def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
                     'минус ' if power < 0 else '',
                     pronounce_number_ru(abs(power), places, short_scale, False, ordinals=False))
 
-    if short_scale:
-        number_names = _NUM_STRING_RU.copy()
-        number_names.update(_SHORT_SCALE_RU)
-    else:
-        number_names = _NUM_STRING_RU.copy()
-        number_names.update(_LONG_SCALE_RU)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_RU[n] for n in _SHORT_SCALE_RU.keys()]
-    else:
-        hundreds = [_LONG_SCALE_RU[n] for n in _LONG_SCALE_RU.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_RU[bool(short_scale)]
 
     # deal with negative numbers
     result = ""
@@ -303,6 +299,7 @@ def pronounce_number_ru(number, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_ru(dt, speech=True, use_24hour=True, use_ampm=False):
     """
     Format a time to a comfortable human format
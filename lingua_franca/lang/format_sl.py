@@ -17,7 +17,8 @@
 
 from lingua_franca.lang.common_data_sl import _NUM_STRING_SL, \
     _FRACTION_STRING_SL, _LONG_SCALE_SL, _SHORT_SCALE_SL, _SHORT_ORDINAL_SL
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 
 
 def nice_number_sl(number, speech=True, denominators=range(1, 21)):
@@ -67,6 +68,14 @@ def nice_number_sl(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_SL = {
+    True: number_tables(_NUM_STRING_SL, _SHORT_SCALE_SL),
+    False: number_tables(_NUM_STRING_SL, _LONG_SCALE_SL)
+}
+
+
+@memoize_integers()
 def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -113,21 +122,8 @@ def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
                     'minus ' if power < 0 else '',
                     pronounce_number_sl(abs(power), places, short_scale, False))
 
-    if short_scale:
-        number_names = _NUM_STRING_SL.copy()
-        number_names.update(_SHORT_SCALE_SL)
-    else:
-        number_names = _NUM_STRING_SL.copy()
-        number_names.update(_LONG_SCALE_SL)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_SL[n] for n in _SHORT_SCALE_SL.keys()]
-    else:
-        hundreds = [_LONG_SCALE_SL[n] for n in _LONG_SCALE_SL.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_SL[bool(short_scale)]
 
     # deal with negatives
     result = ""
@@ -332,6 +328,7 @@ def pronounce_number_sl(num, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_sl(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
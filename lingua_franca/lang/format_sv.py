@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, \
+    memoize_integers, memoize_times
 from lingua_franca.lang.common_data_sv import _EXTRA_SPACE_SV, \
     _FRACTION_STRING_SV, _MONTHS_SV, _NUM_POWERS_OF_TEN_SV, _NUM_STRING_SV
 from math import floor
@@ -64,6 +65,7 @@ def nice_number_sv(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+@memoize_integers()
 def pronounce_number_sv(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -219,6 +221,7 @@ def pronounce_ordinal_sv(number):
     return result
 
 
+@memoize_times()
 def nice_time_sv(dt, speech=True, use_24hour=False, use_ampm=False):
     """
     Format a time to a comfortable human format
@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    memoize_integers, number_tables, memoize_times
 from lingua_franca.lang.common_data_uk import _NUM_STRING_UK, \
     _FRACTION_STRING_UK, _LONG_SCALE_UK, _SHORT_SCALE_UK, \
     _SHORT_ORDINAL_UK, _LONG_ORDINAL_UK, HOURS_UK
@@ -73,6 +74,14 @@ def nice_number_uk(number, speech=True, denominators=range(1, 21)):
     return return_string
 
 
+# lookup tables for the short (True) and long (False) scale
+_NUMBER_TABLES_UK = {
+    True: number_tables(_NUM_STRING_UK, _SHORT_SCALE_UK),
+    False: number_tables(_NUM_STRING_UK, _LONG_SCALE_UK)
+}
+
+
+@memoize_integers()
 def pronounce_number_uk(number, places=2, short_scale=True, scientific=False,
                         ordinals=False):
     """
@@ -132,21 +141,8 @@ def pronounce_number_uk(number, places=2, short_scale=True, scientific=False,
                     'мінус ' if power < 0 else '',
                     pronounce_number_uk(abs(power), places, short_scale, False, ordinals=False))
 
-    if short_scale:
-        number_names = _NUM_STRING_UK.copy()
-        number_names.update(_SHORT_SCALE_UK)
-    else:
-        number_names = _NUM_STRING_UK.copy()
-        number_names.update(_LONG_SCALE_UK)
-
-    digits = [number_names[n] for n in range(0, 20)]
-
-    tens = [number_names[n] for n in range(10, 100, 10)]
-
-    if short_scale:
-        hundreds = [_SHORT_SCALE_UK[n] for n in _SHORT_SCALE_UK.keys()]
-    else:
-        hundreds = [_LONG_SCALE_UK[n] for n in _LONG_SCALE_UK.keys()]
+    number_names, digits, tens, hundreds = \
+        _NUMBER_TABLES_UK[bool(short_scale)]
 
     # deal with negative numbers
     result = ""
@@ -318,6 +314,7 @@ def pronounce_number_uk(number, places=2, short_scale=True, scientific=False,
     return result
 
 
+@memoize_times()
 def nice_time_uk(dt, speech=True, use_24hour=True, use_ampm=False):
     """
     Format a time to a comfortable human format
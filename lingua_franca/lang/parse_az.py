@@ -20,14 +20,14 @@ from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Normalizer, \
+    extract_numbers_with_text, DurationPattern
 from lingua_franca.lang.common_data_az import _LONG_SCALE_AZ, \
     _SHORT_SCALE_AZ, _NEGATIVES_AZ, _SUMS_AZ, _MULTIPLIES_LONG_SCALE_AZ, \
     _MULTIPLIES_SHORT_SCALE_AZ, _FRACTION_MARKER_AZ, _DECIMAL_MARKER_AZ, \
     _STRING_NUM_AZ, _STRING_SHORT_ORDINAL_AZ, _STRING_LONG_ORDINAL_AZ, \
     _FRACTION_STRING_AZ, _generate_plurals_az, _SPOKEN_EXTRA_NUM_AZ
 
-import re
 import json
 from lingua_franca.internal import resolve_resource_file
 
@@ -87,25 +87,11 @@ def _extract_numbers_with_text_az(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_az(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_az(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER_AZ | _DECIMAL_MARKER_AZ)
 
 
 def _extract_number_with_text_az(tokens, short_scale=True,
@@ -548,6 +534,19 @@ def extract_number_az(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# the last letter of each unit is optional
+_DURATION_PATTERN_AZ = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:yə|a|ə)?(?:(?:\s|,)+)?"
+    r"(?P<half>yarım|0\.5)?(?:a)?",
+    {'mikrosaniyə?': 'microseconds',
+     'milisaniyə?': 'milliseconds',
+     'saniyə?': 'seconds',
+     'dəqiqə?': 'minutes',
+     'saat?': 'hours',
+     'gün?': 'days',
+     'həftə?': 'weeks'})
+
+
 def extract_duration_az(text):
     """
     Convert an azerbaijani phrase into a number of seconds
@@ -587,24 +586,11 @@ def extract_duration_az(text):
         'weeks': 0
     }
 
-    time_units_az = {
-        'mikrosaniyə': 'microseconds',
-        'milisaniyə': 'milliseconds',
-        'saniyə': 'seconds',
-        'dəqiqə': 'minutes',
-        'saat': 'hours',
-        'gün': 'days',
-        'həftə': 'weeks'
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}?(?:yə|a|ə)?(?:(?:\s|,)+)?(?P<half>yarım|0\.5)?(?:a)?"
     text = _convert_words_to_numbers_az(text)
-    for unit_az in time_units_az:
-        unit_pattern = pattern.format(unit=unit_az)
-        def repl(match):
-            time_units[time_units_az[unit_az]] += float(match.group(1)) + (0.5 if match.group(2) else 0)
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    text, durations = _DURATION_PATTERN_AZ.extract(text)
+    for unit_en, match in durations:
+        time_units[unit_en] += float(match.group("value")) + \
+            (0.5 if match.group("half") else 0)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1222,6 +1208,9 @@ class AzerbaijaniNormalizer(Normalizer):
         return _convert_words_to_numbers_az(utterance, ordinals=None)
 
 
+_NORMALIZER_AZ = AzerbaijaniNormalizer()
+
+
 def normalize_az(text, remove_articles=True):
     """ Azerbaijani string normalization """
-    return AzerbaijaniNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_AZ.normalize(text, remove_articles)
@@ -255,9 +255,12 @@ class CatalanNormalizer(Normalizer):
         return tokens
 
 
+_NORMALIZER_CA = CatalanNormalizer()
+
+
 def normalize_ca(text, remove_articles=True):
     """ CA string normalization """
-    return CatalanNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_CA.normalize(text, remove_articles)
 
 
 def extract_datetime_ca(text, anchorDate=None, default_time=None):
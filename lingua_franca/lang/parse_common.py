@@ -14,12 +14,24 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from datetime import timedelta
+from functools import lru_cache
 import re
-import json
 import unicodedata
 
 from quebra_frases import word_tokenize
-from lingua_franca.internal import  resolve_resource_file, FunctionNotLocalizedError
+from lingua_franca.internal import get_cached_resource, \
+    FunctionNotLocalizedError
+
+
+@lru_cache(maxsize=4096)
+def _retokenize(word):
+    """ word_tokenize() of a single word, as the next step would see it
+
+    Tokens depend on their context, e.g. "lingua_franca.lang.format" has a
+    ".lang." token which is ".", "lang", "." on its own
+    """
+    return tuple(word_tokenize(word))
 
 
 class Normalizer:
@@ -162,41 +174,284 @@ class Normalizer:
         utterance = " ".join(words)
         return utterance
 
+    def _is_overridden(self, method_name):
+        return getattr(type(self), method_name) is not \
+            getattr(Normalizer, method_name)
+
+    def _compile(self, remove_articles):
+        """ Build the list of rewrite steps that normalize() applies.
+
+        Consecutive steps that only look at one word at a time are fused
+        into a single pass over the tokens, as long as neither the step
+        nor `tokenize` is overridden by a subclass. Overridden steps, such
+        as English numbers_to_digits, receive and return the full string.
+
+        Returns:
+            list: [(is_word_pass, rewrites or string step)]
+        """
+        word_steps = [("expand_contractions", self.should_expand_contractions),
+                      ("replace_words", True),
+                      ("numbers_to_digits", self.should_numbers_to_digits),
+                      ("remove_symbols", self.should_remove_symbols),
+                      ("remove_accents", self.should_remove_accents),
+                      ("remove_articles", remove_articles),
+                      ("remove_stopwords", self.should_remove_stopwords)]
+        fuse = not self._is_overridden("tokenize")
+        steps = []
+        for name, enabled in word_steps:
+            if not enabled:
+                continue
+            if not fuse or self._is_overridden(name):
+                steps.append((False, getattr(self, name)))
+                continue
+            if not steps or not steps[-1][0]:
+                steps.append((True, []))
+            steps[-1][1].append(self._word_rewrite(name))
+        return steps
+
+    def _word_rewrite(self, name):
+        """ A single-word version of one of the normalization steps.
+
+        The returned callable takes a word and returns it unchanged, or
+        returns the list of words it should be replaced with.
+        """
+        def replace(mapping):
+            # replacements may be several words long, or empty
+            table = {k: self.tokenize(v) for k, v in mapping.items()}
+            return lambda word: table.get(word, word)
+
+        def remove(words):
+            words = frozenset(words)
+            return lambda word: [] if word in words else word
+
+        if name == "expand_contractions":
+            return replace(self.contractions)
+        if name == "replace_words":
+            return replace(self.word_replacements)
+        if name == "numbers_to_digits":
+            return replace(self.number_replacements)
+        if name == "remove_symbols":
+            return remove(self.symbols)
+        if name == "remove_articles":
+            return remove(self.articles)
+        if name == "remove_stopwords":
+            return remove(self.stopwords)
+        if name == "remove_accents":
+            accents = list(self.accents.items())
+
+            def remove_accents(word):
+                new_word = word
+                for s, r in accents:
+                    new_word = new_word.replace(s, r)
+                return word if new_word == word else self.tokenize(new_word)
+            return remove_accents
+        raise ValueError("unknown normalization step: " + name)
+
+    def _rewrite_words(self, words, rewrites):
+        out = []
+        last = len(rewrites) - 1
+
+        def rewrite(word, start):
+            for idx in range(start, len(rewrites)):
+                new_words = rewrites[idx](word)
+                if new_words is not word:
+                    # replacements are tokenized on their own already
+                    for w in new_words:
+                        rewrite(w, idx + 1)
+                    return
+                if idx < last:
+                    # the steps tokenize the joined words again, which can
+                    # split a word kept from a longer text
+                    tokens = _retokenize(word)
+                    if len(tokens) != 1 or tokens[0] != word:
+                        for w in tokens:
+                            rewrite(w, idx + 1)
+                        return
+            out.append(word)
+
+        for word in words:
+            rewrite(word, 0)
+        return out
+
     def normalize(self, utterance="", remove_articles=None):
+        """ Apply every enabled normalization step to `utterance`
+
+        The steps are compiled the first time they are needed, so changes
+        made to `self.config` afterwards are not picked up.
+        """
+        # TODO deprecate remove_articles param, backwards compat
+        remove_articles = bool(remove_articles) or self.should_remove_articles
+        try:
+            steps = self._compiled_steps[remove_articles]
+        except AttributeError:
+            self._compiled_steps = {}
+            steps = None
+        except KeyError:
+            steps = None
+        if steps is None:
+            steps = self._compiled_steps[remove_articles] = \
+                self._compile(remove_articles)
+
         # mutations
         if self.should_lowercase:
             utterance = utterance.lower()
-        if self.should_expand_contractions:
-            utterance = self.expand_contractions(utterance)
-        utterance = self.replace_words(utterance)
-        if self.should_numbers_to_digits:
-            utterance = self.numbers_to_digits(utterance)
-
-        # removals
-        if self.should_remove_symbols:
-            utterance = self.remove_symbols(utterance)
-        if self.should_remove_accents:
-            utterance = self.remove_accents(utterance)
-        # TODO deprecate remove_articles param, backwards compat
-        if remove_articles is not None and remove_articles:
-            utterance = self.remove_articles(utterance)
-        elif self.should_remove_articles:
-            utterance = self.remove_articles(utterance)
-        if self.should_remove_stopwords:
-            utterance = self.remove_stopwords(utterance)
+
+        # words is None whenever utterance holds the current state
+        words = None
+        for is_word_pass, step in steps:
+            if is_word_pass:
+                if words is None:
+                    words = self.tokenize(utterance)
+                words = self._rewrite_words(words, step)
+            else:
+                if words is not None:
+                    utterance = " ".join(words)
+                    words = None
+                utterance = step(utterance)
+        if words is not None:
+            utterance = " ".join(words)
+        if self.should_remove_stopwords and steps[-1][0]:
+            # Remove trailing whitespaces from utterance along with orphaned
+            # hyphens, more characters may be added later
+            utterance = re.sub(r'- *$', '', utterance)
         # remove extra spaces
         utterance = " ".join([w for w in utterance.split(" ") if w])
         return utterance
 
 
-def match_yes_or_no(text, lang):
-    resource_file = resolve_resource_file(f"text/{lang}/yesno.json")
-    if not resource_file:
-        raise FunctionNotLocalizedError(f"yesno.json missing for {lang}")
+def color_names_to_hex(colors):
+    """
+    Invert the contents of a colors.json resource
 
-    with open(resource_file) as f:
-        words = json.load(f)
+    Args:
+        colors dict: {hex code: color name}
+
+    Returns:
+        dict: {lowercase color name: hex code}
+    """
+    return {v.lower(): k for k, v in colors.items()}
+
+
+class TokenTrie:
+    """
+    Trie over sequences of words, used to tag multi-word phrases in a
+    tokenized utterance with a single left to right pass.
+
+    Example:
+        trie = TokenTrie({"dark green": "#013220", "green": "#00ff00"})
+        trie.tag(["a", "dark", "green", "car"])
+        [(1, 3, "#013220")]
+    """
+    # key of the value stored at the node where a phrase ends
+    _VALUE = None
+
+    def __init__(self, phrases=None):
+        """
+        Args:
+            phrases (dict, optional): {phrase: value}, phrases are split
+                                      into words on single spaces
+        """
+        self._root = {}
+        for phrase, value in (phrases or {}).items():
+            if phrase:
+                self.add(phrase.split(" "), value)
+
+    def add(self, words, value):
+        node = self._root
+        for word in words:
+            node = node.setdefault(word, {})
+        node[self._VALUE] = value
+
+    def longest_match(self, words, start=0):
+        """
+        Args:
+            words (list(str)): tokenized utterance
+            start (int): index of the first word of the match
+
+        Returns:
+            (int, any): index after the last word of the longest phrase
+                        starting at words[start], and its value.
+                        None if no phrase starts there
+        """
+        match = None
+        node = self._root
+        for idx in range(start, len(words)):
+            node = node.get(words[idx])
+            if node is None:
+                break
+            if self._VALUE in node:
+                match = (idx + 1, node[self._VALUE])
+        return match
+
+    def tag(self, words):
+        """
+        Tag the longest phrases found in words, without overlaps.
+
+        Args:
+            words (list(str)): tokenized utterance
+
+        Returns:
+            list: [(start index, end index (exclusive), value)]
+        """
+        tags = []
+        idx = 0
+        while idx < len(words):
+            match = self.longest_match(words, idx)
+            if match is None:
+                idx += 1
+                continue
+            end, value = match
+            tags.append((idx, end, value))
+            idx = end
+        return tags
+
+
+def color_name_trie(colors):
+    """
+    Build a TokenTrie of the color names in a colors.json resource
+
+    Args:
+        colors dict: {hex code: color name}
+
+    Returns:
+        TokenTrie: lowercase color names -> hex code
+    """
+    return TokenTrie(color_names_to_hex(colors))
+
+
+def _first_occurrences(phrases, text):
+    """
+    Args:
+        phrases (list): the phrases to look for
+        text (str): the text to search
+
+    Returns:
+        dict: {phrase index: start index of its first occurrence in text}
+              for every phrase found in text
+    """
+    found = {}
+    for idx, phrase in enumerate(phrases):
+        start = text.find(phrase)
+        if start >= 0:
+            found[idx] = start
+    return found
+
+
+class _YesNoMatcher:
+    def __init__(self, words):
         words = {k: [_.lower() for _ in v] for k, v in words.items()}
+        self.neutral_no = words.get("neutral_no", [])
+        # the order matters, later phrases win ties, see match_yes_or_no
+        self.first_no = len(words.get("yes", []))
+        self.yes_no = words.get("yes", []) + words.get("no", [])
+        self.first_neutral_yes = len(self.neutral_no)
+        self.neutral = self.neutral_no + words.get("neutral_yes", [])
+
+
+def match_yes_or_no(text, lang):
+    matcher = get_cached_resource("yesno.json", lang, derive=_YesNoMatcher)
+    if matcher is None:
+        raise FunctionNotLocalizedError(f"yesno.json missing for {lang}")
     # after encoding information is lost
     if lang == 'uk-ua':
         text = unicodedata.normalize('NFD', text)
@@ -205,64 +460,38 @@ def match_yes_or_no(text, lang):
             .encode('ascii', 'ignore').decode("utf-8")
     text = text.lower()
 
+    # None - neutral
+    # True - yes
+    # False - no
 
     # if user says yes but later says no, he changed his mind mid-sentence
-    # the highest index is the last yesno word
-    res = None
-    best = -1
-    # check if user said yes
-    for w in words["yes"]:
-        if w not in text:
-            continue
-        idx = text.index(w)
-        if idx >= best:
-            best = idx
-            res = True
-
-    # check if user said no
-    for w in words["no"]:
-        if w not in text:
-            continue
-
-        idx = text.index(w)
-        if idx >= best:
-            best = idx
-
-            # handle double negatives, eg "its not a lie"
-            double_negs = [f"{w} {neg}" for neg in words.get("neutral_no", [])]
-            for n in double_negs:
-                if n in text and text.index(n) <= idx:
-                    res = True
-                    break
-            else:
-                res = False
+    # the highest index is the last yesno word. On a tie, the phrase listed
+    # last wins, "no" phrases being listed after "yes" phrases
+    found = _first_occurrences(matcher.yes_no, text)
+    if found:
+        if len(found) == 1:
+            (idx, start), = found.items()
+        else:
+            start, idx = max((start, idx) for idx, start in found.items())
+        if idx < matcher.first_no:
+            return True
+        # handle double negatives, eg "its not a lie"
+        w = matcher.yes_no[idx]
+        for neg in matcher.neutral_no:
+            if text.startswith(f"{w} {neg}", start):
+                return True
+        return False
 
+    found = _first_occurrences(matcher.neutral, text)
+    if not found:
+        return None
     # check if user said no, but only if there isn't a previous yes
     # handles cases such as "yes/no, that's a lie" vs "it's a lie" -> no
-    if res is None:
-        for w in words.get("neutral_no", []):
-            if w not in text:
-                continue
-            idx = text.index(w)
-            if idx >= best:
-                best = idx
-                res = False
-
+    if any(idx < matcher.first_neutral_yes for idx in found):
+        return False
     # check if user said yes, but only if there isn't a previous no
     # handles cases such as "no! please! I beg you"
-    if res is None:
-        for w in words.get("neutral_yes", []):
-            if w not in text:
-                continue
-            idx = text.index(w)
-            if idx >= best:
-                best = idx
-                res = True
-
-    # None - neutral
-    # True - yes
-    # False - no
-    return res
+    return True
 
 
 # Token is intended to be used in the number processing functions in
@@ -317,6 +546,302 @@ class ReplaceableNumber:
                                       t=self.tokens)
 
 
+class IncrementalNumberExtractor:
+    """
+    Extract numbers from a stream of words, such as the partial transcripts
+    of a streaming STT engine, without re-parsing what was already seen.
+
+    Words are split into segments at words that can never be part of a
+    number ("apples", "please", ...). Once such a word arrives, the segment
+    before it can no longer change, so it is parsed a single time and its
+    numbers are final. Only the trailing open segment is parsed again, and
+    only when `pending` is read. A fraction or decimal is therefore never
+    built across a word that is not a number word, which
+    _extract_numbers_with_text_xx may do on a whole utterance.
+
+    Token indexes in the returned ReplaceableNumbers count words from the
+    start of the stream.
+
+    Example:
+        stream = incremental_number_extractor(lang="en")
+        stream.feed("add twenty")      # [] - "twenty" may still grow
+        stream.pending                 # [ReplaceableNumber(20, ...)]
+        stream.feed("five eggs")       # [ReplaceableNumber(25, ...)]
+    """
+
+    def __init__(self, extract_handler, is_number_word):
+        """
+        Args:
+            extract_handler (callable): [Token] -> [ReplaceableNumber], the
+                                        language's _extract_numbers_with_text
+            is_number_word (callable): str -> bool, False for words that can
+                                       never be part of a number
+        """
+        self._extract = extract_handler
+        self._is_number_word = is_number_word
+        self._numbers = []
+        self._open = []
+        self._word_count = 0
+
+    @property
+    def numbers(self):
+        """ [ReplaceableNumber]: all numbers that can no longer change """
+        return list(self._numbers)
+
+    @property
+    def pending(self):
+        """ [ReplaceableNumber]: numbers in the open segment, which may still
+            change as more words arrive
+        """
+        if not self._open:
+            return []
+        return self._extract(list(self._open))
+
+    def feed(self, text):
+        """
+        Append words to the stream.
+
+        Args:
+            text (str or list(str)): the new words, either as text or
+                                     already tokenized
+
+        Returns:
+            [ReplaceableNumber]: numbers that became final with these words
+        """
+        words = Normalizer.tokenize(text) if isinstance(text, str) else text
+        finished = []
+        for word in words:
+            token = Token(word, self._word_count)
+            self._word_count += 1
+            if self._is_number_word(word):
+                self._open.append(token)
+            elif self._open:
+                finished += self._close_segment()
+        return finished
+
+    def close(self):
+        """
+        End the stream, making the numbers of the open segment final.
+
+        Returns:
+            [ReplaceableNumber]: numbers that became final
+        """
+        return self._close_segment() if self._open else []
+
+    def _close_segment(self):
+        finished = self._extract(self._open)
+        self._numbers += finished
+        self._open = []
+        return finished
+
+
+class AnchorView:
+    """
+    Read-only view of an anchor date, which remembers what was read from it.
+
+    The parse stage of a DateExpression only gets to see the anchor through
+    this view. Parsing is deterministic, so any other anchor which gives the
+    same values for everything that was read parses the same way.
+    """
+    FEATURES = {
+        "year": lambda anchor: anchor.year,
+        "month": lambda anchor: anchor.month,
+        "day": lambda anchor: anchor.day,
+        "weekday": lambda anchor: anchor.weekday(),  # 0 - monday
+        "hour": lambda anchor: anchor.hour,
+        "minute": lambda anchor: anchor.minute,
+        "days_to_next_month": lambda anchor: (
+            (anchor.replace(day=1) + timedelta(days=32)).replace(day=1) -
+            anchor).days,
+        "days_to_next_year": lambda anchor: (
+            anchor.replace(day=1, month=1, year=anchor.year + 1) -
+            anchor).days,
+    }
+
+    def __init__(self, anchor):
+        self._anchor = anchor
+        self.reads = {}
+
+    def __getattr__(self, name):
+        try:
+            feature = AnchorView.FEATURES[name]
+        except KeyError:
+            raise AttributeError(name)
+        value = self.reads[name] = feature(self._anchor)
+        return value
+
+
+class DateExpression:
+    """
+    A date/time phrase, parsed once and resolved against any anchor date.
+
+    extract_datetime_xx mixes parsing with arithmetic on the anchor date.
+    A DateExpression splits the two: `parse` turns an AnchorView into a
+    compact, hashable state (the offsets, absolute fields, qualifiers and
+    remaining words of the phrase) and `finalize` does the date arithmetic
+    on that state for a concrete anchor.
+
+    The state is kept together with what `parse` read from the anchor, such
+    as its weekday for "next friday". Resolving against another anchor with
+    the same reads reuses the state, so only `finalize` runs; other anchors
+    are parsed (once) for their own reads.
+
+    Example:
+        expression = extract_datetime_expression("next friday at 5pm")
+        expression.resolve(anchor)  # [datetime, "remainder"], or None
+        expression.resolve_many(anchors)
+    """
+    # parsed states kept before starting over, e.g. for a phrase which
+    # reads the minute of the anchor and is resolved every minute
+    max_states = 256
+
+    def __init__(self, text, lang, parse, finalize, default_time=None,
+                 is_absolute=None):
+        """
+        Args:
+            text (str): the phrase
+            lang (str): its language
+            parse (callable): AnchorView -> state
+            finalize (callable): (state, anchor, default_time) ->
+                                 [datetime, str] or None
+            default_time (time): time to use if the phrase has none
+            is_absolute (callable, optional): state -> bool, whether
+                finalize gives the same result for that state whatever the
+                anchor, apart from its timezone
+        """
+        self.text = text
+        self.lang = lang
+        self.default_time = default_time
+        self._parse = parse
+        self._finalize = finalize
+        self._is_absolute = is_absolute
+        # {feature names: {feature values: state}}
+        self._states = {}
+        self._num_states = 0
+
+    def state(self, anchor):
+        """ The parsed state of this phrase for `anchor` """
+        # a copy, as other threads may add to it while resolving the same
+        # cached expression
+        for names, states in list(self._states.items()):
+            values = tuple(AnchorView.FEATURES[name](anchor)
+                           for name in names)
+            state = states.get(values)
+            if state is not None:
+                return state
+        view = AnchorView(anchor)
+        state = self._parse(view)
+        names = tuple(sorted(view.reads))
+        values = tuple(view.reads[name] for name in names)
+        if self._num_states >= self.max_states:
+            self._states = {}
+            self._num_states = 0
+        self._states.setdefault(names, {})[values] = state
+        self._num_states += 1
+        return state
+
+    def is_absolute(self, anchor):
+        """
+        Whether resolve() gives the same result for every anchor in the
+        timezone of `anchor`, as for "june 5th 2025 at 3pm": parsing read
+        nothing from the anchor, and the date arithmetic doesn't use it.
+        """
+        state = self.state(anchor)
+        return self._is_absolute is not None and () in self._states and \
+            self._is_absolute(state)
+
+    def resolve(self, anchor):
+        """
+        Args:
+            anchor (datetime): the date the phrase is relative to
+
+        Returns:
+            [datetime, str]: the date and the text not consumed by it, or
+                             None if the phrase has no date or time
+        """
+        return self._finalize(self.state(anchor), anchor, self.default_time)
+
+    def resolve_many(self, anchors):
+        """ resolve() for each of `anchors`, in order """
+        return [self.resolve(anchor) for anchor in anchors]
+
+    def _key(self):
+        return self.text, self.lang, self.default_time
+
+    def __eq__(self, other):
+        return isinstance(other, DateExpression) and \
+            self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "{n}({t!r}, {l!r}, {d!r})".format(
+            n=self.__class__.__name__, t=self.text, l=self.lang,
+            d=self.default_time)
+
+
+class DurationPattern:
+    """
+    One regex for all the time units of a language's extract_duration_xx.
+
+    Looking for the units one after the other takes a re.sub() over the
+    whole text per unit. A DurationPattern finds a number followed by any of
+    the units in a single scan. The units are alternatives tried in order,
+    so where two of them match at the same place, such as a unit which
+    starts another one, the first one wins as it did when it was looked for
+    first.
+
+    Example:
+        pattern = DurationPattern(r"(?P<value>\\d+)\\s+{unit}s?",
+                                  {"minute": "minutes", "hour": "hours"})
+        pattern.extract("timer for 5 minutes")
+        # ("timer for ", [("minutes", <re.Match '5 minutes'>)])
+    """
+
+    def __init__(self, template, units):
+        """
+        Args:
+            template (str): regex with a "{unit}" placeholder and a "value"
+                            group for the number
+            units (dict): regex of each unit: what extract() reports for it
+        """
+        self.units = list(units.values())
+        self._groups = ["_unit{}".format(idx) for idx in range(len(units))]
+        alternatives = "|".join(
+            "(?P<{}>{})".format(group, unit)
+            for group, unit in zip(self._groups, units))
+        self.regex = re.compile(
+            template.format(unit="(?:" + alternatives + ")"))
+
+    def extract(self, text):
+        """
+        Remove the durations from a text
+
+        Args:
+            text (str): the text to search
+
+        Returns:
+            (str, list): the text without the durations, and the unit and
+                         re.Match of each of them. They are sorted by unit,
+                         in the order of `units`, then by position, the
+                         order looking for one unit after the other would
+                         find them in.
+        """
+        found = []
+
+        def repl(match):
+            for idx, group in enumerate(self._groups):
+                if match.start(group) >= 0:
+                    found.append((idx, match))
+                    break
+            return ''
+
+        text = self.regex.sub(repl, text)
+        found.sort(key=lambda item: item[0])
+        return text, [(self.units[idx], match) for idx, match in found]
+
+
 def tokenize(text):
     """
     Generate a list of token object, given a string.
@@ -331,6 +856,94 @@ def tokenize(text):
             for index, word in enumerate(Normalizer.tokenize(text))]
 
 
+# replaces the words of numbers that were already extracted, so that the
+# remaining tokens keep their indexes
+_PLACEHOLDER = "<placeholder>"
+
+
+def extract_numbers_with_text(tokens, extract_handler, markers=()):
+    """
+    Extract all numbers from a list of Tokens, scanning it left to right.
+
+    extract_handler is a language's _extract_number_with_text_xx, which
+    finds one number in a list of tokens. It is called on the tokens after
+    the last number found, preceded by a summary of the tokens before them:
+    a placeholder for each run of parsed words, plus the markers (e.g. "and",
+    "point") among them. Handlers that split the utterance on a marker thus
+    see the same partitions as they would on the whole, placeholdered list.
+
+    A number found to the right of words that may still hold a number (e.g.
+    "one two and a half" yields 2.5 first) does not move the scan forward,
+    so those words are parsed again along with the rest of the utterance.
+
+    Args:
+        tokens [Token]: the tokens to parse
+        extract_handler (callable): [Token] -> ReplaceableNumber
+        markers (set(str)): words the handler splits the tokens on
+
+    Returns:
+        [ReplaceableNumber]: the numbers found, sorted by position
+    """
+    results = []
+    prefix = []
+    start = 0
+    # the first call gets the caller's list, as callers such as
+    # _convert_words_to_numbers_de read the words the handler rewrote
+    view = tokens
+    tokens = []
+    while True:
+        number = extract_handler(view)
+        # keep words rewritten by the handler, e.g. the "one" of "1st one"
+        tokens[start:] = view[len(prefix):]
+        if not number:
+            break
+        results.append(number)
+
+        first = end = None
+        for pos in range(start, len(tokens)):
+            token = tokens[pos]
+            if token.index > number.end_index:
+                break
+            if token.index >= number.start_index:
+                tokens[pos] = Token(_PLACEHOLDER, token.index)
+                if first is None:
+                    first = pos
+                end = pos + 1
+        if first is None:
+            break
+
+        left = tokens[start:first]
+        if not left or not _may_hold_number(extract_handler, prefix + left +
+                                             tokens[first:end]):
+            for token in tokens[start:end]:
+                if token.word in markers:
+                    prefix.append(token)
+                elif prefix and prefix[-1].word == _PLACEHOLDER:
+                    prefix[-1] = Token(_PLACEHOLDER, token.index)
+                else:
+                    prefix.append(Token(_PLACEHOLDER, token.index))
+            start = end
+            if start == len(tokens):
+                break
+        view = prefix + tokens[start:]
+    results.sort(key=lambda n: n.start_index)
+    return results
+
+
+def _may_hold_number(extract_handler, tokens):
+    """ Whether extract_numbers_with_text() must scan `tokens` again
+
+    Besides a number, a falsy one which has words, such as a lone "quarter"
+    without ordinals, ends the scan once found, and a handler which fails
+    on this shorter list may not fail on the whole utterance.
+    """
+    try:
+        number = extract_handler(tokens)
+    except Exception:
+        return True
+    return bool(number or number.tokens)
+
+
 def partition_list(items, split_on):
     """
     Partition a list of items.
@@ -18,13 +18,13 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Normalizer, \
+    extract_numbers_with_text, DurationPattern
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_CS  # _ARTICLES_CS
 
-import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
@@ -138,26 +138,11 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_cs(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_cs(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER | _DECIMAL_MARKER)
 
 
 def _extract_number_with_text_cs(tokens, short_scale=True,
@@ -599,6 +584,11 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_PATTERN_CS = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?",
+    _TIME_UNITS_CONVERSION)
+
+
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -641,16 +631,11 @@ def extract_duration_cs(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
     text = _convert_words_to_numbers_cs(text)
 
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    text, durations = _DURATION_PATTERN_CS.extract(text)
+    for unit_en, match in durations:
+        time_units[unit_en] += float(match.group("value"))
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1584,9 +1569,12 @@ class CzechNormalizer(Normalizer):
         _default_config = json.load(f)
 
 
+_NORMALIZER_CS = CzechNormalizer()
+
+
 def normalize_cs(text, remove_articles=True):
     """ Czech string normalization """
-    return CzechNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_CS.normalize(text, remove_articles)
 
 
 def _text_cs_inflection_normalize(word, arg):
@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import (
+    extract_numbers_with_text,
     ReplaceableNumber,
     Normalizer,
     Token,
@@ -96,28 +97,11 @@ def _extract_numbers_with_text_de(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_de(tokens, short_scale,
-                                         ordinals)
-
-        if not to_replace:
-            break
-
-        if isinstance(to_replace.value, float) and not fractions:
-            pass
-        else:
-            results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
+    results = extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_de(t, short_scale, ordinals))
+    if not fractions:
+        results = [r for r in results if not isinstance(r.value, float)]
     return results
 
 
@@ -287,7 +271,7 @@ def _extract_real_number_with_text_de(tokens, short_scale):
                     int(components[0]) < 25 and int(components[1]) < 60:
                 _hstr, _mstr = components
                 _mstr = _mstr.ljust(2, "0")
-                tokens[idx] = Token(f"{_hstr}:{_mstr}", idx) 
+                tokens[idx] = Token(f"{_hstr}:{_mstr}", token.index)
                 number_words.clear()
                 _val = _prev_val = None
                 continue    
@@ -1228,5 +1212,8 @@ class GermanNormalizer(Normalizer):
         return super().remove_symbols(utterance)
 
 
+_NORMALIZER_DE = GermanNormalizer()
+
+
 def normalize_de(text, remove_articles=True):
-    return GermanNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_DE.normalize(text, remove_articles)
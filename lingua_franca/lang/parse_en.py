@@ -15,10 +15,13 @@
 #
 import json
 import re
+from collections import namedtuple
 from datetime import datetime, timedelta, time
+from functools import partial
 from dateutil.relativedelta import relativedelta
+from quebra_frases import span_indexed_word_tokenize
 
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.internal import resolve_resource_file, get_cached_resource
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, \
     _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
@@ -26,7 +29,9 @@ from lingua_franca.lang.common_data_en import _ARTICLES_EN, _LONG_ORDINAL_EN, _L
     _STRING_NUM_EN, _STRING_SHORT_ORDINAL_EN, _STRING_LONG_ORDINAL_EN, \
     _generate_plurals_en, _SPOKEN_EXTRA_NUM_EN
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, \
+    Normalizer, color_names_to_hex, IncrementalNumberExtractor, \
+    extract_numbers_with_text, DateExpression, AnchorView, DurationPattern
 from lingua_franca.time import now_local, DAYS_IN_1_YEAR, DAYS_IN_1_MONTH
 from lingua_franca.util.colors import Color, ColorOutOfSpace
 
@@ -41,10 +46,9 @@ def get_color_en(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/en-us/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    COLORS = get_cached_resource("colors.json", "en-us",
+                                 fallback="text/webcolors.json",
+                                 derive=color_names_to_hex)
 
     text = text.lower()
     if text in COLORS:
@@ -150,26 +154,11 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_en(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER_EN | _DECIMAL_MARKER_EN)
 
 
 def _extract_number_with_text_en(tokens, short_scale=True,
@@ -368,7 +357,7 @@ def _extract_whole_number_with_text_en(tokens, short_scale, ordinals):
             # handle nth one
             if next_word == "one":
                 # would return 1 instead otherwise
-                tokens[idx + 1] = Token("", idx)
+                tokens[idx + 1] = Token("", token.index)
                 next_word = ""
 
         # TODO replaces the wall of "and" and "or" with all() or any() as
@@ -577,6 +566,9 @@ def _initialize_number_data_en(short_scale, speech=True):
         (set(str), dict(str, number), dict(str, number))
         multiplies, string_num_ordinal, string_num_scale
 
+    Note:
+        The dictionaries are shared between calls, don't modify them.
+
     """
     multiplies = _MULTIPLIES_SHORT_SCALE_EN if short_scale \
         else _MULTIPLIES_LONG_SCALE_EN
@@ -584,13 +576,25 @@ def _initialize_number_data_en(short_scale, speech=True):
     string_num_ordinal_en = _STRING_SHORT_ORDINAL_EN if short_scale \
         else _STRING_LONG_ORDINAL_EN
 
+    string_num_scale_en = _STRING_NUM_SCALE_EN[bool(short_scale), bool(speech)]
+    return multiplies, string_num_ordinal_en, string_num_scale_en
+
+
+def _build_string_num_scale_en(short_scale, speech):
     string_num_scale_en = _SHORT_SCALE_EN if short_scale else _LONG_SCALE_EN
     string_num_scale_en = invert_dict(string_num_scale_en)
     string_num_scale_en.update(_generate_plurals_en(string_num_scale_en))
 
     if speech:
         string_num_scale_en.update(_SPOKEN_EXTRA_NUM_EN)
-    return multiplies, string_num_ordinal_en, string_num_scale_en
+    return string_num_scale_en
+
+
+# {(short_scale, speech): {word: number}}, see _initialize_number_data_en()
+_STRING_NUM_SCALE_EN = {(short_scale, speech):
+                        _build_string_num_scale_en(short_scale, speech)
+                        for short_scale in (True, False)
+                        for speech in (True, False)}
 
 
 def extract_number_en(text, short_scale=True, ordinals=False):
@@ -613,6 +617,24 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# the units of extract_duration_en(), in the order they used to be looked
+# for, with the timedelta argument they add to and by how much
+_DURATION_PATTERN_EN = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?",
+    {"month": ("days", DAYS_IN_1_MONTH),
+     "year": ("days", DAYS_IN_1_YEAR),
+     "decade": ("days", 10 * DAYS_IN_1_YEAR),
+     "century": ("days", 100 * DAYS_IN_1_YEAR),
+     "millennium": ("days", 1000 * DAYS_IN_1_YEAR),
+     "microsecond": ("microseconds", 1),
+     "millisecond": ("milliseconds", 1),
+     "second": ("seconds", 1),
+     "minute": ("minutes", 1),
+     "hour": ("hours", 1),
+     "day": ("days", 1),
+     "week": ("weeks", 1)})
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -651,42 +673,15 @@ def extract_duration_en(text):
         'days': 0,
         'weeks': 0
     }
-    # NOTE: these are spelled wrong on purpose because of the loop below that strips the s
-    units = ['months', 'years', 'decades', 'centurys', 'millenniums'] + \
-            list(time_units.keys())
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
     text = _convert_words_to_numbers_en(text)
     text = text.replace("centuries", "century").replace("millenia", "millennium")
     for word in ('day', 'month', 'year', 'decade', 'century', 'millennium'):
         text = text.replace(f'a {word}', f'1 {word}')
 
-    for unit_en in units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])  # remove 's' from unit
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        def repl_non_std(match):
-            val = float(match.group(1))
-            if unit_en == "months":
-                val = DAYS_IN_1_MONTH * val
-            if unit_en == "years":
-                val = DAYS_IN_1_YEAR * val
-            if unit_en == "decades":
-                val = 10 * DAYS_IN_1_YEAR * val
-            if unit_en == "centurys":
-                val = 100 * DAYS_IN_1_YEAR * val
-            if unit_en == "millenniums":
-                val = 1000 * DAYS_IN_1_YEAR * val
-            time_units["days"] += val
-            return ''
-
-        if unit_en not in time_units:
-            text = re.sub(unit_pattern, repl_non_std, text)
-        else:
-            text = re.sub(unit_pattern, repl, text)
+    text, durations = _DURATION_PATTERN_EN.extract(text)
+    for (unit, factor), match in durations:
+        time_units[unit] += factor * float(match.group("value"))
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -694,6 +689,169 @@ def extract_duration_en(text):
     return (duration, text)
 
 
+# vocabulary of extract_datetime_en()
+_TIME_QUALIFIERS_AM_EN = frozenset(['morning'])
+_TIME_QUALIFIERS_PM_EN = frozenset(
+    ['afternoon', 'evening', 'night', 'tonight'])
+_TIME_QUALIFIERS_EN = _TIME_QUALIFIERS_AM_EN | _TIME_QUALIFIERS_PM_EN
+_YEAR_MARKERS_EN = frozenset(['in', 'on', 'of'])
+_PAST_MARKERS_EN = frozenset(["was", "last", "past"])
+_EARLIER_MARKERS_EN = frozenset(["ago", "earlier"])
+# in a month -> + 1 month timedelta
+_FUTURE_MARKERS_EN = frozenset(["in", "within"])
+# next month -> day 1 of next month
+_FUTURE_1ST_MARKERS_EN = frozenset(["next"])
+_NEXT_MARKERS_EN = _FUTURE_MARKERS_EN | _FUTURE_1ST_MARKERS_EN
+_MARKERS_EN = _YEAR_MARKERS_EN | {'at', 'by', 'this', 'around', 'for',
+                                  "within"}
+_WEEKDAYS_EN = {day: idx for idx, day in enumerate(
+    ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday',
+     'sunday'])}
+_MONTHS_EN = ['january', 'february', 'march', 'april', 'may', 'june',
+              'july', 'august', 'september', 'october', 'november',
+              'december']
+_MONTH_INDEX_EN = {month: idx for idx, month in enumerate(_MONTHS_EN)}
+_MONTH_SHORT_INDEX_EN = {month: idx for idx, month in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug', 'sept', 'oct',
+     'nov', 'dec'])}
+_RECUR_MARKERS_EN = frozenset(list(_WEEKDAYS_EN) +
+                              [d + 's' for d in _WEEKDAYS_EN] +
+                              ['weekend', 'weekday', 'weekends', 'weekdays'])
+_YEAR_MULTIPLES_EN = frozenset(["decade", "century", "millennium"])
+_DAY_MULTIPLES_EN = frozenset(["weeks", "months", "years"])
+# words that may follow "from" or "after", as in "5 days from tomorrow"
+_VALID_FOLLOWUPS_EN = frozenset(list(_WEEKDAYS_EN) + list(_MONTH_INDEX_EN) +
+                                list(_MONTH_SHORT_INDEX_EN) +
+                                ["today", "tomorrow", "yesterday", "next",
+                                 "last", "past", "now", "this"])
+_ORDINAL_SUFFIXES_EN = ("rd", "st", "nd", "th")
+# a word can only start a date expression if it's one of these (with any
+# trailing "s" removed) or if the next word is in _YEAR_MULTIPLES_EN
+_DATE_WORDS_EN = _EARLIER_MARKERS_EN | _YEAR_MARKERS_EN | \
+    _TIME_QUALIFIERS_EN | _WEEKDAYS_EN.keys() | _MONTH_INDEX_EN.keys() | \
+    _MONTH_SHORT_INDEX_EN.keys() | \
+    {"now", "2", "today", "tomorrow", "yesterday", "before", "day", "week",
+     "weekend", "month", "year", "from", "after"}
+# likewise for time expressions, besides words starting with a digit and
+# words followed by one of _TIME_UNITS_EN
+_TIME_WORDS_EN = frozenset(["noon", "midnight", "morning", "afternoon",
+                            "evening", "tonight", "night", "2", "hour"])
+_TIME_UNITS_EN = frozenset(["hour", "minute", "second"])
+# extract_datetimes_en() starts a new mention at these words, unless they
+# continue a duration, as in "5 days from tomorrow" or "1 hour and 30 minutes"
+_MENTION_BREAKS_EN = frozenset(["and", "or", "to", "until", "till", "then",
+                                "but", "from", "after", "through",
+                                "between"])
+_UNIT_WORDS_EN = frozenset(
+    [unit + plural for unit in ["second", "minute", "hour", "day", "week",
+                                "month", "year"]
+     for plural in ("", "s")]) | _YEAR_MULTIPLES_EN
+# the breaks which always continue a duration before them
+_OFFSET_BREAKS_EN = frozenset(["from", "after"])
+# and at punctuation between two words
+_MENTION_PUNCTUATION_EN = re.compile(r"[,;.!?]")
+# the words a mention can end with; the parse sometimes consumes a word past
+# the value, as "meeting" in "3pm meeting", which is then left out
+_VALUE_WORDS_EN = _DATE_WORDS_EN | _TIME_WORDS_EN | _UNIT_WORDS_EN | \
+    _VALID_FOLLOWUPS_EN | {"am", "pm", "o'clock"}
+_SENTENCE_END_EN = re.compile(r"[;.!?]\s+")
+
+
+# the clean up of _clean_words_en(), in order
+_DATETIME_REPLACEMENTS_EN = [
+    ('?', ''), (',', ''), (' the ', ' '), (' a ', ' '), (' an ', ' '),
+    ("o' clock", "o'clock"), ("o clock", "o'clock"), ("o ' clock", "o'clock"),
+    ("o 'clock", "o'clock"), ("oclock", "o'clock"), ("couple", "2"),
+    ("centuries", "century"), ("decades", "decade"),
+    ("millenniums", "millennium")]
+
+
+def _replace_with_spans(s, spans, old, new):
+    """ s.replace(old, new), along with the spans of the resulting characters
+
+    spans holds the (start, end) of text each character of s comes from, or
+    None. The characters of a replacement get the span of what they replace.
+    """
+    if old not in s:
+        return s, spans
+    result = []
+    end = 0
+    start = s.find(old)
+    while start >= 0:
+        result += spans[end:start]
+        replaced = [span for span in spans[start:start + len(old)] if span]
+        span = (replaced[0][0], replaced[-1][1]) if replaced else None
+        result += [span] * len(new)
+        end = start + len(old)
+        start = s.find(old, end)
+    result += spans[end:]
+    return s.replace(old, new), result
+
+
+def _clean_words_en(text):
+    """ Normalize text for the date parser
+
+    Numbers are converted to digits, the text is lowercased and stripped of
+    punctuation, articles and ordinal suffixes.
+
+    Args:
+        text (str): the text to normalize
+
+    Returns:
+        (list(str), list(tuple(int, int))): the words, and the span of text
+            each of them was made from
+    """
+    # _convert_words_to_numbers_en(text, ordinals=None), keeping the span of
+    # each token, or of all the tokens of a number
+    token_spans = span_indexed_word_tokenize(text)
+    tokens = [Token(word, idx) for idx, (_, _, word) in enumerate(token_spans)]
+    numbers = _extract_numbers_with_text_en(tokens, ordinals=None)
+    numbers.sort(key=lambda number: number.start_index)
+    pieces = []
+    for token, (start, end, _) in zip(tokens, token_spans):
+        if not numbers or token.index < numbers[0].start_index:
+            pieces.append([token.word, start, end])
+        else:
+            if token.index == numbers[0].start_index:
+                pieces.append([str(numbers[0].value), start, end])
+            if token.index == numbers[0].end_index:
+                pieces[-1][2] = end
+                numbers.pop(0)
+
+    s = ' '.join(piece[0] for piece in pieces)
+    spans = []
+    for idx, (word, start, end) in enumerate(pieces):
+        if idx:
+            spans.append(None)
+        if word == text[start:end]:
+            spans += [(char, char + 1) for char in range(start, end)]
+        else:
+            spans += [(start, end)] * len(word)
+
+    # clean unneeded punctuation and capitalization among other things.
+    lowered = s.lower()
+    if len(lowered) != len(s):
+        spans = [span for char, span in zip(s, spans) for _ in char.lower()]
+    s = lowered
+    for old, new in _DATETIME_REPLACEMENTS_EN:
+        s, spans = _replace_with_spans(s, spans, old, new)
+
+    wordList = []
+    wordSpans = []
+    for match in re.finditer(r"\S+", s):
+        word = match.group().replace("'s", "")
+
+        if word[0].isdigit():
+            for ordinal in _ORDINAL_SUFFIXES_EN:
+                # "second" is the only case we should not do this
+                if ordinal in word and "second" not in word:
+                    word = word.replace(ordinal, "")
+        wordList.append(word)
+        wordSpans.append((spans[match.start()][0], spans[match.end() - 1][1]))
+
+    return wordList, wordSpans
+
+
 def extract_datetime_en(text, anchorDate=None, default_time=None):
     """ Convert a human date reference into an exact datetime
 
@@ -724,87 +882,85 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                          text not consumed in the parsing, or None if no
                          date or time related text was found.
     """
+    if not anchorDate:
+        anchorDate = now_local()
 
-    def clean_string(s):
-        # normalize and lowercase utt  (replaces words with numbers)
-        s = _convert_words_to_numbers_en(s, ordinals=None)
-        # clean unneeded punctuation and capitalization among other things.
-        s = s.lower().replace('?', '').replace(',', '') \
-            .replace(' the ', ' ').replace(' a ', ' ').replace(' an ', ' ') \
-            .replace("o' clock", "o'clock").replace("o clock", "o'clock") \
-            .replace("o ' clock", "o'clock").replace("o 'clock", "o'clock") \
-            .replace("oclock", "o'clock").replace("couple", "2") \
-            .replace("centuries", "century").replace("decades", "decade") \
-            .replace("millenniums", "millennium")
-
-        wordList = s.split()
-        for idx, word in enumerate(wordList):
-            word = word.replace("'s", "")
-
-            ordinals = ["rd", "st", "nd", "th"]
-            if word[0].isdigit():
-                for ordinal in ordinals:
-                    # "second" is the only case we should not do this
-                    if ordinal in word and "second" not in word:
-                        word = word.replace(ordinal, "")
-            wordList[idx] = word
-
-        return wordList
+    expression = extract_datetime_expression_en(text, default_time)
+    if expression is None:
+        return None
+    return expression.resolve(anchorDate)
 
-    def date_found():
-        return found or \
-               (
-                       datestr != "" or
-                       yearOffset != 0 or monthOffset != 0 or
-                       dayOffset is True or hrOffset != 0 or
-                       hrAbs or minOffset != 0 or
-                       minAbs or secOffset != 0
-               )
 
-    if not anchorDate:
-        anchorDate = now_local()
+# the parsed state of a date/time phrase, see extract_datetime_expression_en()
+# words are blanked once parsed, except the indices in read, such as
+# "tonight", which the parse reads but leaves in the remaining text
+_DateStateEn = namedtuple("_DateStateEn", [
+    "now", "found", "datestr", "has_year", "year_offset", "month_offset",
+    "day_offset", "hr_offset", "min_offset", "sec_offset", "hr_abs",
+    "min_abs", "day_specified", "words", "read"])
+
+
+def extract_datetime_expression_en(text, default_time=None):
+    """ Parse a date/time phrase once, to resolve it against any anchor date
+
+    extract_datetime_en(text, anchor, default_time) is the same as
+    extract_datetime_expression_en(text, default_time).resolve(anchor),
+    see DateExpression.
 
+    Args:
+        text (str): string containing date words
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        DateExpression: None if text is empty
+    """
     if text == "":
         return None
-    default_time = default_time or time(0, 0, 0)
+    words, _ = _clean_words_en(text)
+    return DateExpression(text, "en",
+                          partial(_parse_datetime_en, tuple(words)),
+                          _finalize_datetime_en,
+                          default_time or time(0, 0, 0),
+                          _is_absolute_datetime_en)
+
+
+def _is_absolute_datetime_en(state):
+    """ Whether _finalize_datetime_en() doesn't use the anchor for `state`
+
+    An explicit date with its year and no offsets, e.g. "june 5th 2025 at
+    3pm", only takes the timezone of the anchor.
+    """
+    return not state.now and state.datestr != "" and state.has_year and \
+        state.day_offset is not True and not state.day_offset and \
+        not (state.year_offset or state.month_offset or state.hr_offset or
+             state.min_offset or state.sec_offset)
+
+
+def _parse_datetime_en(words, anchor):
+    """ The parse stage of extract_datetime_expression_en()
+
+    Args:
+        words (tuple(str)): the cleaned up words of the phrase
+        anchor (AnchorView): the anchor date
+
+    Returns:
+        _DateStateEn
+    """
+    def today():
+        # day of the week, 0 - sunday
+        return (anchor.weekday + 1) % 7
+
+    words = list(words)
     found = False
     daySpecified = False
     dayOffset = False
     monthOffset = 0
     yearOffset = 0
-    today = anchorDate.strftime("%w")
-    wkday = anchorDate.weekday()  # 0 - monday
-    currentYear = anchorDate.strftime("%Y")
     fromFlag = False
     datestr = ""
     hasYear = False
     timeQualifier = ""
 
-    timeQualifiersAM = ['morning']
-    timeQualifiersPM = ['afternoon', 'evening', 'night', 'tonight']
-    timeQualifiersList = set(timeQualifiersAM + timeQualifiersPM)
-    year_markers = ['in', 'on', 'of']
-    past_markers = ["last", "past"]
-    earlier_markers = ["ago", "earlier"]
-    later_markers = ["after", "later"]
-    future_markers = ["in", "within"]  # in a month -> + 1 month timedelta
-    future_1st_markers = ["next"]  # next month -> day 1 of next month
-    markers = year_markers + ['at', 'by', 'this', 'around', 'for', "within"]
-    days = ['monday', 'tuesday', 'wednesday',
-            'thursday', 'friday', 'saturday', 'sunday']
-    months = ['january', 'february', 'march', 'april', 'may', 'june',
-              'july', 'august', 'september', 'october', 'november',
-              'december']
-    recur_markers = days + [d + 's' for d in days] + ['weekend', 'weekday',
-                                                      'weekends', 'weekdays']
-    monthsShort = ['jan', 'feb', 'mar', 'apr', 'may', 'june', 'july', 'aug',
-                   'sept', 'oct', 'nov', 'dec']
-    year_multiples = ["decade", "century", "millennium"]
-    day_multiples = ["weeks", "months", "years"]
-    past_markers = ["was", "last", "past"]
-
-    words = clean_string(text)
-
     for idx, word in enumerate(words):
         if word == "":
             continue
@@ -816,17 +972,18 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         # this isn't in clean string because I don't want to save back to words
         word = word.rstrip('s')
         start = idx
+        if word not in _DATE_WORDS_EN and wordNext not in _YEAR_MULTIPLES_EN:
+            continue
         used = 0
         # save timequalifier for later
-        if word in earlier_markers and dayOffset:
+        if word in _EARLIER_MARKERS_EN and dayOffset:
             dayOffset = - dayOffset
             used += 1
         elif word == "now" and not datestr:
-            resultStr = " ".join(words[idx + 1:])
-            resultStr = ' '.join(resultStr.split())
-            extractedDate = anchorDate.replace(microsecond=0)
-            return [extractedDate, resultStr]
-        elif wordNext in year_multiples:
+            return _DateStateEn(True, True, "", False, 0, 0, 0, 0, 0, 0,
+                                None, None, False, tuple(words[idx + 1:]),
+                                ())
+        elif wordNext in _YEAR_MULTIPLES_EN:
             multiplier = None
             if is_numeric(word):
                 try:
@@ -847,23 +1004,24 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNext == "millennium":
                 yearOffset = multiplier * 1000 + int(_leftover[:3]) * 100
 
-            if wordNextNext in earlier_markers:
+            if wordNextNext in _EARLIER_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 used += 1
-            elif word in past_markers:
+            elif word in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = yearOffset * -1
                 start -= 1
                 used += 1
 
-        elif word in year_markers and wordNext.isdigit() and len(wordNext) == 4:
-            yearOffset = int(wordNext) - int(currentYear)
+        elif (word in _YEAR_MARKERS_EN and wordNext.isdigit() and
+              len(wordNext) == 4):
+            yearOffset = int(wordNext) - anchor.year
             used += 2
             hasYear = True
         # couple of
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in year_multiples:
+                wordNextNext in _YEAR_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "decade":
@@ -873,7 +1031,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNextNext == "millennium":
                 yearOffset = multiplier * 1000
         elif word == "2" and wordNext == "of" and \
-                wordNextNext in day_multiples:
+                wordNextNext in _DAY_MULTIPLES_EN:
             multiplier = 2
             used += 3
             if wordNextNext == "years":
@@ -882,7 +1040,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset = multiplier
             elif wordNextNext == "weeks":
                 dayOffset = multiplier * 7
-        elif word in timeQualifiersList:
+        elif word in _TIME_QUALIFIERS_EN:
             timeQualifier = word
         # parse today, tomorrow, day after tomorrow
         elif word == "today" and not fromFlag:
@@ -911,28 +1069,28 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used += 1
         # parse 5 days, 10 weeks, last week, next week
-        elif word == "day" and wordNext not in earlier_markers:
+        elif word == "day" and wordNext not in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset += int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
 
             # next day
             # normalize step makes "in a day" -> "in day"
-            elif wordPrev and wordPrev in future_markers + future_1st_markers:
+            elif wordPrev and wordPrev in _NEXT_MARKERS_EN:
                 dayOffset += 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -1
                 start -= 1
                 used = 2
         # parse X days ago
-        elif word == "day" and wordNext in earlier_markers:
+        elif word == "day" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev)
                 start -= 1
@@ -941,31 +1099,33 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 1
                 used = 2
         # parse last/past/next week and in/after X weeks
-        elif word == "week" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif (word == "week" and not fromFlag and wordPrev and
+              wordNext not in _EARLIER_MARKERS_EN):
             if wordPrev[0].isdigit():
                 dayOffset += int(wordPrev) * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next week -> next monday
-            elif wordPrev in future_1st_markers:
-                dayOffset = 7 - wkday
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
+                dayOffset = 7 - anchor.weekday
                 start -= 1
                 used = 2
             # normalize step makes "in a week" -> "in week"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 dayOffset = 7
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset = -7
                 start -= 1
                 used = 2
         # parse X weeks ago
-        elif word == "week" and not fromFlag and wordNext in earlier_markers:
+        elif (word == "week" and not fromFlag and
+              wordNext in _EARLIER_MARKERS_EN):
             if wordPrev[0].isdigit():
                 dayOffset -= int(wordPrev) * 7
                 start -= 1
@@ -974,42 +1134,44 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 dayOffset -= 7
                 used = 2
         # parse last/past/next weekend and in/after X weekends
-        elif word == "weekend" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif (word == "weekend" and not fromFlag and wordPrev and
+              wordNext not in _EARLIER_MARKERS_EN):
             # in/after X weekends
             if wordPrev[0].isdigit():
                 n = int(wordPrev)
-                dayOffset += 7 - wkday  # next monday -> 1 weekend
+                dayOffset += 7 - anchor.weekday  # next monday -> 1 weekend
                 n -= 1
                 dayOffset += n * 7
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     dayOffset = dayOffset * -1
                     start -= 1
                     used += 1
             # next weekend -> next saturday
-            elif wordPrev in future_1st_markers:
-                if wkday < 5:
-                    dayOffset = 5 - wkday
-                elif wkday == 5:
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
+                if anchor.weekday < 5:
+                    dayOffset = 5 - anchor.weekday
+                elif anchor.weekday == 5:
                     dayOffset = 7
                 else:
                     dayOffset = 6
                 start -= 1
                 used = 2
             # normalize step makes "in a weekend" -> "in weekend" (next monday)
-            elif wordPrev in future_markers:
-                dayOffset += 7 - wkday  # next monday
+            elif wordPrev in _FUTURE_MARKERS_EN:
+                dayOffset += 7 - anchor.weekday  # next monday
                 start -= 1
                 used = 2
             # last/past weekend -> last/past saturday
-            elif wordPrev in past_markers:
-                dayOffset -= wkday + 2
+            elif wordPrev in _PAST_MARKERS_EN:
+                dayOffset -= anchor.weekday + 2
                 start -= 1
                 used = 2
         # parse X weekends ago
-        elif word == "weekend" and not fromFlag and wordNext in earlier_markers:
-            dayOffset -= wkday + 3  # past friday "one weekend ago"
+        elif (word == "weekend" and not fromFlag and
+              wordNext in _EARLIER_MARKERS_EN):
+            dayOffset -= anchor.weekday + 3  # past friday "one weekend ago"
             used = 2
             # X weekends ago
             if wordPrev and wordPrev[0].isdigit():
@@ -1018,31 +1180,31 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 start -= 1
                 used = 3
         # parse 10 months, next month, last month
-        elif word == "month" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif (word == "month" and not fromFlag and wordPrev and
+              wordNext not in _EARLIER_MARKERS_EN):
             if wordPrev[0].isdigit():
                 monthOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     monthOffset = monthOffset * -1
                     start -= 1
                     used += 1
             # next month -> day 1
-            elif wordPrev in future_1st_markers:
-                next_dt = (anchorDate.replace(day=1) + timedelta(days=32)).replace(day=1)
-                dayOffset = (next_dt - anchorDate).days
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
+                dayOffset = anchor.days_to_next_month
                 start -= 1
                 used = 2
             # normalize step makes "in a month" -> "in month"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 monthOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 monthOffset = -1
                 start -= 1
                 used = 2
-        elif word == "month" and wordNext in earlier_markers:
+        elif word == "month" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 monthOffset -= int(wordPrev)
                 start -= 1
@@ -1051,31 +1213,31 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 monthOffset -= 1
                 used = 2
         # parse 5 years, next year, last year
-        elif word == "year" and not fromFlag and wordPrev and wordNext not in earlier_markers:
+        elif (word == "year" and not fromFlag and wordPrev and
+              wordNext not in _EARLIER_MARKERS_EN):
             if wordPrev[0].isdigit():
                 yearOffset = int(wordPrev)
                 start -= 1
                 used = 2
-                if wordPrevPrev in past_markers:
+                if wordPrevPrev in _PAST_MARKERS_EN:
                     yearOffset = yearOffset * -1
                     start -= 1
                     used += 1
             # next year -> day 1
-            elif wordPrev in future_1st_markers:
-                next_dt = anchorDate.replace(day=1, month=1, year=anchorDate.year + 1)
-                dayOffset = (next_dt - anchorDate).days
+            elif wordPrev in _FUTURE_1ST_MARKERS_EN:
+                dayOffset = anchor.days_to_next_year
                 start -= 1
                 used = 2
             # normalize step makes "in a year" -> "in year"
-            elif wordPrev in future_markers:
+            elif wordPrev in _FUTURE_MARKERS_EN:
                 yearOffset = 1
                 start -= 1
                 used = 2
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 yearOffset = -1
                 start -= 1
                 used = 2
-        elif word == "year" and wordNext in earlier_markers:
+        elif word == "year" and wordNext in _EARLIER_MARKERS_EN:
             if wordPrev and wordPrev[0].isdigit():
                 yearOffset -= int(wordPrev)
                 start -= 1
@@ -1086,9 +1248,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
         # parse Monday, Tuesday, etc., and next Monday,
         # last Tuesday, etc.
-        elif word in days and not fromFlag:
-            d = days.index(word)
-            dayOffset = (d + 1) - int(today)
+        elif word in _WEEKDAYS_EN and not fromFlag:
+            d = _WEEKDAYS_EN[word]
+            dayOffset = (d + 1) - today()
             used = 1
             if dayOffset < 0:
                 dayOffset += 7
@@ -1097,18 +1259,18 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     dayOffset += 7
                 used += 1
                 start -= 1
-            elif wordPrev in past_markers:
+            elif wordPrev in _PAST_MARKERS_EN:
                 dayOffset -= 7
                 used += 1
                 start -= 1
         # parse 15 of July, June 20th, Feb 18, 19 of February
-        elif word in months or word in monthsShort and not fromFlag:
-            try:
-                m = months.index(word)
-            except ValueError:
-                m = monthsShort.index(word)
+        elif word in _MONTH_INDEX_EN or \
+                word in _MONTH_SHORT_INDEX_EN and not fromFlag:
+            m = _MONTH_INDEX_EN.get(word)
+            if m is None:
+                m = _MONTH_SHORT_INDEX_EN[word]
             used += 1
-            datestr = months[m]
+            datestr = _MONTHS_EN[m]
             if wordPrev and (wordPrev[0].isdigit() or
                              (wordPrev == "of" and wordPrevPrev[0].isdigit())):
                 if wordPrev == "of" and wordPrevPrev[0].isdigit():
@@ -1141,54 +1303,46 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif word == 'may' and wordNext in ['i', 'we', 'be']:
                 datestr = ""
             # when was MONTH
-            elif not hasYear and wordPrev in past_markers:
-                if anchorDate.month > m:
-                    datestr += f" {anchorDate.year}"
+            elif not hasYear and wordPrev in _PAST_MARKERS_EN:
+                if anchor.month > m:
+                    datestr += f" {anchor.year}"
                 else:
-                    datestr += f" {anchorDate.year - 1}"
+                    datestr += f" {anchor.year - 1}"
                 hasYear = True
             # when is MONTH
             elif not hasYear:
-                if anchorDate.month > m:
-                    datestr += f" {anchorDate.year + 1}"
+                if anchor.month > m:
+                    datestr += f" {anchor.year + 1}"
                 else:
-                    datestr += f" {anchorDate.year}"
+                    datestr += f" {anchor.year}"
                 hasYear = True
         # parse 5 days from tomorrow, 10 weeks from next thursday,
         # 2 months from July
-        validFollowups = days + months + monthsShort
-        validFollowups.append("today")
-        validFollowups.append("tomorrow")
-        validFollowups.append("yesterday")
-        validFollowups.append("next")
-        validFollowups.append("last")
-        validFollowups.append("past")
-        validFollowups.append("now")
-        validFollowups.append("this")
-        if (word == "from" or word == "after") and wordNext in validFollowups:
+        if (word == "from" or word == "after") and \
+                wordNext in _VALID_FOLLOWUPS_EN:
             used = 2
             fromFlag = True
             if wordNext == "tomorrow":
                 dayOffset += 1
             elif wordNext == "yesterday":
                 dayOffset -= 1
-            elif wordNext in days:
-                d = days.index(wordNext)
-                tmpOffset = (d + 1) - int(today)
+            elif wordNext in _WEEKDAYS_EN:
+                d = _WEEKDAYS_EN[wordNext]
+                tmpOffset = (d + 1) - today()
                 used = 2
                 if tmpOffset < 0:
                     tmpOffset += 7
                 dayOffset += tmpOffset
-            elif wordNextNext and wordNextNext in days:
-                d = days.index(wordNextNext)
-                tmpOffset = (d + 1) - int(today)
+            elif wordNextNext and wordNextNext in _WEEKDAYS_EN:
+                d = _WEEKDAYS_EN[wordNextNext]
+                tmpOffset = (d + 1) - today()
                 used = 3
-                if wordNext in future_1st_markers:
+                if wordNext in _FUTURE_1ST_MARKERS_EN:
                     if dayOffset <= 2:
                         tmpOffset += 7
                     used += 1
                     start -= 1
-                elif wordNext in past_markers:
+                elif wordNext in _PAST_MARKERS_EN:
                     tmpOffset -= 7
                     used += 1
                     start -= 1
@@ -1201,7 +1355,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             for i in range(0, used):
                 words[i + start] = ""
 
-            if start - 1 >= 0 and words[start - 1] in markers:
+            if start - 1 >= 0 and words[start - 1] in _MARKERS_EN:
                 words[start - 1] = ""
             found = True
             daySpecified = True
@@ -1213,6 +1367,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     hrAbs = None
     minAbs = None
     military = False
+    read = []
 
     for idx, word in enumerate(words):
         if word == "":
@@ -1222,6 +1377,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
         wordPrev = words[idx - 1] if idx > 0 else ""
         wordNext = words[idx + 1] if idx + 1 < len(words) else ""
         wordNextNext = words[idx + 2] if idx + 2 < len(words) else ""
+        if word not in _TIME_WORDS_EN and not word[0].isdigit() and \
+                wordNext not in _TIME_UNITS_EN:
+            continue
         # parse noon, midnight, morning, afternoon, evening
         used = 0
         if word == "noon":
@@ -1246,6 +1404,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             if hrAbs is None:
                 hrAbs = 22
             # used += 1 ## NOTE this breaks other tests, TODO refactor me!
+            if idx > 0 and wordPrev in _MARKERS_EN:
+                read.append(idx - 1)
+            read.append(idx)
 
         # couple of time_unit
         elif word == "2" and wordNext == "of" and \
@@ -1258,42 +1419,42 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             elif wordNextNext == "seconds":
                 secOffset = 2
         # parse in a/next second/minute/hour
-        elif wordNext == "hour" and word in future_markers + future_1st_markers:
+        elif wordNext == "hour" and word in _NEXT_MARKERS_EN:
             used += 2
             hrOffset = 1
-        elif wordNext == "minute" and word in future_markers + future_1st_markers:
+        elif wordNext == "minute" and word in _NEXT_MARKERS_EN:
             used += 2
             minOffset = 1
-        elif wordNext == "second" and word in future_markers + future_1st_markers:
+        elif wordNext == "second" and word in _NEXT_MARKERS_EN:
             used += 2
             secOffset = 1
         # parse last/past  second/minute/hour
-        elif wordNext == "hour" and word in past_markers:
+        elif wordNext == "hour" and word in _PAST_MARKERS_EN:
             used += 2
             hrOffset = - 1
-        elif wordNext == "minute" and word in past_markers:
+        elif wordNext == "minute" and word in _PAST_MARKERS_EN:
             used += 2
             minOffset = - 1
-        elif wordNext == "second" and word in past_markers:
+        elif wordNext == "second" and word in _PAST_MARKERS_EN:
             used += 2
             secOffset = - 1
         # parse half an hour, quarter hour
         elif word == "hour" and \
-                (wordPrev in markers or wordPrevPrev in markers):
+                (wordPrev in _MARKERS_EN or wordPrevPrev in _MARKERS_EN):
             if wordPrev == "half":
                 minOffset = 30
             elif wordPrev == "quarter":
                 minOffset = 15
             elif wordPrevPrev == "quarter":
                 minOffset = 15
-                if idx > 2 and words[idx - 3] in markers:
+                if idx > 2 and words[idx - 3] in _MARKERS_EN:
                     words[idx - 3] = ""
                 words[idx - 2] = ""
             elif wordPrev == "within":
                 hrOffset = 1
             else:
                 hrOffset = 1
-            if wordPrevPrev in markers:
+            if wordPrevPrev in _MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1396,7 +1557,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         if timeQualifier != "":
                             military = True
                             if strHH and int(strHH) <= 12 and \
-                                    (timeQualifier in timeQualifiersPM):
+                                    (timeQualifier in _TIME_QUALIFIERS_PM_EN):
                                 strHH += str(int(strHH) + 12)
 
             else:
@@ -1430,9 +1591,9 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                     remainder = "am"
                     used = 1
                 elif (
-                        remainder in recur_markers or
-                        wordNext in recur_markers or
-                        wordNextNext in recur_markers):
+                        remainder in _RECUR_MARKERS_EN or
+                        wordNext in _RECUR_MARKERS_EN or
+                        wordNextNext in _RECUR_MARKERS_EN):
                     # Ex: "7 on mondays" or "3 this friday"
                     # Set strHH so that isTime == True
                     # when am or pm is not specified
@@ -1455,7 +1616,8 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             (wordNext == "hours" or wordNext == "hour" or
                              remainder == "hours" or remainder == "hour") and
                             word[0] != '0' and
-                            (int(strNum) < 100 or int(strNum) > 2400 or wordPrev in past_markers)):
+                            (int(strNum) < 100 or int(strNum) > 2400 or
+                             wordPrev in _PAST_MARKERS_EN)):
                         # ignores military time
                         # "in 3 hours"
                         hrOffset = int(strNum)
@@ -1464,7 +1626,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N hours
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             hrOffset = hrOffset * -1
@@ -1478,7 +1640,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N minutes
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             minOffset = minOffset * -1
@@ -1491,7 +1653,7 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                         hrAbs = -1
                         minAbs = -1
                         # in last N seconds
-                        if wordPrev in past_markers:
+                        if wordPrev in _PAST_MARKERS_EN:
                             start -= 1
                             used += 1
                             secOffset = secOffset * -1
@@ -1531,21 +1693,23 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                             if (wordNextNext and
                                     (wordNextNext in timeQualifier or
                                      wordNextNextNext in timeQualifier)):
-                                if (wordNextNext in timeQualifiersPM or
-                                        wordNextNextNext in timeQualifiersPM):
+                                if (wordNextNext in _TIME_QUALIFIERS_PM_EN or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_PM_EN):
                                     remainder = "pm"
                                     used += 1
-                                if (wordNextNext in timeQualifiersAM or
-                                        wordNextNextNext in timeQualifiersAM):
+                                if (wordNextNext in _TIME_QUALIFIERS_AM_EN or
+                                        wordNextNextNext in
+                                        _TIME_QUALIFIERS_AM_EN):
                                     remainder = "am"
                                     used += 1
 
                         if timeQualifier != "":
-                            if timeQualifier in timeQualifiersPM:
+                            if timeQualifier in _TIME_QUALIFIERS_PM_EN:
                                 remainder = "pm"
                                 used += 1
 
-                            elif timeQualifier in timeQualifiersAM:
+                            elif timeQualifier in _TIME_QUALIFIERS_AM_EN:
                                 remainder = "am"
                                 used += 1
                             else:
@@ -1568,16 +1732,16 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
 
                 # ambiguous time, detect whether they mean this evening or
                 # the next morning based on whether it has already passed
-                if anchorDate.hour < HH or (anchorDate.hour == HH and
-                                            anchorDate.minute < MM):
+                if anchor.hour < HH or (anchor.hour == HH and
+                                        anchor.minute < MM):
                     pass  # No modification needed
-                elif anchorDate.hour < HH + 12:
+                elif anchor.hour < HH + 12:
                     HH += 12
                 else:
                     # has passed, assume the next morning
                     dayOffset += 1
 
-            if timeQualifier in timeQualifiersPM and HH < 12:
+            if timeQualifier in _TIME_QUALIFIERS_PM_EN and HH < 12:
                 HH += 12
 
             if HH > 24 or MM > 59:
@@ -1606,11 +1770,11 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
                 hrOffset = 1
                 words[idx - 1] = ""
                 idx -= 1
-            if idx > 0 and wordPrev in markers:
+            if idx > 0 and wordPrev in _MARKERS_EN:
                 words[idx - 1] = ""
                 if wordPrev == "this":
                     daySpecified = True
-            if idx > 1 and wordPrevPrev in markers:
+            if idx > 1 and wordPrevPrev in _MARKERS_EN:
                 words[idx - 2] = ""
                 if wordPrevPrev == "this":
                     daySpecified = True
@@ -1618,6 +1782,48 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
             idx += used - 1
             found = True
 
+    return _DateStateEn(False, found, datestr, hasYear, yearOffset,
+                        monthOffset, dayOffset, hrOffset, minOffset, secOffset,
+                        hrAbs, minAbs, daySpecified, tuple(words),
+                        tuple(read))
+
+
+def _finalize_datetime_en(state, anchorDate, default_time):
+    """ The date arithmetic of extract_datetime_en(), on a parsed state
+
+    Args:
+        state (_DateStateEn): see _parse_datetime_en()
+        anchorDate (datetime): the anchor date
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [datetime, str]: see extract_datetime_en()
+    """
+    def date_found():
+        return found or \
+               (
+                       datestr != "" or
+                       yearOffset != 0 or monthOffset != 0 or
+                       dayOffset is True or hrOffset != 0 or
+                       hrAbs or minOffset != 0 or
+                       minAbs or secOffset != 0
+               )
+
+    words = list(state.words)
+    if state.now:
+        resultStr = " ".join(words)
+        resultStr = ' '.join(resultStr.split())
+        extractedDate = anchorDate.replace(microsecond=0)
+        return [extractedDate, resultStr]
+
+    found, datestr, hasYear = state.found, state.datestr, state.has_year
+    yearOffset, monthOffset = state.year_offset, state.month_offset
+    dayOffset, hrOffset = state.day_offset, state.hr_offset
+    minOffset, secOffset = state.min_offset, state.sec_offset
+    hrAbs, minAbs = state.hr_abs, state.min_abs
+    daySpecified = state.day_specified
+    currentYear = anchorDate.strftime("%Y")
+
     # check that we found a date
     if not date_found():
         return None
@@ -1713,6 +1919,109 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+def extract_datetimes_en(text, anchorDate=None, default_time=None):
+    """ Extract all the date and time mentions of a text
+
+    The text is normalized once and split into segments at punctuation and
+    at words such as "and", "to" or "from" (but not in "5 days from
+    tomorrow"). Each segment is parsed the way extract_datetime_en() parses
+    a whole text, so that the date and time words in it make up one
+    mention, and the text is only scanned once.
+
+    For example, "move my 3pm meeting from friday to next tuesday" has
+    three mentions: "3pm", "from friday" and "next tuesday".
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, (int, int))]: the datetime of each mention, in order,
+            with the span of text from its first to its last date word
+    """
+    if not anchorDate:
+        anchorDate = now_local()
+    default_time = default_time or time(0, 0, 0)
+
+    # normalized a sentence at a time, as numbers are searched for in all
+    # of the text after each number found
+    words = []
+    spans = []
+    sentences = set()
+    start = 0
+    for end in [match.end() for match in _SENTENCE_END_EN.finditer(text)] + \
+            [len(text)]:
+        sentence_words, sentence_spans = _clean_words_en(text[start:end])
+        sentences.add(len(words))
+        words += sentence_words
+        spans += [(first + start, last + start)
+                  for first, last in sentence_spans]
+        start = end
+
+    mentions = []
+    start = 0
+    for end in range(1, len(words) + 1):
+        if end < len(words) and end not in sentences and \
+                (words[end] not in _MENTION_BREAKS_EN or
+                 _continues_duration_en(words, end)) and \
+                not _MENTION_PUNCTUATION_EN.search(text, spans[end - 1][1],
+                                                   spans[end][0]):
+            continue
+        segment = words[start:end]
+        state, extracted = _extract_segment_en(segment, anchorDate,
+                                               default_time)
+        if extracted:
+            if state.now:
+                used = [segment.index("now")]
+            else:
+                used = [idx for idx, word in enumerate(state.words)
+                        if word != segment[idx] or idx in state.read]
+            while len(used) > 1 and segment[used[-1]] not in \
+                    _VALUE_WORDS_EN and not segment[used[-1]][0].isdigit():
+                _, shorter = _extract_segment_en(segment[:used[-1]],
+                                                 anchorDate, default_time)
+                if not shorter or shorter[0] != extracted[0]:
+                    break
+                used.pop()
+            if used:
+                mentions.append((extracted[0], (spans[start + used[0]][0],
+                                                spans[start + used[-1]][1])))
+        start = end
+    return mentions
+
+
+def _continues_duration_en(words, idx):
+    """ Check if the break at words[idx] continues the duration before it
+
+    That is "5 days from tomorrow" or "1 hour and 30 minutes", but not
+    "in 5 minutes and in 2 hours", which are two mentions.
+    """
+    if words[idx - 1] not in _UNIT_WORDS_EN:
+        return False
+    if words[idx] in _OFFSET_BREAKS_EN:
+        return True
+    following = words[idx + 1:idx + 3]
+    return len(following) == 2 and following[0][0].isdigit() and \
+        following[1] in _UNIT_WORDS_EN
+
+
+def _extract_segment_en(segment, anchorDate, default_time):
+    """ Parse the words of one mention of extract_datetimes_en()
+
+    Returns:
+        (_DateStateEn, [datetime, str]): the parsed state and the result of
+            extract_datetime_en(), both None if the words aren't a valid time
+    """
+    try:
+        state = _parse_datetime_en(segment, AnchorView(anchorDate))
+        return state, _finalize_datetime_en(state, anchorDate, default_time)
+    except ValueError:
+        # e.g. "at 24" on its own, which is an invalid hour rather than a
+        # mention; skip it, as a longer text may still parse
+        return None, None
+
+
 def is_fractional_en(input_str, short_scale=True, spoken=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1728,21 +2037,24 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "fifths"
 
-    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
-    if short_scale:
-        for num in _SHORT_ORDINAL_EN:
-            if num > 2:
-                fracts[_SHORT_ORDINAL_EN[num]] = num
-    else:
-        for num in _LONG_ORDINAL_EN:
-            if num > 2:
-                fracts[_LONG_ORDINAL_EN[num]] = num
-
+    fracts = _FRACTIONS_SHORT_EN if short_scale else _FRACTIONS_LONG_EN
     if input_str.lower() in fracts and spoken:
         return 1.0 / fracts[input_str.lower()]
     return False
 
 
+def _build_fractions_en(ordinals):
+    fracts = {"whole": 1, "half": 2, "halve": 2, "quarter": 4}
+    for num in ordinals:
+        if num > 2:
+            fracts[ordinals[num]] = num
+    return fracts
+
+
+_FRACTIONS_SHORT_EN = _build_fractions_en(_SHORT_ORDINAL_EN)
+_FRACTIONS_LONG_EN = _build_fractions_en(_LONG_ORDINAL_EN)
+
+
 def extract_numbers_en(text, short_scale=True, ordinals=False):
     """
         Takes in a string and extracts a list of numbers.
@@ -1762,6 +2074,42 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
     return [float(result.value) for result in results]
 
 
+def incremental_number_extractor_en(short_scale=True, ordinals=False):
+    """
+    Create an IncrementalNumberExtractor for English
+
+    Args:
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, third=3 instead of 1/3
+    Returns:
+        IncrementalNumberExtractor
+    """
+    multiplies, string_num_ordinal, string_num_scale = \
+        _initialize_number_data_en(short_scale, speech=ordinals is not None)
+    markers = _ARTICLES_EN | _NEGATIVES_EN | _FRACTION_MARKER_EN | \
+        _DECIMAL_MARKER_EN
+
+    def is_number_word(word):
+        # mirrors the words _extract_whole_number_with_text_en breaks on
+        word = word.lower()
+        if is_numeric(word[:-2]) and word[-2:] in ("st", "nd", "rd", "th"):
+            word = word[:-2]
+        return word in markers or \
+            word in string_num_scale or \
+            word in _STRING_NUM_EN or \
+            word in _SUMS_EN or \
+            word in multiplies or \
+            bool(ordinals and word in string_num_ordinal) or \
+            is_numeric(word) or \
+            bool(is_fractional_en(word, short_scale=short_scale)) or \
+            look_for_fractions(word.split('/'))
+
+    def extract_handler(tokens):
+        return _extract_numbers_with_text_en(tokens, short_scale, ordinals)
+
+    return IncrementalNumberExtractor(extract_handler, is_number_word)
+
+
 class EnglishNormalizer(Normalizer):
     with open(resolve_resource_file("text/en-us/normalize.json")) as f:
         _default_config = json.load(f)
@@ -1770,6 +2118,9 @@ class EnglishNormalizer(Normalizer):
         return _convert_words_to_numbers_en(utterance, ordinals=None)
 
 
+_NORMALIZER_EN = EnglishNormalizer()
+
+
 def normalize_en(text, remove_articles=True):
     """ English string normalization """
-    return EnglishNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_EN.normalize(text, remove_articles)
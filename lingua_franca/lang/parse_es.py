@@ -1118,7 +1118,7 @@ def extract_duration_es(text):
     pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[s]?"
 
     text = text.replace("í", "i").replace("é", "e").replace("ñ", "n").replace("meses", "mes")
-    text = SpanishNormalizer().numbers_to_digits(text)
+    text = _NORMALIZER_ES.numbers_to_digits(text)
 
     for (unit_en, unit_es) in time_units.items():
         unit_pattern = pattern.format(
@@ -1193,3 +1193,6 @@ def get_gender_es(word, context=""):
 
 class SpanishNormalizer(Normalizer):
     """ TODO implement language specific normalizer"""
+
+
+_NORMALIZER_ES = SpanishNormalizer()
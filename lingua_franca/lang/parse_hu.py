@@ -21,6 +21,9 @@ class HungarianNormalizer(Normalizer):
     """ TODO implement language specific normalizer"""
 
 
+_NORMALIZER_HU = HungarianNormalizer()
+
+
 def normalize_hu(text, remove_articles=True):
     """ English string normalization """
-    return HungarianNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_HU.normalize(text, remove_articles)
@@ -17,8 +17,9 @@ from datetime import datetime, timedelta
 
 from dateutil.relativedelta import relativedelta
 
-from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
+from .parse_common import is_numeric, look_for_fractions, \
+    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict, \
+    extract_numbers_with_text
 from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
@@ -79,26 +80,11 @@ def _extract_numbers_with_text_nl(tokens, short_scale=True,
         [_ReplaceableNumber]: A list of tuples, each containing a number and a
                          string.
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_nl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_nl(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER_NL | _DECIMAL_MARKER_NL)
 
 
 def _extract_number_with_text_nl(tokens, short_scale=True,
@@ -18,13 +18,13 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, ReplaceableNumber, partition_list, tokenize, \
+    extract_numbers_with_text, DurationPattern
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
     _ALT_ORDINALS_PL
 from lingua_franca.time import now_local
-import re
 
 
 def generate_plurals_pl(originals):
@@ -165,26 +165,11 @@ def _extract_numbers_with_text_pl(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_pl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_pl(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER | _DECIMAL_MARKER)
 
 
 def _extract_number_with_text_pl(tokens, short_scale=True,
@@ -596,6 +581,11 @@ def extract_number_pl(text, short_scale=True, ordinals=False):
                                         True, ordinals).value
 
 
+_DURATION_PATTERN_PL = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?",
+    {unit: unit for unit in _TIME_UNITS_CONVERSION})
+
+
 def extract_duration_pl(text):
     """
     Convert an english phrase into a number of seconds
@@ -635,17 +625,16 @@ def extract_duration_pl(text):
         'weeks': None
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ayeę]?"
     text = _convert_words_to_numbers_pl(text)
 
-    for unit in _TIME_UNITS_CONVERSION:
-        unit_pattern = pattern.format(unit=unit)
-        matches = re.findall(unit_pattern, text)
-        value = sum(map(float, matches))
-        unit_en = _TIME_UNITS_CONVERSION.get(unit)
+    text, durations = _DURATION_PATTERN_PL.extract(text)
+    matches = {unit: [] for unit in _TIME_UNITS_CONVERSION}
+    for unit, match in durations:
+        matches[unit].append(match.group("value"))
+    for unit, unit_en in _TIME_UNITS_CONVERSION.items():
+        value = sum(map(float, matches[unit]))
         if time_units[unit_en] is None or time_units.get(unit_en) == 0:
             time_units[unit_en] = value
-        text = re.sub(unit_pattern, '', text)
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -22,11 +22,12 @@
 
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
-from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, match_yes_or_no
+from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
+    match_yes_or_no, color_names_to_hex, TokenTrie
 from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
-from lingua_franca.internal import resolve_resource_file
+from lingua_franca.internal import resolve_resource_file, get_cached_resource
 from lingua_franca.lang.parse_common import Normalizer
 from lingua_franca.time import now_local, DAYS_IN_1_MONTH, DAYS_IN_1_YEAR
 from lingua_franca.util.colors import Color, ColorOutOfSpace
@@ -36,6 +37,23 @@ from quebra_frases import span_indexed_word_tokenize
 import unicodedata
 
 
+def _color_names_to_hex_pt(colors):
+    COLORS = color_names_to_hex(colors)
+    # this hack makes plural match most of the time
+    for k in list(COLORS.keys()):
+        if k.endswith("s"):
+            COLORS[k[:-1]] = COLORS[k]
+    # this hack makes male/female match most of the time
+    for k in list(COLORS.keys()):
+        if k.endswith("a") or k.endswith("o"):
+            COLORS[k[:-1]] = COLORS[k]
+    return COLORS
+
+
+def _color_name_trie_pt(colors):
+    return TokenTrie(_color_names_to_hex_pt(colors))
+
+
 def get_color_pt(text):
     """
         Given a color description, return a Color object
@@ -46,18 +64,8 @@ def get_color_pt(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
-
-    # this hack makes plural match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("s"):
-            COLORS[k[:-1]] = COLORS[k]
-    # this hack makes male/female match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("a") or k.endswith("o"):
-            COLORS[k[:-1]] = COLORS[k]
+    COLORS = get_cached_resource("colors.json", "pt-pt",
+                                 derive=_color_names_to_hex_pt)
 
     text = text.lower()
     if text in COLORS:
@@ -123,63 +131,19 @@ def extract_color_spans_pt(text):
             (list): list of tuples with detected color and span of the
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
-    resource_file = resolve_resource_file(f"text/pt-pt/colors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
-
-    # this hack makes plural match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("s"):
-            COLORS[k[:-1]] = COLORS[k]
-    # this hack makes male/female match most of the time
-    for k in list(COLORS.keys()):
-        if k.endswith("a") or k.endswith("o"):
-            COLORS[k[:-1]] = COLORS[k]
-
-    color_spans = []
-    text = text.lower()
-    spans = span_indexed_word_tokenize(text)
-
-    for idx, (start, end, word) in enumerate(spans):
-        word2 = word3 = ""
+    trie = get_cached_resource("colors.json", "pt-pt",
+                               derive=_color_name_trie_pt)
+    spans = span_indexed_word_tokenize(text.lower())
+    words = []
+    for _, _, word in spans:
+        # same hacks as _color_names_to_hex_pt, plural and male/female
         if word.endswith("s"):
             word = word[:-1]
         if word.endswith("a") or word.endswith("o"):
             word = word[:-1]
-
-        next_span = spans[idx + 1] if idx + 1 < len(spans) else ()
-        next_next_span = spans[idx + 2] if idx + 2 < len(spans) else ()
-
-        if next_span:
-            word2 = next_span[-1]
-            if word2.endswith("s"):
-                word2 = word2[:-1]
-            if word2.endswith("a") or word2.endswith("o"):
-                word2 = word2[:-1]
-            word2 = f"{word} {word2}"
-        if next_next_span:
-            word3 = next_next_span[-1]
-            if word3.endswith("s"):
-                word3 = word3[:-1]
-            if word3.endswith("a") or word3.endswith("o"):
-                word3 = word3[:-1]
-            word3 = f"{word} {word2} {word3}"
-
-        if next_span and next_next_span and word3 in COLORS:
-            spans[idx + 1] = spans[idx + 2] = (-1, -1, "")
-            end = next_next_span[1]
-            color = Color.from_hex(COLORS[word3])
-            color_spans.append((color, (start, end)))
-        elif next_span and word2 in COLORS:
-            spans[idx + 1] = (-1, -1, "")
-            end = next_span[1]
-            color = Color.from_hex(COLORS[word2])
-            color_spans.append((color, (start, end)))
-        elif word in COLORS:
-            color = Color.from_hex(COLORS[word])
-            color_spans.append((color, (start, end)))
-
-    return color_spans
+        words.append(word)
+    return [(Color.from_hex(hex_code), (spans[start][0], spans[end - 1][1]))
+            for start, end, hex_code in trie.tag(words)]
 
 
 def yes_or_no_pt(text):
@@ -187,7 +151,7 @@ def yes_or_no_pt(text):
     # eg. "its not a lie", "não é mentira" -> "nao e mentira" -> "nao mentira"
     text = unicodedata.normalize('NFD', text) \
         .encode('ascii', 'ignore').decode("utf-8")
-    text = PortugueseNormalizer().normalize(text, remove_articles=True)
+    text = _NORMALIZER_PT.normalize(text, remove_articles=True)
     return match_yes_or_no(text, "pt-pt")
 
 
@@ -377,9 +341,12 @@ class PortugueseNormalizer(Normalizer):
         return tokens
 
 
+_NORMALIZER_PT = PortugueseNormalizer()
+
+
 def normalize_pt(text, remove_articles=True):
     """ PT string normalization """
-    return PortugueseNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_PT.normalize(text, remove_articles)
 
 
 def extract_datetime_pt(text, anchorDate=None, default_time=None):
@@ -1293,7 +1260,7 @@ def extract_duration_pt(text):
 
     text = text.replace("mês", "meses").replace("é", "e")
     text = text.replace("segundo", "_s_")  # HACK - segundo (second) will be replaced with 2
-    text = PortugueseNormalizer().numbers_to_digits(text)
+    text = _NORMALIZER_PT.numbers_to_digits(text)
     text = text.replace("_s_", "segundo")  # undo HACK
 
     for (unit_en, unit_pt) in time_units.items():
@@ -18,13 +18,13 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Normalizer, \
+    extract_numbers_with_text, DurationPattern
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _LONG_ORDINAL_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, \
     _FRACTION_STRING_RU, _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
     _ORDINAL_BASE_RU
 
-import re
 import json
 from lingua_franca import resolve_resource_file
 from lingua_franca.time import now_local
@@ -184,26 +184,11 @@ def _extract_numbers_with_text_ru(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_ru(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_ru(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER | _DECIMAL_MARKER)
 
 
 def _extract_number_with_text_ru(tokens, short_scale=True,
@@ -630,6 +615,11 @@ def extract_number_ru(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_PATTERN_RU = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?",
+    _TIME_UNITS_CONVERSION)
+
+
 def extract_duration_ru(text):
     """
     Convert an english phrase into a number of seconds
@@ -672,17 +662,11 @@ def extract_duration_ru(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
     text = _convert_words_to_numbers_ru(text)
 
-    for (unit_ru, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_ru)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
+    text, durations = _DURATION_PATTERN_RU.extract(text)
+    for unit_en, match in durations:
+        time_units[unit_en] += float(match.group("value"))
 
     text = text.strip()
     duration = timedelta(**time_units) if any(time_units.values()) else None
@@ -1601,9 +1585,12 @@ class RussianNormalizer(Normalizer):
         _default_config = json.load(f)
 
 
+_NORMALIZER_RU = RussianNormalizer()
+
+
 def normalize_ru(text, remove_articles=True):
     """ Russian string normalization """
-    return RussianNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_RU.normalize(text, remove_articles)
 
 
 def _text_ru_inflection_normalize(word, arg):
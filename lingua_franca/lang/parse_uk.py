@@ -17,7 +17,8 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_list, tokenize, Normalizer, \
+    extract_numbers_with_text, DurationPattern
 from lingua_franca.lang.common_data_uk import _NUM_STRING_UK, \
     _LONG_ORDINAL_UK, _LONG_SCALE_UK, _SHORT_SCALE_UK, _SHORT_ORDINAL_UK, \
     _FRACTION_STRING_UK, _MONTHS_CONVERSION, _MONTHS_UK, _TIME_UNITS_CONVERSION, \
@@ -184,24 +185,11 @@ def _extract_numbers_with_text_uk(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_uk(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-        results.append(to_replace)
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens,
+        lambda t: _extract_number_with_text_uk(t, short_scale, ordinals,
+                                               fractional_numbers),
+        _FRACTION_MARKER | _DECIMAL_MARKER)
 
 
 def _extract_number_with_text_uk(tokens, short_scale=True,
@@ -636,6 +624,12 @@ def extract_number_uk(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_PATTERN_UK = DurationPattern(
+    r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}"
+    r"(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?",
+    _TIME_UNITS_CONVERSION)
+
+
 def extract_duration_uk(text):
     """
     Convert an english phrase into a number of seconds
@@ -678,16 +672,11 @@ def extract_duration_uk(text):
         'weeks': 0
     }
 
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:ів|я|и|ин|і|унд|ни|ну|ку|дні|у|днів)?"
     text = _convert_words_to_numbers_uk(text)
 
-    for (unit_uk, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_uk)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
+    text, durations = _DURATION_PATTERN_UK.extract(text)
+    for unit_en, match in durations:
+        time_units[unit_en] += float(match.group("value"))
 
     new_text = []
     tokens_in_result_text = text.split(' ')
@@ -1647,9 +1636,12 @@ class UkrainianNormalizer(Normalizer):
         _default_config = json.load(f)
 
 
+_NORMALIZER_UK = UkrainianNormalizer()
+
+
 def normalize_uk(text, remove_articles=True):
     """ Ukrainian string normalization """
-    return UkrainianNormalizer().normalize(text, remove_articles)
+    return _NORMALIZER_UK.normalize(text, remove_articles)
 
 
 def _text_uk_inflection_normalize(word, arg):
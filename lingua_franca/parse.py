@@ -13,21 +13,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import json
+from collections import OrderedDict, namedtuple
+from copy import copy
+from datetime import datetime
+from functools import partial, wraps
+from threading import Lock
+from time import perf_counter
 
 from quebra_frases import span_indexed_word_tokenize
 
+from lingua_franca import config
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, localized_function, UnsupportedLanguageError, \
-    resolve_resource_file, FunctionNotLocalizedError, get_full_lang_code
-from lingua_franca.lang.parse_common import match_yes_or_no
+    get_cached_resource, FunctionNotLocalizedError, get_full_lang_code, \
+    get_localized_function, get_default_lang, _record_call
+from lingua_franca.lang.parse_common import match_yes_or_no, \
+    color_names_to_hex, color_name_trie
 from lingua_franca.util import match_one, fuzzy_match, MatchStrategy
 from lingua_franca.util.colors import Color, ColorOutOfSpace
+from lingua_franca.time import now_local, to_local
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
                          "extract_duration",
                          "extract_datetime",
+                         "extract_datetime_expression",
+                         "extract_datetimes",
                          "extract_langcode",
                          "normalize",
                          "get_gender",
@@ -35,7 +46,8 @@ _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "is_fractional",
                          "extract_color_spans",
                          "get_color",
-                         "is_ordinal")
+                         "is_ordinal",
+                         "incremental_number_extractor")
 
 populate_localized_function_dict("parse", langs=get_active_langs())
 
@@ -54,10 +66,9 @@ def get_color(text, lang=''):
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
+    COLORS = get_cached_resource("colors.json", lang,
+                                 fallback="text/webcolors.json",
+                                 derive=color_names_to_hex)
 
     text = text.lower().strip()
     if text in COLORS:
@@ -82,39 +93,12 @@ def extract_color_spans(text, lang=''):
                     color in parent utterance [(Color, (start_idx, end_idx))]
         """
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/colors.json") or \
-                    resolve_resource_file("text/webcolors.json")
-    with open(resource_file) as f:
-        COLORS = {v.lower(): k for k, v in json.load(f).items()}
-
-    color_spans = []
-    text = text.lower()
-    spans = span_indexed_word_tokenize(text)
-
-    for idx, (start, end, word) in enumerate(spans):
-        next_span = spans[idx + 1] if idx + 1 < len(spans) else ()
-        next_next_span = spans[idx + 2] if idx + 2 < len(spans) else ()
-        word2 = word3 = ""
-        if next_next_span:
-            word3 = f"{word} {next_span[-1]} {next_next_span[-1]}"
-        if next_span:
-            word2 = f"{word} {next_span[-1]}"
-
-        if next_span and next_next_span and word3 in COLORS:
-            spans[idx + 1] = spans[idx + 2] = (-1, -1, "")
-            end = next_next_span[1]
-            color = Color.from_hex(COLORS[word3])
-            color_spans.append((color, (start, end)))
-        elif next_span and word2 in COLORS:
-            spans[idx + 1] = (-1, -1, "")
-            end = next_span[1]
-            color = Color.from_hex(COLORS[word2])
-            color_spans.append((color, (start, end)))
-        elif word in COLORS:
-            color = Color.from_hex(COLORS[word])
-            color_spans.append((color, (start, end)))
-
-    return color_spans
+    trie = get_cached_resource("colors.json", lang,
+                               fallback="text/webcolors.json",
+                               derive=color_name_trie)
+    spans = span_indexed_word_tokenize(text.lower())
+    return [(Color.from_hex(hex_code), (spans[start][0], spans[end - 1][1]))
+            for start, end, hex_code in trie.tag([s[-1] for s in spans])]
 
 
 @localized_function(run_own_code_on=[FunctionNotLocalizedError])
@@ -123,21 +107,25 @@ def yes_or_no(text, lang=""):
     return match_yes_or_no(text, lang)
 
 
+def _spoken_lang_names(langs):
+    spoken_names = {}
+    for k, v in langs.items():
+        if isinstance(v, str):
+            v = [v]
+        # list of spoken names for this language
+        # multiple valid spellings may exist
+        for l in v:
+            spoken_names[l] = k
+    return spoken_names
+
+
 # TODO - variant kwarg - ISO 639-2 vs ISO 639-1
 @localized_function(run_own_code_on=[UnsupportedLanguageError, FunctionNotLocalizedError])
 def extract_langcode(text, lang=""):
     lang = get_full_lang_code(lang)
-    resource_file = resolve_resource_file(f"text/{lang}/langs.json") or \
-                    resolve_resource_file("text/en-us/langs.json")
-    LANGUAGES = {}
-    with open(resource_file) as f:
-        for k, v in json.load(f).items():
-            if isinstance(v, str):
-                v = [v]
-            # list of spoken names for this language
-            # multiple valid spellings may exist
-            for l in v:
-                LANGUAGES[l] = k
+    LANGUAGES = get_cached_resource("langs.json", lang,
+                                    fallback="text/en-us/langs.json",
+                                    derive=_spoken_lang_names)
     return match_one(text, LANGUAGES, strategy=MatchStrategy.TOKEN_SET_RATIO)
 
 
@@ -160,6 +148,28 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
     """
 
 
+@localized_function()
+def incremental_number_extractor(short_scale=True, ordinals=False, lang=''):
+    """
+        Create an extractor for numbers in a stream of words, such as the
+        partial transcripts of streaming STT.
+
+        Feed it the new words of each partial transcript; only the words
+        after the last finished number are parsed again.
+
+    Args:
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+    Returns:
+        IncrementalNumberExtractor: call feed(text) to append words; it
+            returns the ReplaceableNumbers that became final. `pending` holds
+            the numbers of the trailing, still open span and close() ends
+            the stream.
+    """
+
+
 @localized_function()
 def extract_number(text, short_scale=True, ordinals=False, lang=''):
     """Takes in a string and extracts a number.
@@ -211,7 +221,232 @@ def extract_duration(text, lang=''):
     """
 
 
-@localized_function()
+DatetimeCacheInfo = namedtuple("DatetimeCacheInfo",
+                               ["hits", "misses", "maxsize", "currsize"])
+
+
+class _DatetimeCache:
+    """ LRU cache in front of extract_datetime(), see _cache_datetime()
+
+    Entries are keyed by the text as given (the parsers of some languages
+    are case sensitive), the language, default_time and the timezone of the
+    anchor. How much of the anchor the key needs depends on the phrase:
+
+    Languages with an extract_datetime_expression_xx keep the expression of
+    the phrase, which only parses it again for anchors that differ in what
+    the phrase read from them (nothing for "in 10 minutes", the weekday for
+    "next friday") and otherwise just redoes the date arithmetic for the new
+    anchor. The result of an absolute phrase, such as "june 5th 2025 at
+    3pm", is kept outright.
+
+    For the other languages, the key also has the anchor truncated to the
+    minute (plus whether the anchor falls exactly on the minute, since "at
+    13:04" is still today at 13:04:00 but tomorrow one second later).
+    "tomorrow" gives the same result for every anchor in the same minute,
+    while "in 10 minutes" moves along with the anchor. Each entry keeps the
+    result for the last anchor it was computed for, and how the result
+    relates to the anchor is learned from the first two distinct anchors
+    seen in a bucket:
+
+        _CONSTANT: the same result for any anchor in the bucket
+        _SHIFTED: the result moves along with the anchor
+        _SHIFTED_SECONDS: like _SHIFTED, with microseconds dropped
+        _SAME_SECOND: the same result within the second of the last anchor,
+                      until an anchor in another second tells the above apart
+        _EXACT: anything else, only reused for the very same anchor
+    """
+    _CONSTANT, _SHIFTED, _SHIFTED_SECONDS, _SAME_SECOND, _EXACT = range(5)
+    _MISS = object()
+
+    def __init__(self, func):
+        self.func = func
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.hits = self.misses = 0
+
+    def __call__(self, text, anchor, lang_code, lang, default_time):
+        # tzinfo objects aren't always hashable, and tzlocal() is a new
+        # object for each call
+        phrase = (text, lang_code, default_time, repr(anchor.tzinfo))
+        expressions = self._expressions(lang_code)
+        if expressions is not None:
+            return self._resolve(phrase, expressions, anchor)
+
+        minute = anchor.replace(second=0, microsecond=0)
+        key = phrase + (minute, minute == anchor)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                result = self._reuse(entry, anchor)
+                if result is not self._MISS:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+            self.misses += 1
+
+        result = self.func(text, anchor, lang=lang, default_time=default_time)
+        with self.lock:
+            if entry is None:
+                kind = None
+            elif entry[2] in (None, self._SAME_SECOND):
+                kind = self._classify(entry[0], entry[1], anchor, result)
+            else:
+                kind = entry[2]
+            self._store(key, (anchor, result, kind))
+        return self._copy(result)
+
+    @staticmethod
+    def _expressions(lang_code):
+        """ extract_datetime_expression_xx of the language, or None """
+        try:
+            return get_localized_function(
+                "parse", "extract_datetime_expression", lang_code)[0]
+        except FunctionNotLocalizedError:
+            return None
+
+    def _resolve(self, key, expressions, anchor):
+        """ The result of the phrase in `key` for `anchor`, through the
+            expression of the phrase, see extract_datetime_expression()
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is not None:
+            expression, absolute, result = entry
+            if not absolute:
+                result = expression.resolve(anchor)
+            return self._copy(result)
+
+        expression = expressions(key[0], key[2])
+        if expression is None:
+            return None
+        result = expression.resolve(anchor)
+        absolute = expression.is_absolute(anchor)
+        with self.lock:
+            self._store(key, (expression, absolute, result))
+        return self._copy(result)
+
+    def _store(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > max(config.extract_datetime_cache_size, 0):
+            self.entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(result, delta=None):
+        if result is None:
+            return None
+        if delta is None:
+            return result[:]
+        return type(result)((result[0] + delta, *result[1:]))
+
+    def _reuse(self, entry, anchor):
+        """ The cached result as it applies to `anchor`, or _MISS """
+        cached_anchor, result, kind = entry
+        if anchor == cached_anchor or kind == self._CONSTANT:
+            return self._copy(result)
+        if kind == self._SHIFTED:
+            return self._copy(result, anchor - cached_anchor)
+        if kind == self._SHIFTED_SECONDS:
+            return self._copy(result, anchor.replace(microsecond=0) -
+                              cached_anchor.replace(microsecond=0))
+        if kind == self._SAME_SECOND and anchor.replace(microsecond=0) == \
+                cached_anchor.replace(microsecond=0):
+            return self._copy(result)
+        return self._MISS
+
+    @classmethod
+    def _classify(cls, anchor_a, result_a, anchor_b, result_b):
+        """ How results relate to their anchor, None if it can't be told
+            from these two anchors yet
+        """
+        seconds_a = anchor_a.replace(microsecond=0)
+        seconds_b = anchor_b.replace(microsecond=0)
+        if result_a == result_b:
+            # a result which drops microseconds doesn't move within a second
+            return cls._CONSTANT if seconds_a != seconds_b \
+                else cls._SAME_SECOND
+        if result_a is None or result_b is None or \
+                result_a[1:] != result_b[1:]:
+            return cls._EXACT
+        shift = result_b[0] - result_a[0]
+        if shift == anchor_b - anchor_a:
+            if anchor_a.microsecond == anchor_b.microsecond:
+                return None  # either kind of shift
+            return cls._SHIFTED
+        if shift == seconds_b - seconds_a:
+            return cls._SHIFTED_SECONDS
+        return cls._EXACT
+
+    def info(self):
+        with self.lock:
+            return DatetimeCacheInfo(self.hits, self.misses,
+                                     config.extract_datetime_cache_size,
+                                     len(self.entries))
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+
+def _cache_datetime(func):
+    """ Put an opt-in _DatetimeCache in front of extract_datetime()
+
+    The cache is only used when config.extract_datetime_cache is set, and
+    only for languages which are currently loaded. Like functools.lru_cache,
+    the decorated function gets cache_info() and cache_clear(). While
+    config.instrument_localized_functions is set, the calls the cache
+    answers are recorded in internal.get_call_stats() too, see
+    _instrumented_cache_call()
+    """
+    cache = _DatetimeCache(getattr(func, "uninstrumented", func))
+
+    def _instrumented_cache_call(text, anchorDate, lang_code, lang,
+                                 default_time):
+        failed = False
+        start = perf_counter()
+        try:
+            return cache(text, anchorDate, lang_code, lang, default_time)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            _record_call(("parse", "extract_datetime", lang_code),
+                         perf_counter() - start, False, failed,
+                         (text, anchorDate),
+                         {"lang": lang, "default_time": default_time})
+
+    @wraps(func)
+    def cached_extract_datetime(text, anchorDate=None, lang='',
+                                default_time=None):
+        if config.extract_datetime_cache and isinstance(text, str) and \
+                isinstance(lang, str):
+            lang_code = lang.split('-')[0].lower() if lang else \
+                get_default_lang()
+            if lang_code in get_active_langs():
+                if anchorDate is None:
+                    anchorDate = now_local()
+                elif anchorDate.tzinfo is None and config.inject_timezones:
+                    anchorDate = to_local(anchorDate)
+                if config.instrument_localized_functions:
+                    return _instrumented_cache_call(text, anchorDate,
+                                                    lang_code, lang,
+                                                    default_time)
+                return cache(text, anchorDate, lang_code, lang, default_time)
+        return func(text, anchorDate, lang=lang, default_time=default_time)
+
+    cached_extract_datetime.cache_info = cache.info
+    cached_extract_datetime.cache_clear = cache.clear
+    return cached_extract_datetime
+
+
+@_cache_datetime
+@localized_function(datetime_params=["anchorDate"])
 def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
     Extracts date and time information from a sentence.  Parses many of the
@@ -234,6 +469,12 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
         default_time (datetime.time): time to use if none was found in
             the input string.
 
+    Note:
+        Set `lingua_franca.config.extract_datetime_cache` to reuse results
+        for phrases which are parsed over and over again with the current
+        time as the anchor. `extract_datetime.cache_info()` reports hits and
+        misses and `extract_datetime.cache_clear()` empties the cache.
+
     Returns:
         [:obj:`datetime`, :obj:`str`]: 'datetime' is the extracted date
             as a datetime object in the local timezone.
@@ -265,6 +506,73 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+@localized_function(datetime_params=["anchorDate"])
+def extract_datetimes(text, anchorDate=None, lang='', default_time=None):
+    """
+    Extracts all the dates and times mentioned in a text, in one pass.
+
+    Where extract_datetime() merges every date and time word of the text
+    into one datetime, this returns one per mention, along with its span in
+    the text. Mentions are delimited by punctuation and by words such as
+    "and", "to" or "from", so "move my 3pm meeting from friday to next
+    tuesday" mentions 3pm today, friday and next tuesday.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            a mention.
+
+    Returns:
+        (list): list of tuples with each datetime and the span of its
+                mention in the text [(datetime, (start_idx, end_idx))]
+
+    Examples:
+
+        >>> extract_datetimes(
+        ... "Call mom tomorrow at 5, and the dentist on Friday",
+        ... datetime(2017, 6, 27, 00, 00)
+        ... )
+        [(datetime.datetime(2017, 6, 28, 5, 0), (9, 22)),
+         (datetime.datetime(2017, 6, 30, 0, 0), (40, 49))]
+    """
+
+
+@localized_function()
+def extract_datetime_expression(text, lang='', default_time=None):
+    """
+    Parses a date/time phrase once, to resolve it against many anchor dates.
+
+    extract_datetime(text, anchorDate, lang, default_time) is the same as
+    extract_datetime_expression(text, lang, default_time).resolve(anchorDate)
+    but the expression can be resolved again, e.g. for all the days of a
+    calendar view, without parsing the phrase for each of them. Anchors are
+    used as given, naive ones aren't converted to the local timezone.
+
+    Args:
+        text (str): the text to be interpreted
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+
+    Returns:
+        :obj:`DateExpression`: call resolve(anchorDate) for the
+            [:obj:`datetime`, :obj:`str`] extract_datetime() would return,
+            or resolve_many(anchorDates) for a list of those.
+
+            Returns 'None' for an empty string.
+
+    Examples:
+
+        >>> expression = extract_datetime_expression("next friday at 5 pm")
+        >>> expression.resolve(datetime(2017, 6, 27))
+        [datetime.datetime(2017, 6, 30, 17, 0), '']
+    """
+
+
 @localized_function()
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
@@ -335,3 +643,145 @@ def is_ordinal(input_str, lang=''):
         (bool) or (float): False if not an ordinal, otherwise the number
         corresponding to the ordinal
     """
+
+
+def _run_batch(function_name, texts, lang, workers, **kwargs):
+    """ Call a localized parser once per unique entry of `texts`
+
+    The language is resolved, and the localized function looked up, once
+    for the whole batch. Duplicate entries, common in ASR n-best lists,
+    are only parsed once, each repeat gets a copy of the result.
+
+    Args:
+        function_name (str): a name in _REGISTERED_FUNCTIONS
+        texts (iterable(str)): the strings to parse
+        lang (str): BCP-47 language code, '' for the default language
+        workers (int): size of the process pool to use, None or 1 parses
+                       the batch in the current process
+        kwargs: passed on to the localized function
+
+    Returns:
+        list: one result per entry of `texts`, in input order
+    """
+    texts = list(texts)
+    localized_func, loc_params = get_localized_function(
+        "parse", function_name, lang)
+    localized_func = partial(localized_func,
+                             **{arg: val for arg, val in kwargs.items()
+                                if arg in loc_params})
+    unique_texts = list(dict.fromkeys(texts))
+    if workers and workers > 1 and len(unique_texts) > 1:
+        # multiprocessing is slow to import, only pay for it when used
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(unique_texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(localized_func, unique_texts,
+                                    chunksize=chunksize))
+    else:
+        results = [localized_func(text) for text in unique_texts]
+    results = dict(zip(unique_texts, results))
+    batch = []
+    seen = set()
+    for text in texts:
+        if text in seen:
+            # the results are flat lists/tuples, e.g. [datetime, str]
+            batch.append(copy(results[text]))
+        else:
+            seen.add(text)
+            batch.append(results[text])
+    return batch
+
+
+def extract_number_batch(texts, short_scale=True, ordinals=False, lang='',
+                         workers=None):
+    """ Batch version of extract_number()
+
+    Args:
+        texts (list(str)): the strings to extract a number from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): parse in a pool of this many processes
+    Returns:
+        list: extract_number() of each string, in input order
+    """
+    return _run_batch("extract_number", texts, lang, workers,
+                      short_scale=short_scale, ordinals=ordinals)
+
+
+def extract_numbers_batch(texts, short_scale=True, ordinals=False, lang='',
+                          workers=None):
+    """ Batch version of extract_numbers()
+
+    Args:
+        texts (list(str)): the strings to extract numbers from
+        short_scale (bool): use short scale if True, long scale if False
+        ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): parse in a pool of this many processes
+    Returns:
+        list: extract_numbers() of each string, in input order
+    """
+    return _run_batch("extract_numbers", texts, lang, workers,
+                      short_scale=short_scale, ordinals=ordinals)
+
+
+def extract_duration_batch(texts, lang='', workers=None):
+    """ Batch version of extract_duration()
+
+    Args:
+        texts (list(str)): the strings to extract a duration from
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        workers (int, optional): parse in a pool of this many processes
+    Returns:
+        list: extract_duration() of each string, in input order
+    """
+    return _run_batch("extract_duration", texts, lang, workers)
+
+
+def extract_datetime_batch(texts, anchorDate=None, lang='',
+                           default_time=None, workers=None):
+    """ Batch version of extract_datetime()
+
+    Every string is resolved against the same anchorDate, so that all
+    results of a batch agree on what "now" is.
+
+    Args:
+        texts (list(str)): the strings to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating. Defaults to the current local date/time.
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        default_time (datetime.time): time to use if none was found in
+            the input string.
+        workers (int, optional): parse in a pool of this many processes
+    Returns:
+        list: extract_datetime() of each string, in input order
+    """
+    if anchorDate is None:
+        anchorDate = now_local()
+    elif config.inject_timezones and isinstance(anchorDate, datetime) and \
+            anchorDate.tzinfo is None:
+        anchorDate = to_local(anchorDate)
+    return _run_batch("extract_datetime", texts, lang, workers,
+                      anchorDate=anchorDate, default_time=default_time)
+
+
+def normalize_batch(texts, lang='', remove_articles=True, workers=None):
+    """ Batch version of normalize()
+
+    Args:
+        texts (list(str)): the strings to normalize
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+        remove_articles (bool): whether to remove articles (like 'a', or
+                                'the'). True by default.
+        workers (int, optional): parse in a pool of this many processes
+    Returns:
+        list: normalize() of each string, in input order
+    """
+    return _run_batch("normalize", texts, lang, workers,
+                      remove_articles=remove_articles)
@@ -13,22 +13,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from datetime import datetime
-from dateutil.tz import gettz, tzlocal
+from datetime import datetime, timedelta
+from dateutil.tz import gettz, tzlocal, tzutc
 
 
 # used to calculate timespans
 DAYS_IN_1_YEAR = 365.2425
 DAYS_IN_1_MONTH = 30.42
 
+_UTC = tzutc()
+
 __default_tz = None
+# tzlocal() of the system, built on first use
+__system_tz = None
+# timezone names resolved by get_timezone()
+_TIMEZONES = {"UTC": _UTC}
+# (tz, UTC minute, utc offset, tzinfo, fold) of the last minute converted
+# by _from_utc(), the minute as (minute, hour, day, month, year)
+_last_minute = (None, None, None, None, 0)
+_REST_OF_MINUTE = timedelta(seconds=59, microseconds=999999)
+
+
+def get_timezone(name):
+    """ Get a timezone by name, resolving each name only once
+
+    Args:
+        name (str): IANA name of the timezone, such as "Europe/Lisbon"
+
+    Returns:
+        (datetime.tzinfo): the timezone, None if the name is unknown
+    """
+    try:
+        return _TIMEZONES[name]
+    except KeyError:
+        tz = _TIMEZONES[name] = gettz(name)
+        return tz
 
 
 def set_default_tz(tz):
-    global __default_tz
+    global __default_tz, __system_tz
     if isinstance(tz, str):
-        tz = gettz(tz)
+        tz = get_timezone(tz)
     __default_tz = tz
+    __system_tz = None
+
+
+def _system_timezone():
+    global __system_tz
+    if __system_tz is None:
+        __system_tz = tzlocal()
+    return __system_tz
 
 
 def default_timezone():
@@ -41,7 +75,7 @@ def default_timezone():
     Returns:
         (datetime.tzinfo): Definition of the default timezone
     """
-    return __default_tz or tzlocal()
+    return __default_tz or _system_timezone()
 
 
 def now_utc():
@@ -50,7 +84,7 @@ def now_utc():
     Returns:
         (datetime): The current time in Universal Time, aka GMT
     """
-    return datetime.utcnow().replace(tzinfo=gettz("UTC"))
+    return datetime.now(_UTC)
 
 
 def now_local(tz=None):
@@ -63,7 +97,7 @@ def now_local(tz=None):
         (datetime): The current time
     """
     tz = tz or default_timezone()
-    return datetime.now(tz)
+    return _from_utc(datetime.now(_UTC), tz)
 
 
 def to_utc(dt):
@@ -74,10 +108,9 @@ def to_utc(dt):
     Returns:
         (datetime): time converted to UTC
     """
-    tz = gettz("UTC")
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
-    return dt.astimezone(tz)
+    return dt.astimezone(_UTC)
 
 
 def to_local(dt):
@@ -90,8 +123,48 @@ def to_local(dt):
     """
     tz = default_timezone()
     if not dt.tzinfo:
-        dt = dt.replace(tzinfo=default_timezone())
-    return dt.astimezone(tz)
+        return dt.replace(tzinfo=tz)
+    if dt.tzinfo is tz:
+        return dt
+    offset = dt.utcoffset()
+    if offset is None:
+        return dt.astimezone(tz)
+    return _from_utc(dt - offset, tz)
+
+
+def _from_utc(utc, tz):
+    """ Convert a datetime in UTC to `tz`, as tz.fromutc() does
+
+    dateutil's fromutc() takes several microseconds, tzlocal() most of all,
+    so the offset found for a minute is kept and reused for the conversions
+    in the same minute, such as now_local() called over and over. A minute
+    with a transition in it, where the offset or fold at its start and end
+    differ, is converted by tz.fromutc() each time.
+
+    Args:
+        utc (datetime): the UTC time, its tzinfo is ignored
+        tz (datetime.tzinfo): the timezone to convert to
+    """
+    global _last_minute
+    key = (utc.minute, utc.hour, utc.day, utc.month, utc.year)
+    last_tz, last_key, offset, tzinfo, fold = _last_minute
+    if last_tz is not tz or last_key != key:
+        minute = datetime(utc.year, utc.month, utc.day, utc.hour,
+                          utc.minute)
+        last = minute + _REST_OF_MINUTE
+        start = tz.fromutc(minute.replace(tzinfo=tz))
+        end = tz.fromutc(last.replace(tzinfo=tz))
+        offset = start.replace(tzinfo=None) - minute
+        if offset != end.replace(tzinfo=None) - last or \
+                start.tzinfo is not end.tzinfo or start.fold != end.fold:
+            return tz.fromutc(utc.replace(tzinfo=tz))
+        tzinfo, fold = start.tzinfo, start.fold
+        _last_minute = (tz, key, offset, tzinfo, fold)
+    # the constructor, as replace() is several times slower
+    local = utc + offset
+    return datetime(local.year, local.month, local.day, local.hour,
+                    local.minute, local.second, local.microsecond, tzinfo,
+                    fold=fold)
 
 
 def to_system(dt):
@@ -102,7 +175,7 @@ def to_system(dt):
     Returns:
         (datetime): time converted to the operation system's timezone
     """
-    tz = tzlocal()
+    tz = _system_timezone()
     if not dt.tzinfo:
         dt = dt.replace(tzinfo=default_timezone())
     return dt.astimezone(tz)
@@ -23,8 +23,10 @@ from dateutil import tz
 
 # TODO either write a getter for lingua_franca.internal._SUPPORTED_LANGUAGES,
 # or make it public somehow
-from lingua_franca import load_language, unload_language, set_default_lang
+from lingua_franca import load_language, unload_language, set_default_lang, \
+    config
 from lingua_franca.format import (
+    DateTimeFormat,
     date_time_format,
     nice_date,
     nice_date_time,
@@ -34,9 +36,14 @@ from lingua_franca.format import (
     nice_day,
     nice_month,
     nice_weekday,
-    get_date_strings
+    get_date_strings,
+    expand_options,
+    iter_expand_options,
+    count_options
 )
 from lingua_franca.lang.format_common import convert_to_mixed_fraction as cmf
+from lingua_franca.lang.format_common import memoize_integers, \
+    memoize_times, number_tables
 from lingua_franca.time import default_timezone, set_default_tz, now_local, \
     to_local
 
@@ -220,6 +227,23 @@ class TestNiceDateFormat(unittest.TestCase):
 
         set_default_lang('en')
 
+    def test_year_cache(self):
+        year_format = DateTimeFormat(date_time_format.config_path,
+                                     cached_years=range(1900, 2100))
+        year_format.cache('en-us')
+        for _ in range(2):
+            self.assertEqual(year_format.year_format(
+                datetime.datetime(1984, 1, 1), 'en-us', False),
+                'nineteen eighty four')
+            self.assertEqual(year_format.year_format(
+                datetime.datetime(1984, 1, 1), 'en-us', True),
+                'nineteen eighty four b.c.')
+            self.assertEqual(year_format.year_format(
+                datetime.datetime(5000, 1, 1), 'en-us', False),
+                'five thousand')
+        self.assertEqual(set(year_format._years['en-us']),
+                         {(1984, False), (1984, True)})
+
 
 class TestNiceDateUtils(unittest.TestCase):
     @classmethod
@@ -283,6 +307,74 @@ class TestNiceDateUtils(unittest.TestCase):
         }
         self.assertEqual(get_date_strings(dt, lang=self.lang), expected_output)        
 
+    def test_get_date_strings_cache(self):
+        from lingua_franca.format import _date_strings_cache
+        _date_strings_cache.clear()
+        config.date_strings_cache = True
+        config.date_strings_cache_size = 2
+        try:
+            dt = datetime.datetime(2022, 10, 31, 13, 30, 5)
+            strings = get_date_strings(dt, lang=self.lang)
+            self.assertEqual(strings["time_string"], "13:30")
+            strings["time_string"] = "changed"
+            # served from the cache within the minute, as a copy
+            self.assertEqual(
+                get_date_strings(dt.replace(second=55), lang=self.lang),
+                get_date_strings(dt, lang=self.lang))
+            self.assertEqual(len(_date_strings_cache), 1)
+            self.assertEqual(get_date_strings(dt, lang=self.lang)
+                             ["time_string"], "13:30")
+            self.assertEqual(
+                get_date_strings(dt.replace(minute=31), lang=self.lang)
+                ["time_string"], "13:31")
+            self.assertEqual(
+                get_date_strings(dt, time_format="half", lang=self.lang)
+                ["time_string"], "1:30")
+            self.assertEqual(len(_date_strings_cache), 2)
+        finally:
+            config.date_strings_cache = False
+            config.date_strings_cache_size = 256
+            _date_strings_cache.clear()
+
+
+class TestExpandOptions(unittest.TestCase):
+    def test_expand_options(self):
+        line = "Will it (rain|pour) (today|tomorrow|)?"
+        self.assertEqual(expand_options(line),
+                         ["Will it pour ?", "Will it pour tomorrow ?",
+                          "Will it pour today ?", "Will it rain ?",
+                          "Will it rain tomorrow ?", "Will it rain today ?"])
+        self.assertEqual(expand_options("(hey|hi) (there|) (mycroft|)"),
+                         ["hi", "hi mycroft", "hi there", "hi there mycroft",
+                          "hey", "hey mycroft", "hey there",
+                          "hey there mycroft"])
+        self.assertEqual(expand_options("a (single) group"),
+                         ["a ( single ) group"])
+        self.assertEqual(expand_options("no groups"), ["no groups"])
+        self.assertEqual(expand_options(""), [""])
+
+    def test_limit(self):
+        line = "Will it (rain|pour) (today|tomorrow|)?"
+        self.assertEqual(expand_options(line, limit=2),
+                         ["Will it pour ?", "Will it pour tomorrow ?"])
+        self.assertEqual(expand_options(line, limit=0), [])
+        self.assertEqual(expand_options(line, limit=100),
+                         expand_options(line))
+
+    def test_iter_and_count(self):
+        line = " ".join("(a{0}|b{0}|c{0}|)".format(i) for i in range(20))
+        self.assertEqual(count_options(line), 4 ** 20)
+        sentences = iter_expand_options(line)
+        self.assertEqual([next(sentences) for _ in range(3)],
+                         ["", "c19", "b19"])
+        self.assertEqual(len(list(iter_expand_options(line, 1000))), 1000)
+
+        for line in ["Will it (rain|pour) (today|tomorrow|)?",
+                     "(a|(b|c (d|e)) f|) (g (h|i|j)|k)", "x (y", "x )y| z"]:
+            expanded = expand_options(line)
+            self.assertEqual(list(iter_expand_options(line)), expanded)
+            self.assertEqual(count_options(line), len(expanded))
+
 
 class TestMixedFraction(unittest.TestCase):
     def test_convert_to_fraction(self):
@@ -293,5 +385,68 @@ class TestMixedFraction(unittest.TestCase):
         self.assertEqual(cmf(8.587465135, range(1, 101)), (8, 47, 80))
 
 
+class TestNumberHelpers(unittest.TestCase):
+    def test_number_tables(self):
+        from lingua_franca.lang.common_data_en import _NUM_STRING_EN, \
+            _SHORT_SCALE_EN
+        names, digits, tens, hundreds = number_tables(_NUM_STRING_EN,
+                                                      _SHORT_SCALE_EN)
+        self.assertEqual(names[7], "seven")
+        self.assertEqual(names[1000], "thousand")
+        self.assertEqual(digits[19], "nineteen")
+        self.assertEqual(tens[1], "twenty")
+        self.assertEqual(hundreds[:3], ["hundred", "thousand", "million"])
+        # the source dicts are left untouched
+        self.assertNotIn(1000, _NUM_STRING_EN)
+
+    def test_memoize_integers(self):
+        calls = []
+
+        @memoize_integers(maxsize=2)
+        def pronounce(number, places=2):
+            """ docstring """
+            calls.append(number)
+            return str(number)
+
+        self.assertEqual(pronounce.__doc__, " docstring ")
+        for number in (1, 1, 1.5, 1.5, False, 2, 3, 1):
+            pronounce(number)
+        self.assertEqual(calls, [1, 1.5, 1.5, False, 2, 3, 1])
+        self.assertEqual(pronounce.cache_info().currsize, 2)
+
+    def test_memoize_times(self):
+        calls = []
+
+        @memoize_times(maxsize=4)
+        def speak(dt, speech=True, use_24hour=False, use_ampm=False):
+            """ docstring """
+            calls.append((dt.hour, dt.minute))
+            if use_ampm is None:
+                raise TypeError("use_ampm")
+            return "{}:{:02d}".format(dt.hour, dt.minute)
+
+        self.assertEqual(speak.__doc__, " docstring ")
+        # the date and seconds don't matter, the flags do
+        self.assertEqual(speak(datetime.datetime(2017, 1, 31, 13, 22, 3)),
+                         "13:22")
+        self.assertEqual(speak(datetime.datetime(2020, 5, 1, 13, 22, 59)),
+                         "13:22")
+        speak(datetime.datetime(2020, 5, 1, 13, 22), False)
+        speak(datetime.datetime(2020, 5, 1, 13, 22), speech=False)
+        self.assertEqual(calls, [(13, 22)] * 3)
+        self.assertEqual(speak.cache_info().hits, 1)
+        # times given some other way aren't cached
+        speak(dt=datetime.datetime(2020, 5, 1, 13, 22))
+        speak(datetime.time(13, 22))
+        self.assertEqual(len(calls), 5)
+        # errors of the function itself are raised once, not retried
+        with self.assertRaises(TypeError):
+            speak(datetime.datetime(2020, 5, 1, 13, 22), use_ampm=None)
+        self.assertEqual(len(calls), 6)
+
+        self.assertEqual(nice_time(datetime.datetime(2017, 1, 31, 13, 22, 3)),
+                         nice_time(datetime.datetime(2018, 2, 1, 13, 22, 59)))
+
+
 if __name__ == "__main__":
     unittest.main()
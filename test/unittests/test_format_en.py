@@ -371,6 +371,21 @@ class TestPronounceNumber(unittest.TestCase):
                                           short_scale=False), "eighteen "
                                                               "trillionth")
 
+    def test_integer_cache(self):
+        from lingua_franca.lang.format_en import pronounce_number_en
+        pronounce_number_en.cache_clear()
+        self.assertEqual(pronounce_number(42), "forty two")
+        self.assertEqual(pronounce_number(42), "forty two")
+        self.assertEqual(pronounce_number_en.cache_info().hits, 1)
+        # floats and bools are never cached
+        self.assertEqual(pronounce_number(42.0), "forty two")
+        self.assertEqual(pronounce_number(42.5), "forty two point five")
+        self.assertEqual(pronounce_number(True), "one")
+        self.assertEqual(pronounce_number_en.cache_info().currsize, 1)
+        # the scale and ordinal flags are part of the key
+        self.assertEqual(pronounce_number(42, ordinals=True), "forty second")
+        self.assertEqual(pronounce_number_en.cache_info().currsize, 2)
+
 
 class TestNiceDateFormat(unittest.TestCase):
 
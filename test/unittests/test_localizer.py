@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import unittest
 
 from sys import version
@@ -115,6 +118,54 @@ class TestLanguageLoading(unittest.TestCase):
             lingua_franca.parse.extract_number("uno", lang="es")
         unload_all_languages()
 
+    def test_on_demand_cache(self):
+        from lingua_franca.internal import _on_demand_tables
+        unload_all_languages()
+        _on_demand_tables.clear()
+        lingua_franca.load_language("en")
+        lingua_franca.config.load_langs_on_demand = True
+        lingua_franca.config.on_demand_langs_cache_size = 2
+        try:
+            for text, lang, number in [("uno", "es", 1), ("zwei", "de", 2),
+                                       ("dos", "es", 2), ("trois", "fr", 3)]:
+                self.assertEqual(
+                    lingua_franca.parse.extract_number(text, lang=lang),
+                    number)
+            # the languages aren't loaded, only kept, the least recently
+            # used one is dropped
+            self.assertEqual(lingua_franca.get_active_langs(), ["en"])
+            self.assertEqual(list(_on_demand_tables),
+                             [("parse", "es"), ("parse", "fr")])
+            self.assertEqual(
+                lingua_franca.parse.extract_number_batch(["eins", "zwei"],
+                                                         lang="de"), [1, 2])
+        finally:
+            lingua_franca.config.load_langs_on_demand = False
+            lingua_franca.config.on_demand_langs_cache_size = 4
+            _on_demand_tables.clear()
+        unload_all_languages()
+
+    def test_concurrent_loading(self):
+        from concurrent.futures import ThreadPoolExecutor
+        unload_all_languages()
+        lingua_franca.load_language("en")
+        langs = ["es", "de", "fr", "it", "pt", "nl", "sv", "da"]
+
+        def load_and_call(lang):
+            lingua_franca.load_language(lang)
+            return lingua_franca.parse.extract_number("one", lang="en")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(load_and_call, langs * 2)),
+                             [1] * len(langs) * 2)
+        self.assertEqual(sorted(lingua_franca.get_active_langs()),
+                         sorted(["en"] + langs))
+        self.assertEqual(lingua_franca.get_default_lang(), "en")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lingua_franca.unload_language, langs))
+        self.assertEqual(lingua_franca.get_active_langs(), ["en"])
+        unload_all_languages()
+
     def test_load_language(self):
         lingua_franca.load_language('en')
 
@@ -199,6 +250,164 @@ class TestLocalizerEdgeCases(unittest.TestCase):
             lingua_franca.parse.is_ordinal("twelve")
         unload_all_languages()
 
+    def test_dispatch_table(self):
+        from lingua_franca.internal import _localized_dispatch_table
+        from lingua_franca.lang.parse_en import extract_number_en
+        lingua_franca.load_language('en')
+        func, params = _localized_dispatch_table["parse"]["en"][
+            "extract_number"]
+        self.assertIs(func, extract_number_en)
+        self.assertEqual(params, {"text", "short_scale", "ordinals"})
+        # kwargs the localized function doesn't accept are dropped
+        self.assertEqual(
+            lingua_franca.parse.extract_number("one", lang="en",
+                                               not_a_param=True),
+            1)
+        unload_all_languages()
+        self.assertNotIn("en", _localized_dispatch_table["parse"])
+
+    def test_datetime_params(self):
+        from datetime import datetime
+        from lingua_franca import config
+        from lingua_franca.time import default_timezone
+
+        with self.assertRaises(ValueError):
+            @localized_function(datetime_params=["anchor"])
+            def extract_something(text, anchorDate=None, lang=''):
+                pass
+
+        lingua_franca.load_language('en')
+        naive = datetime(2017, 6, 27, 13, 4)
+        extract_datetime = lingua_franca.parse.extract_datetime
+        for inject in (True, False):
+            config.inject_timezones = inject
+            tzinfo = default_timezone() if inject else None
+            self.assertEqual(
+                extract_datetime("tomorrow", naive, "en")[0].tzinfo, tzinfo)
+            self.assertEqual(
+                extract_datetime("tomorrow", anchorDate=naive)[0].tzinfo,
+                tzinfo)
+        config.inject_timezones = True
+        unload_all_languages()
+
+    def test_call_stats(self):
+        from lingua_franca import config
+        from lingua_franca.internal import get_call_stats, \
+            reset_call_stats, set_slow_call_hook, LATENCY_BUCKETS
+
+        lingua_franca.load_language('en')
+        lingua_franca.parse.extract_number("seven")  # not instrumented
+        self.assertEqual(get_call_stats(), {})
+
+        slow_calls = []
+        set_slow_call_hook(lambda *call: slow_calls.append(call),
+                           threshold=0)
+        config.instrument_localized_functions = True
+        try:
+            lingua_franca.parse.extract_number("seven", lang="en-us")
+            lingua_franca.parse.extract_number("eight", "en")
+            # there is no nice_duration_en, runs format.nice_duration
+            lingua_franca.format.nice_duration(90, lang="en")
+            with self.assertRaises(ModuleNotFoundError):
+                lingua_franca.parse.extract_number("sieben", lang="de")
+        finally:
+            config.instrument_localized_functions = False
+            set_slow_call_hook(None)
+
+        stats = get_call_stats()
+        # including the calls nice_duration makes to pronounce_number
+        self.assertEqual(set(stats), {("parse", "extract_number", "en"),
+                                      ("format", "nice_duration", "en"),
+                                      ("format", "pronounce_number", "en"),
+                                      ("parse", "extract_number", "de")})
+        number = stats[("parse", "extract_number", "en")]
+        self.assertEqual((number.calls, number.fallbacks, number.errors),
+                         (2, 0, 0))
+        self.assertEqual(sum(number.histogram), 2)
+        self.assertEqual(len(number.histogram), len(LATENCY_BUCKETS))
+        self.assertGreater(number.total_time, 0)
+        duration = stats[("format", "nice_duration", "en")]
+        self.assertEqual((duration.calls, duration.fallbacks,
+                          duration.errors), (1, 1, 0))
+        error = stats[("parse", "extract_number", "de")]
+        self.assertEqual((error.calls, error.fallbacks, error.errors),
+                         (1, 0, 1))
+
+        self.assertEqual(len(slow_calls),
+                         sum(call.calls for call in stats.values()))
+        key, elapsed, args, kwargs = slow_calls[0]
+        self.assertEqual(key, ("parse", "extract_number", "en"))
+        self.assertEqual((args, kwargs), (("seven",), {"lang": "en-us"}))
+
+        reset_call_stats()
+        self.assertEqual(get_call_stats(), {})
+        unload_all_languages()
+
+
+class TestLazyLoading(unittest.TestCase):
+    # generous, this is meant to catch import time regressions such as a
+    # language module being imported eagerly again, not slow machines
+    IMPORT_BUDGET_MS = float(os.environ.get("LF_IMPORT_BUDGET_MS", 2000))
+
+    def setUp(self):
+        unload_all_languages()
+        lingua_franca.config.lazy_load_langs = True
+
+    def tearDown(self):
+        lingua_franca.config.lazy_load_langs = False
+        unload_all_languages()
+
+    def test_lazy_dispatch_table(self):
+        from lingua_franca.internal import _localized_dispatch_table, \
+            _localized_functions, _LazyFunctionTable, get_localized_function
+        lingua_franca.load_languages(['en', 'es'])
+        en_table = _localized_dispatch_table["parse"]["en"]
+        self.assertIsInstance(en_table, _LazyFunctionTable)
+        self.assertEqual(len(en_table), 0)
+        self.assertIsNone(
+            _localized_functions["parse"]["en"]["extract_number"])
+
+        self.assertEqual(lingua_franca.parse.extract_number("one"), 1)
+        self.assertTrue(en_table.resolved)
+        self.assertIsNotNone(
+            _localized_functions["parse"]["en"]["extract_number"])
+        # loading another language keeps the resolved table
+        lingua_franca.load_language('de')
+        self.assertIs(_localized_dispatch_table["parse"]["en"], en_table)
+
+        self.assertEqual(len(_localized_dispatch_table["parse"]["es"]), 0)
+        func, _ = get_localized_function("parse", "extract_number", "es")
+        self.assertEqual(func("dos"), 2)
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal("twelve")
+
+    def test_import_time_budget(self):
+        code = "\n".join((
+            "import sys",
+            "from lingua_franca import config",
+            "config.ovos_defaults = False",
+            "config.lazy_load_langs = True",
+            "import lingua_franca, lingua_franca.parse, lingua_franca.format",
+            "lingua_franca.load_languages(",
+            "    lingua_franca.get_supported_langs())",
+            "print(' '.join(m for m in sys.modules",
+            "               if m.startswith(('lingua_franca.lang.parse_',",
+            "                                'lingua_franca.lang.format_'))))",
+        ))
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True, check=True)
+        # the shared *_common helpers are fine, language modules are not
+        self.assertEqual([m for m in proc.stdout.split()
+                          if not m.endswith("_common")], [])
+        # "import time: self [us] | cumulative | imported package"
+        total_us = sum(int(line.split("|")[0].split(":")[1])
+                       for line in proc.stderr.splitlines()
+                       if line.startswith("import time:")
+                       and "self [us]" not in line)
+        self.assertLess(total_us / 1000, self.IMPORT_BUDGET_MS)
+
 
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
@@ -239,3 +448,85 @@ class TestGetter(unittest.TestCase):
 #                lingua_franca.internal.UnsupportedLanguageError):
 #            lingua_franca.get_full_lang_code("bob robertson")
         unload_all_languages()
+
+
+class TestResourceCache(unittest.TestCase):
+    def setUp(self):
+        lingua_franca.internal.clear_resource_cache()
+
+    def tearDown(self):
+        lingua_franca.config.resource_cache_check_mtime = False
+        lingua_franca.internal.clear_resource_cache()
+
+    def test_cached_resource(self):
+        from lingua_franca.internal import get_cached_resource, \
+            clear_resource_cache, _resource_cache
+        colors = get_cached_resource("colors.json", "en-us",
+                                     fallback="text/webcolors.json")
+        self.assertIs(get_cached_resource("colors.json", "en-us"), colors)
+
+        inverted = get_cached_resource("colors.json", "en-us",
+                                       derive=lambda d: {})
+        self.assertEqual(inverted, {})
+        self.assertIs(get_cached_resource("colors.json", "en-us"), colors)
+
+        clear_resource_cache("yesno.json")
+        self.assertIn(("colors.json", "en-us"), _resource_cache)
+        clear_resource_cache(lang="en-us")
+        self.assertNotIn(("colors.json", "en-us"), _resource_cache)
+        self.assertIsNot(get_cached_resource("colors.json", "en-us"), colors)
+
+    def test_missing_resource(self):
+        from lingua_franca.internal import get_cached_resource
+        self.assertIsNone(get_cached_resource("not_a_file.json", "en-us"))
+        self.assertIsNotNone(
+            get_cached_resource("colors.json", "xx-xx",
+                                fallback="text/webcolors.json"))
+
+    def test_mtime_invalidation(self):
+        from lingua_franca.internal import get_cached_resource, \
+            _resource_cache
+        langs = get_cached_resource("langs.json", "en-us")
+        _resource_cache[("langs.json", "en-us")].mtime = 0
+        self.assertIs(get_cached_resource("langs.json", "en-us"), langs)
+        lingua_franca.config.resource_cache_check_mtime = True
+        self.assertIsNot(get_cached_resource("langs.json", "en-us"), langs)
+
+    def test_word_table(self):
+        import tempfile
+        from unittest.mock import patch
+        from lingua_franca.format import _translate_word
+        from lingua_franca.internal import get_word_table, \
+            clear_resource_cache
+        self.assertEqual(_translate_word("hours", "en-us"), "hours")
+        self.assertEqual(_translate_word("not_a_word", "en-us"), "not_a_word")
+        self.assertIs(get_word_table("en-us"), get_word_table("en-us"))
+
+        with tempfile.TemporaryDirectory() as home, \
+                patch.dict(os.environ, {"HOME": home}):
+            overrides = os.path.join(home, ".mycroft", "text", "en-us")
+            os.makedirs(overrides)
+            override = os.path.join(overrides, "hours.word")
+            clear_resource_cache()
+            self.assertEqual(_translate_word("hours", "en-us"), "hours")
+
+            # read again, as the overrides change, with the check enabled
+            lingua_franca.config.resource_cache_check_mtime = True
+            with open(override, "w") as f:
+                f.write("# abbreviated\nhrs\n")
+            self.assertEqual(_translate_word("hours", "en-us"), "hrs")
+            with open(override, "w") as f:
+                f.write("h\n")
+            os.utime(override, (0, 0))
+            self.assertEqual(_translate_word("hours", "en-us"), "h")
+            os.remove(override)
+            self.assertEqual(_translate_word("hours", "en-us"), "hours")
+
+            # kept until the cache is cleared, without it
+            lingua_franca.config.resource_cache_check_mtime = False
+            with open(override, "w") as f:
+                f.write("hrs\n")
+            self.assertEqual(_translate_word("hours", "en-us"), "hours")
+            clear_resource_cache("hours.word", "en-us")
+            self.assertEqual(_translate_word("hours", "en-us"), "hrs")
+        clear_resource_cache()
@@ -14,14 +14,20 @@
 # limitations under the License.
 #
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from dateutil import tz
 
 from lingua_franca import load_language, unload_language, set_default_lang
-from lingua_franca.lang.parse_common import tokenize, Token, Normalizer
+from lingua_franca.lang.parse_common import tokenize, Token, Normalizer, \
+    TokenTrie, DurationPattern, extract_numbers_with_text
 from lingua_franca.parse import extract_datetime, fuzzy_match, match_one, extract_langcode, yes_or_no
-from lingua_franca.time import default_timezone, now_local, set_default_tz
+from lingua_franca.parse import extract_number, extract_numbers, \
+    extract_duration, normalize, extract_number_batch, \
+    extract_numbers_batch, extract_duration_batch, extract_datetime_batch, \
+    normalize_batch, incremental_number_extractor
+from lingua_franca.time import default_timezone, now_local, set_default_tz, \
+    get_timezone, now_utc, to_local, to_utc
 from lingua_franca.internal import FunctionNotLocalizedError
 
 
@@ -78,6 +84,43 @@ class TestTimezones(unittest.TestCase):
 
         set_default_tz(default)  # undo changes to default tz after test
 
+    def test_timezone_registry(self):
+        default = default_timezone()
+
+        self.assertIs(get_timezone("Europe/Lisbon"),
+                      get_timezone("Europe/Lisbon"))
+        self.assertEqual(get_timezone("Europe/Lisbon"),
+                         tz.gettz("Europe/Lisbon"))
+        self.assertIsNone(get_timezone("Not/A_Timezone"))
+        self.assertEqual(now_utc().utcoffset().total_seconds(), 0)
+        self.assertEqual(to_utc(datetime(2017, 6, 27, 13, 4,
+                                         tzinfo=tz.gettz("Europe/Lisbon"))),
+                         datetime(2017, 6, 27, 12, 4, tzinfo=tz.tzutc()))
+
+        set_default_tz(None)
+        self.assertIs(default_timezone(), default_timezone())
+        self.assertEqual(default_timezone(), tz.tzlocal())
+        naive = datetime(2017, 6, 27, 13, 4)
+        self.assertEqual(to_local(naive),
+                         naive.replace(tzinfo=default_timezone()))
+
+        set_default_tz("America/Chicago")
+        self.assertIs(default_timezone(), get_timezone("America/Chicago"))
+        self.assertEqual(to_local(naive).tzinfo, tz.gettz("America/Chicago"))
+        self.assertEqual(
+            to_local(datetime(2017, 6, 27, 13, 4, tzinfo=tz.tzutc())),
+            datetime(2017, 6, 27, 8, 4, tzinfo=tz.gettz("America/Chicago")))
+        # the offset kept for a minute doesn't carry over a transition
+        for seconds in range(-90, 90, 7):
+            utc = datetime(2017, 11, 5, 7, tzinfo=tz.tzutc()) + \
+                timedelta(seconds=seconds)
+            local = utc.astimezone(tz.gettz("America/Chicago"))
+            self.assertEqual((to_local(utc), to_local(utc).fold),
+                             (local, local.fold))
+        self.assertEqual(now_local().tzinfo, default_timezone())
+
+        set_default_tz(default)  # undo changes to default tz after test
+
 
 class TestFuzzyMatch(unittest.TestCase):
     def test_matches(self):
@@ -148,6 +191,66 @@ class TestRemoveSymbols(unittest.TestCase):
                          "15/2/2018")
         
 
+class TestCompiledNormalizer(unittest.TestCase):
+    config = {"lowercase": True,
+              "remove_accents": True,
+              "remove_stopwords": True,
+              "contractions": {"isn't": "is not", "it's": "it is"},
+              "word_replacements": {"not": "nope", "gonna": "going to"},
+              "number_replacements": {"two": "2"},
+              "articles": ["a", "the"],
+              "stopwords": ["is", "to", "well"]}
+
+    @staticmethod
+    def step_by_step(normalizer, utterance, remove_articles):
+        utterance = normalizer.expand_contractions(utterance.lower())
+        utterance = normalizer.replace_words(utterance)
+        utterance = normalizer.numbers_to_digits(utterance)
+        utterance = normalizer.remove_symbols(utterance)
+        utterance = normalizer.remove_accents(utterance)
+        if remove_articles:
+            utterance = normalizer.remove_articles(utterance)
+        utterance = normalizer.remove_stopwords(utterance)
+        return " ".join(utterance.split())
+
+    def test_single_pass_matches_steps(self):
+        normalizer = Normalizer(self.config)
+        for utterance in ["It's the Café, isn't it?",
+                          "I'm gonna buy two apples, well-",
+                          "a well -",
+                          ""]:
+            for remove_articles in (True, False):
+                self.assertEqual(
+                    normalizer.normalize(utterance, remove_articles),
+                    self.step_by_step(normalizer, utterance,
+                                      remove_articles))
+        self.assertEqual(normalizer.normalize("It's the Café, isn't it?"),
+                         "it the cafe nope it")
+
+    def test_tokens_split_between_steps(self):
+        # ".lang." is a token in the whole text, but ".", "lang", "." once
+        # the "_" around it is removed and the text is tokenized again
+        normalizer = Normalizer(self.config)
+        for utterance in ["lingua_franca.lang.format_",
+                          "see lingua_franca.lang.parse_cs for the rest"]:
+            for remove_articles in (True, False):
+                self.assertEqual(
+                    normalizer.normalize(utterance, remove_articles),
+                    self.step_by_step(normalizer, utterance,
+                                      remove_articles))
+        self.assertEqual(normalizer.normalize("lingua_franca.lang.format_"),
+                         "lingua franca lang format")
+
+    def test_overridden_steps(self):
+        class ShoutingNormalizer(Normalizer):
+            def numbers_to_digits(self, utterance):
+                return utterance.upper()
+
+        self.assertEqual(
+            ShoutingNormalizer(self.config).normalize("isn't two apples"),
+            "IS NOPE TWO APPLES")
+
+
 class TestLangcode(unittest.TestCase):
     def test_parse_lang_code(self):
 
@@ -172,5 +275,155 @@ class TestYesNo(unittest.TestCase):
         self.assertRaises(FunctionNotLocalizedError, test_utt)
 
 
+class TestTokenTrie(unittest.TestCase):
+    def test_longest_match(self):
+        trie = TokenTrie({"red": 1, "dark red": 2,
+                          "very very dark red": 4, "very": 5})
+        words = "a very very dark red and a very dark red".split()
+        self.assertEqual(trie.longest_match(words, 0), None)
+        self.assertEqual(trie.longest_match(words, 1), (5, 4))
+        self.assertEqual(trie.longest_match(words, 7), (8, 5))
+        self.assertEqual(trie.tag(words),
+                         [(1, 5, 4), (7, 8, 5), (8, 10, 2)])
+        self.assertEqual(trie.tag([]), [])
+
+
+class TestDurationPattern(unittest.TestCase):
+    def test_extract(self):
+        pattern = DurationPattern(r"(?P<value>\d+)\s+{unit}s?",
+                                  {"minute": "minutes", "min": "min",
+                                   "hour": "hours"})
+        text, durations = pattern.extract(
+            "2 hours 5 minutes and 3 mins then 1 hour")
+        self.assertEqual(text, "  and  then ")
+        # grouped by unit in the given order, then by position; "minute"
+        # is tried before "min"
+        self.assertEqual([(unit, match.group("value"))
+                          for unit, match in durations],
+                         [("minutes", "5"), ("min", "3"),
+                          ("hours", "2"), ("hours", "1")])
+        self.assertEqual(pattern.extract("no duration"), ("no duration", []))
+
+
+class TestBatch(unittest.TestCase):
+    utterances = ["set a timer for five minutes",
+                  "remind me tomorrow at 7 pm",
+                  "one two three",
+                  "set a timer for five minutes",
+                  "nothing here",
+                  "I'm the one with twenty-two and a half apples"]
+
+    def test_batch_matches_single_calls(self):
+        self.assertEqual(extract_number_batch(self.utterances),
+                         [extract_number(u) for u in self.utterances])
+        self.assertEqual(extract_numbers_batch(self.utterances,
+                                               lang="en-us"),
+                         [extract_numbers(u) for u in self.utterances])
+        self.assertEqual(extract_duration_batch(self.utterances),
+                         [extract_duration(u) for u in self.utterances])
+        self.assertEqual(normalize_batch(self.utterances,
+                                         remove_articles=False),
+                         [normalize(u, remove_articles=False)
+                          for u in self.utterances])
+
+    def test_duplicates_get_their_own_result(self):
+        numbers = extract_numbers_batch(["one two", "one two"])
+        self.assertEqual(numbers, [[1, 2], [1, 2]])
+        self.assertIsNot(numbers[0], numbers[1])
+        numbers[0].append(3)
+        self.assertEqual(numbers[1], [1, 2])
+        dates = extract_datetime_batch(["tomorrow", "tomorrow"])
+        self.assertIsNot(dates[0], dates[1])
+
+    def test_datetime_batch_shares_anchor(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        self.assertEqual(
+            extract_datetime_batch(self.utterances, anchorDate=anchor),
+            [extract_datetime(u, anchorDate=anchor)
+             for u in self.utterances])
+        self.assertEqual(extract_datetime_batch([]), [])
+
+    def test_process_pool(self):
+        self.assertEqual(extract_number_batch(self.utterances, workers=2),
+                         [extract_number(u) for u in self.utterances])
+
+    def test_language_not_loaded(self):
+        with self.assertRaises(ModuleNotFoundError):
+            extract_number_batch(["uno"], lang="es")
+
+
+class TestExtractNumbersWithText(unittest.TestCase):
+    def test_generic_handler(self):
+        from lingua_franca.lang.parse_common import ReplaceableNumber
+
+        def first_digit(tokens):
+            for token in tokens:
+                if token.word.isdigit():
+                    return ReplaceableNumber(int(token.word), [token])
+            return ReplaceableNumber(None, [])
+
+        numbers = extract_numbers_with_text(tokenize("a 1 b 22 c 3"),
+                                            first_digit)
+        self.assertEqual([(n.value, n.start_index) for n in numbers],
+                         [(1, 1), (22, 3), (3, 5)])
+
+    def test_english(self):
+        from lingua_franca.lang.parse_en import _extract_numbers_with_text_en
+
+        def spans(text, **kwargs):
+            return [(n.value, n.start_index, n.end_index) for n in
+                    _extract_numbers_with_text_en(tokenize(text), **kwargs)]
+
+        # a fraction is found before the number to its left
+        self.assertEqual(spans("one two and a half"),
+                         [(1, 0, 0), (2.5, 1, 4)])
+        # words rewritten by the parser stay rewritten
+        self.assertEqual(spans("the 1st one and the 2nd one"),
+                         [(1, 1, 1), (2, 5, 5)])
+        text = "add five eggs and three hundred grams of flour " * 20
+        self.assertEqual(extract_numbers(text), [5, 300] * 20)
+
+    def test_czech(self):
+        from lingua_franca.lang.parse_cs import _extract_numbers_with_text_cs
+
+        # the words left of a number aren't parsed on their own, where the
+        # decimal parser would fail
+        self.assertEqual(
+            [n.value for n in _extract_numbers_with_text_cs(
+                tokenize("celá půl celá sedm sto první"))],
+            [1.0, 0.5, 700.0])
+
+
+class TestIncrementalNumberExtractor(unittest.TestCase):
+    def test_stream(self):
+        stream = incremental_number_extractor()
+        self.assertEqual(stream.feed("add twenty"), [])
+        self.assertEqual([n.value for n in stream.pending], [20])
+        finished = stream.feed("five eggs and")
+        self.assertEqual([(n.value, n.start_index, n.end_index)
+                          for n in finished], [(25, 1, 2)])
+        self.assertEqual(stream.pending, [])
+        self.assertEqual(stream.feed(["a", "hundred"]), [])
+        self.assertEqual([n.value for n in stream.close()], [100])
+        self.assertEqual([n.text for n in stream.numbers],
+                         ["twenty five", "hundred"])
+
+    def test_matches_extract_numbers(self):
+        text = "call five five five one two three four then buy " \
+               "two hundred and fifty grams of sugar and a dozen eggs"
+        stream = incremental_number_extractor(ordinals=True)
+        for word in text.split():
+            stream.feed(word)
+        stream.close()
+        self.assertEqual([n.value for n in stream.numbers],
+                         extract_numbers(text, ordinals=True))
+
+    def test_not_localized(self):
+        load_language("es")
+        with self.assertRaises(FunctionNotLocalizedError):
+            incremental_number_extractor(lang="es")
+        unload_language("es")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,249 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Runs the extract_datetime tests of every test_parse_* module again with
+config.extract_datetime_cache enabled, each of them twice so the second run
+is served from the cache."""
+import glob
+import inspect
+import os
+import unittest
+from datetime import datetime, timedelta
+from importlib import import_module
+
+from lingua_franca import config, load_language, unload_language, \
+    set_default_lang
+from lingua_franca.parse import extract_datetime, \
+    extract_datetime_expression
+
+
+def _import_sibling(name):
+    if __package__:
+        return import_module("." + name, __package__)
+    return import_module(name)
+
+
+def _cached_test(test):
+    def run_twice(self):
+        test(self)
+        test(self)
+    run_twice.__name__ = test.__name__
+    return run_twice
+
+
+def _cached_test_case(module, test_case):
+    attrs = {}
+    for name, member in inspect.getmembers(test_case, inspect.isfunction):
+        if not name.startswith("test"):
+            continue
+        if "extract_datetime" in inspect.getsource(member):
+            attrs[name] = _cached_test(member)
+        else:
+            attrs[name] = None  # not collected
+
+    @classmethod
+    def setUpClass(cls):
+        if hasattr(module, "setUpModule"):
+            module.setUpModule()
+        test_case.setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        test_case.tearDownClass()
+        if hasattr(module, "tearDownModule"):
+            module.tearDownModule()
+
+    def setUp(self):
+        config.extract_datetime_cache = True
+        test_case.setUp(self)
+
+    def tearDown(self):
+        test_case.tearDown(self)
+        config.extract_datetime_cache = False
+        extract_datetime.cache_clear()
+
+    attrs.update(setUpClass=setUpClass, tearDownClass=tearDownClass,
+                 setUp=setUp, tearDown=tearDown)
+    return type(test_case.__name__ + "Cached", (test_case,), attrs)
+
+
+def _collect():
+    here = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(here, "test_parse*.py"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if name == __name__.split(".")[-1]:
+            continue
+        module = _import_sibling(name)
+        for _, test_case in inspect.getmembers(module, inspect.isclass):
+            if issubclass(test_case, unittest.TestCase) and \
+                    test_case.__module__ == module.__name__ and \
+                    "extract_datetime" in inspect.getsource(test_case):
+                cached = _cached_test_case(module, test_case)
+                cached.__name__ = name[len("test_"):] + "_" + cached.__name__
+                yield cached
+
+
+for _test_case in _collect():
+    globals()[_test_case.__name__] = _test_case
+del _test_case
+
+
+class TestDatetimeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        load_language("en")
+        set_default_lang("en")
+
+    @classmethod
+    def tearDownClass(cls):
+        unload_language("en")
+
+    def setUp(self):
+        extract_datetime.cache_clear()
+        config.extract_datetime_cache = True
+
+    def tearDown(self):
+        config.extract_datetime_cache = False
+        config.extract_datetime_cache_size = 512
+        extract_datetime.cache_clear()
+
+    def assertCachedEqual(self, text, anchor, **kwargs):
+        config.extract_datetime_cache = False
+        expected = extract_datetime(text, anchor, **kwargs)
+        config.extract_datetime_cache = True
+        self.assertEqual(extract_datetime(text, anchor, **kwargs), expected)
+
+    def test_moving_anchor(self):
+        anchor = datetime(2017, 6, 27, 13, 4, 5, 123)
+        phrases = ["tomorrow at 7", "in 10 minutes", "tonight", "at 13:04",
+                   "in 5 seconds", "now", "what is the weather"]
+        for text in phrases:
+            for seconds in (0, 0.4, 1.5, 20.25, 54.9, -5.000123, 0, 30,
+                            86400 * 3.5):
+                self.assertCachedEqual(text,
+                                       anchor + timedelta(seconds=seconds))
+        # english phrases are parsed once, and resolved for each anchor
+        info = extract_datetime.cache_info()
+        self.assertEqual(info.currsize, len(phrases))
+        self.assertEqual(info.misses, len(phrases))
+        self.assertEqual(info.hits, 8 * len(phrases))
+
+    def test_moving_anchor_by_minute(self):
+        load_language("es")
+        anchor = datetime(2017, 6, 27, 13, 4, 5, 123)
+        phrases = ["mañana a las 7", "en 10 minutos", "esta noche",
+                   "a las 13:04", "en 5 segundos", "ahora",
+                   "qué tiempo hace"]
+        try:
+            for text in phrases:
+                for seconds in (0, 0.4, 1.5, 20.25, 54.9, -5.000123, 0, 30):
+                    self.assertCachedEqual(
+                        text, anchor + timedelta(seconds=seconds), lang="es")
+        finally:
+            unload_language("es")
+        # computed: the first anchor in 13:04, 0.4s later (only tells the
+        # result holds within that second), 1.5s later (tells how it moves
+        # with the anchor) and the only anchor in 13:03. The rest is reused
+        info = extract_datetime.cache_info()
+        self.assertEqual(info.currsize, 2 * len(phrases))
+        self.assertEqual(info.misses, 4 * len(phrases))
+        self.assertEqual(info.hits, 4 * len(phrases))
+
+    def test_anchor_on_the_minute(self):
+        # 13:04:00 is still in time for "at 13:04", 13:04:01 isn't
+        self.assertCachedEqual("at 13:04", datetime(2017, 6, 27, 13, 4, 1))
+        self.assertCachedEqual("at 13:04", datetime(2017, 6, 27, 13, 4, 30))
+        self.assertCachedEqual("at 13:04", datetime(2017, 6, 27, 13, 4))
+
+    def test_absolute_phrase(self):
+        for days in (0, 1, 400, -3000):
+            self.assertCachedEqual(
+                "june 5th 2025 at 3pm",
+                datetime(2017, 6, 27, 13, 4, 5) + timedelta(days=days))
+        info = extract_datetime.cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 1))
+        # its result is kept outright, unlike a date without the year
+        anchor = datetime(2017, 6, 27, 13, 4, 5)
+        self.assertTrue(extract_datetime_expression(
+            "june 5th 2025 at 3pm").is_absolute(anchor))
+        for text in ("june 5th at 3pm", "tomorrow", "in 2025",
+                     "june 5th 2025 in 2 hours"):
+            self.assertFalse(
+                extract_datetime_expression(text).is_absolute(anchor))
+
+    def test_key(self):
+        anchor = datetime(2017, 6, 27, 13, 4, 5)
+        self.assertCachedEqual("tomorrow at 7", anchor)
+        # the text is used as given, some parsers are case sensitive
+        self.assertCachedEqual("Tomorrow at 7", anchor)
+        self.assertEqual(extract_datetime.cache_info().misses, 2)
+        self.assertCachedEqual("tomorrow", anchor,
+                               default_time=datetime(2017, 1, 1, 9).time())
+        self.assertEqual(extract_datetime.cache_info().misses, 3)
+
+        load_language("es")
+        try:
+            for text in ("hoy 2 de la tarde", "Hoy 2 De La Tarde"):
+                self.assertCachedEqual(text, anchor, lang="es")
+        finally:
+            unload_language("es")
+
+    def test_copies(self):
+        anchor = datetime(2017, 6, 27, 13, 4, 5)
+        extract_datetime("tomorrow", anchor).append("junk")
+        self.assertEqual(len(extract_datetime("tomorrow", anchor)), 2)
+
+    def test_eviction(self):
+        config.extract_datetime_cache_size = 2
+        anchor = datetime(2017, 6, 27, 13, 4, 5)
+        for text in ("today", "tomorrow", "yesterday", "today"):
+            extract_datetime(text, anchor)
+        info = extract_datetime.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 4, 2))
+
+    def test_disabled(self):
+        config.extract_datetime_cache = False
+        extract_datetime("tomorrow", datetime(2017, 6, 27, 13, 4, 5))
+        self.assertEqual(extract_datetime.cache_info().misses, 0)
+        # languages which aren't loaded go through the usual error handling
+        config.extract_datetime_cache = True
+        with self.assertRaises(ModuleNotFoundError):
+            extract_datetime("mañana", lang="es")
+        self.assertEqual(extract_datetime.cache_info().currsize, 0)
+
+    def test_call_stats(self):
+        from lingua_franca.internal import get_call_stats, reset_call_stats
+        anchor = datetime(2017, 6, 27, 13, 4, 5)
+        reset_call_stats()
+        config.instrument_localized_functions = True
+        load_language("es")
+        try:
+            for _ in range(2):
+                extract_datetime("tomorrow", anchor)
+                extract_datetime("mañana", anchor, lang="es")
+        finally:
+            config.instrument_localized_functions = False
+            unload_language("es")
+        # a miss and a hit each, the miss isn't counted twice
+        stats = get_call_stats()
+        for lang in ("en", "es"):
+            self.assertEqual(
+                stats[("parse", "extract_datetime", lang)].calls, 2)
+        self.assertEqual(extract_datetime.cache_info().hits, 2)
+        reset_call_stats()
+
+
+if __name__ == "__main__":
+    unittest.main()
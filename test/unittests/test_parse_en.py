@@ -21,7 +21,8 @@ from dateutil.relativedelta import relativedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, \
+    extract_datetime_expression, extract_datetimes
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_langcode
 from lingua_franca.parse import extract_number, extract_numbers
@@ -72,6 +73,11 @@ class TestNormalize(unittest.TestCase):
                          'What time will it be in 22 minutes')
         self.assertEqual(normalize("remind me to do something at twenty to two"),
                          "remind me to do something at 20 to 2")
+        # a lone fraction word ends the search for numbers
+        self.assertEqual(normalize("quarter three month 3rd yesterday and"),
+                         "quarter 3 month 3rd yesterday and")
+        self.assertEqual(normalize("a quarter two pm thousand"),
+                         "quarter 2 pm thousand")
 
         # TODO imperfect test, maybe should return 'my favorite numbers are 20 2',
         #  let is pass for now since this is likely a STT issue if ever
@@ -1084,6 +1090,135 @@ class TestExtractDateTime(unittest.TestCase):
         self.assertEqual(extract_datetime('in 2007', date)[0],
                          datetime(2007, 6, 27, tzinfo=date.tzinfo))
 
+    def test_extract_date_words_en(self):
+        # words only recognized after stripping a trailing "s", or because
+        # of the word that follows them
+        date = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        self.assertEqual(
+            extract_datetime('what happened 2 decades ago', date),
+            [datetime(1997, 6, 27, tzinfo=date.tzinfo), 'what happened'])
+        self.assertEqual(
+            extract_datetime('remind me 3 weeks from next thursday', date),
+            [datetime(2017, 7, 20, tzinfo=date.tzinfo), 'remind me'])
+        self.assertEqual(
+            extract_datetime('wake me at 7 on mondays', date),
+            [datetime(2017, 7, 3, 7, 0, tzinfo=date.tzinfo), 'wake me'])
+        self.assertEqual(
+            extract_datetime('what is happening on jan 5', date),
+            [datetime(2018, 1, 5, tzinfo=date.tzinfo), 'what is happening'])
+
+    def test_extract_datetime_expression_en(self):
+        date = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        anchors = [date + timedelta(hours=5 * i) for i in range(200)]
+        for text in ("next friday at 5 pm", "in 3 days", "at 15",
+                     "what is the weather tomorrow", "when is september",
+                     "next month", "now", "what is the weather"):
+            expression = extract_datetime_expression(text)
+            self.assertEqual(expression.resolve_many(anchors),
+                             [extract_datetime(text, a) for a in anchors])
+            self.assertEqual(expression.resolve(date),
+                             extract_datetime(text, date))
+
+        # parsed once per weekday, every other anchor reuses one of those
+        expression = extract_datetime_expression("next friday at 5 pm")
+        expression.resolve_many(anchors)
+        self.assertEqual(
+            sum(len(states) for states in expression._states.values()), 7)
+
+        self.assertEqual(extract_datetime_expression("in 3 days"),
+                         extract_datetime_expression("in 3 days"))
+        self.assertNotEqual(
+            extract_datetime_expression("in 3 days"),
+            extract_datetime_expression("in 3 days", default_time=time(9)))
+        self.assertEqual(len({extract_datetime_expression("today"),
+                              extract_datetime_expression("today")}), 1)
+        self.assertIsNone(extract_datetime_expression(""))
+
+    def test_extract_datetimes_en(self):
+        def extract(text):
+            return [(extracted, text[start:end]) for extracted, (start, end)
+                    in extract_datetimes(text, date)]
+
+        date = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        self.assertEqual(
+            extract("move my 3pm meeting from Friday to next Tuesday"),
+            [(datetime(2017, 6, 27, 15, 0, tzinfo=date.tzinfo), "3pm"),
+             (datetime(2017, 6, 30, tzinfo=date.tzinfo), "from Friday"),
+             (datetime(2017, 7, 4, tzinfo=date.tzinfo), "next Tuesday")])
+        self.assertEqual(
+            extract("Call mom tomorrow at 5, and the dentist on Friday. "
+                    "Lunch with Ann on May 5th?"),
+            [(datetime(2017, 6, 28, 5, 0, tzinfo=date.tzinfo),
+              "tomorrow at 5"),
+             (datetime(2017, 6, 30, tzinfo=date.tzinfo), "on Friday"),
+             (datetime(2018, 5, 5, tzinfo=date.tzinfo), "on May 5th")])
+        # units keep "from" and "and" in the mention
+        self.assertEqual(
+            extract("remind me 5 days from tomorrow in one hour and "
+                    "thirty minutes"),
+            [(datetime(2017, 7, 3, 14, 34, tzinfo=date.tzinfo),
+              "5 days from tomorrow in one hour and thirty minutes")])
+        # but not a new mention after a unit
+        self.assertEqual(
+            extract("remind me in 5 minutes and call me in 2 hours"),
+            [(datetime(2017, 6, 27, 13, 9, tzinfo=date.tzinfo),
+              "in 5 minutes"),
+             (datetime(2017, 6, 27, 15, 4, tzinfo=date.tzinfo),
+              "in 2 hours")])
+        self.assertEqual(
+            extract("in 5 minutes and in 2 hours"),
+            [(datetime(2017, 6, 27, 13, 9, tzinfo=date.tzinfo),
+              "in 5 minutes"),
+             (datetime(2017, 6, 27, 15, 4, tzinfo=date.tzinfo),
+              "in 2 hours")])
+        self.assertEqual(extract("what time is it now"), [(date, "now")])
+        self.assertEqual(extract("what is the weather"), [])
+        self.assertEqual(extract(""), [])
+        # segments which aren't a valid time on their own are skipped
+        self.assertEqual(extract("call me at 24 or tomorrow"),
+                         [(datetime(2017, 6, 28, tzinfo=date.tzinfo),
+                           "tomorrow")])
+        self.assertEqual(extract("the store is open 24 and 7"),
+                         [(datetime(2017, 6, 27, 19, 0, tzinfo=date.tzinfo),
+                           "7")])
+        # qualifiers the parse reads but leaves in the text are mentions too
+        tonight = datetime(2017, 6, 27, 22, 0, tzinfo=date.tzinfo)
+        self.assertEqual(extract("tonight"), [(tonight, "tonight")])
+        self.assertEqual(extract("lets meet tonight"), [(tonight, "tonight")])
+        self.assertEqual(extract("lets meet later at night"),
+                         [(tonight, "at night")])
+        self.assertEqual(extract("dinner tonight and lunch tomorrow"),
+                         [(tonight, "tonight"),
+                          (datetime(2017, 6, 28, tzinfo=date.tzinfo),
+                           "tomorrow")])
+        self.assertEqual(extract("tonight or tomorrow night"),
+                         [(tonight, "tonight"),
+                          (datetime(2017, 6, 28, 22, 0, tzinfo=date.tzinfo),
+                           "tomorrow night")])
+        # but not the words the parse consumes past the value
+        self.assertEqual(extract("5 o'clock meeting"),
+                         [(datetime(2017, 6, 27, 17, 0, tzinfo=date.tzinfo),
+                           "5 o'clock")])
+
+        # one mention is the same as extract_datetime
+        for text in ("what is the weather like the day after tomorrow",
+                     "set up an appointment 2 weeks from sunday at 5 pm",
+                     "wake me up at 7 in the morning"):
+            [(extracted, _)] = extract(text)
+            self.assertEqual(extracted, extract_datetime(text, date)[0])
+
+    def test_extract_datetime_lone_fraction_en(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        self.assertEqual(
+            extract_datetime("a quarter two pm thousand", anchor),
+            [datetime(2017, 6, 27, 14, 0, tzinfo=anchor.tzinfo),
+             "a quarter thousand"])
+        self.assertEqual(
+            extract_datetime("half 3rd in years evening century ten",
+                             anchor),
+            [datetime(2117, 6, 27, 15, 0, tzinfo=anchor.tzinfo),
+             "half ten"])
+
     def test_extract_ambiguous_month_en(self):
         dec = datetime(2017, 12, 27, 8, 1, 2)
         jun = datetime(2017, 6, 27, 20, 1, 2)
@@ -418,6 +418,13 @@ class TestColors(unittest.TestCase):
         self.assertEqual(utt[38:44], "branco")
         self.assertEqual(spans[1][0], Color.from_hex("#FFFFFF"))
 
+        utt = "pinta a parede de azul céu profundo e verde"
+        spans = extract_color_spans(utt)
+        self.assertEqual(len(spans), 2)
+        self.assertEqual(spans[0][1], (18, 35))
+        self.assertEqual(spans[0][0], Color.from_hex("#00bfff"))
+        self.assertEqual(spans[1][0], Color.from_hex("#008000"))
+
         # female gender
         utt = "a minha gata é preta e branca"
         spans = extract_color_spans(utt)